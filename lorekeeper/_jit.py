@@ -0,0 +1,23 @@
+"""Shared Numba settings for the scalar analytics kernels.
+
+Kernels decorated with ``@njit(**JIT_KW)`` compile when Numba is installed and
+run as plain Python otherwise; callers still gate on ``NUMBA_AVAILABLE`` so small
+inputs skip the array conversion entirely.
+"""
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# fastmath lets LLVM reassociate the float reductions into SIMD lanes, and
+# nogil lets kernels run in parallel from worker threads
+JIT_KW = dict(cache=True, fastmath=True, boundscheck=False, nogil=True)
+
+__all__ = ["JIT_KW", "NUMBA_AVAILABLE", "njit", "prange"]
@@ -4,6 +4,7 @@ from __future__ import annotations
 import argparse
 import json
 import sys
+from dataclasses import asdict
 from typing import Any, Dict
 
 from .autopilot_engine import AutopilotEngine
@@ -32,8 +33,8 @@ def _load_payload(args: argparse.Namespace) -> Dict[str, Any]:
 
     return {
         "timeline": [
-            TimelineEvent(date="2024-05-01", title="Deep work block", tags=["focus", "build"], metadata={"hour": 9}).__dict__,
-            TimelineEvent(date="2024-05-08", title="Skill practice", tags=["practice", "skill"], metadata={"hour": 9}).__dict__,
+            asdict(TimelineEvent(date="2024-05-01", title="Deep work block", tags=["focus", "build"], metadata={"hour": 9})),
+            asdict(TimelineEvent(date="2024-05-08", title="Skill practice", tags=["practice", "skill"], metadata={"hour": 9})),
         ],
         "tasks": [
             {"title": "Ship autopilot draft", "priority": 7, "due_date": "2024-05-02", "status": "incomplete", "category": "build"},
@@ -67,27 +68,27 @@ def run_cli(argv: list[str] | None = None) -> int:
 
     if args.command == "daily":
         output = engine.generate_daily_plan()
-        result = {"daily_plan": output.__dict__}
+        result = {"daily_plan": asdict(output)}
     elif args.command == "weekly":
         output = engine.generate_weekly_strategy()
-        result = {"weekly_strategy": output.__dict__}
+        result = {"weekly_strategy": asdict(output)}
     elif args.command == "monthly":
         output = engine.generate_monthly_course_correction()
-        result = {"monthly_correction": output.__dict__}
+        result = {"monthly_correction": asdict(output)}
     elif args.command == "transition":
         output = engine.generate_arc_transition_guidance()
-        result = {"arc_transition": output.__dict__}
+        result = {"arc_transition": asdict(output)}
     elif args.command == "alerts":
         result = {
             "alerts": {
-                "burnout": engine.detect_burnout_risk().__dict__,
-                "slump": engine.detect_slump_cycles().__dict__,
-                "focus_window": engine.detect_focus_windows().__dict__,
+                "burnout": asdict(engine.detect_burnout_risk()),
+                "slump": asdict(engine.detect_slump_cycles()),
+                "focus_window": asdict(engine.detect_focus_windows()),
             }
         }
     elif args.command == "momentum":
         output = engine.detect_skill_momentum()
-        result = {"momentum": output.__dict__}
+        result = {"momentum": asdict(output)}
     else:
         result = {}
 
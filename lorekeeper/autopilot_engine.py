@@ -1,11 +1,21 @@
 """AutopilotEngine — synthesizes guidance from insights, arcs, and tasks."""
 from __future__ import annotations
 
+import heapq
 import json
-from collections import Counter, defaultdict
-from dataclasses import asdict
+from bisect import bisect_left
+from collections import Counter
+from dataclasses import fields, is_dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, Iterable, List, Optional
+from functools import cached_property, lru_cache
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from .autopilot_types import (
     DailyRecommendation,
@@ -20,6 +30,41 @@ from .event_schema import TimelineEvent
 UTC = timezone.utc
 
 
+@lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO-8601 timestamp, accepting a trailing ``Z`` for UTC."""
+
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _field(item: Any, name: str) -> Any:
+    """Read ``name`` from a dict or an attribute-style record (dataclass, object)."""
+
+    if isinstance(item, dict):
+        return item.get(name)
+    return getattr(item, name, None)
+
+
+def _shallow_asdict(obj: Any) -> Dict[str, Any]:
+    """Field-level dict view of a dataclass, skipping ``asdict``'s deep copy."""
+
+    return {f.name: getattr(obj, f.name) for f in fields(obj)}
+
+
+def _json_default(value: Any) -> Any:
+    if is_dataclass(value) and not isinstance(value, type):
+        return _shallow_asdict(value)
+    return str(value)
+
+
+def _dumps(payload: Any) -> str:
+    """Serialize to JSON, using orjson's native dataclass support when installed."""
+
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(payload, default=_json_default)
+
+
 class AutopilotEngine:
     """AI-driven guidance orchestrator."""
 
@@ -37,55 +82,139 @@ class AutopilotEngine:
         self.tasks = list(tasks or [])
         self.identity = identity or {}
         self.arcs = arcs or {}
+        self._motifs = frozenset(self.identity.get("motifs", []) or [])
+        self._prioritized: Dict[int, List[Any]] = {}
+        # Rendered output by format; like the analyzers, valid for this instance's inputs
+        self._renders: Dict[str, str] = {}
+        self._today = datetime.now(UTC).date()
+
+    def refresh_clock(self) -> None:
+        """Re-read today's date and drop cached analyses that depend on it."""
+
+        self._today = datetime.now(UTC).date()
+        for name in ("_task_index", "risk_patterns"):
+            self.__dict__.pop(name, None)
+        self._renders.clear()
 
     # === Analysis Layer ===
+    # Inputs are treated as immutable per engine instance, so each analyzer is
+    # computed once and shared by every generate_*/detect_*/render_* caller.
     def analyze_cycles(self) -> Dict[str, Any]:
         """Detect weekly cadence patterns from timeline events."""
 
+        return self.cycles
+
+    def analyze_focus_patterns(self) -> Dict[str, Any]:
+        """Aggregate tags/categories across tasks and timeline."""
+
+        return self.focus_patterns
+
+    def analyze_identity_shift(self) -> Dict[str, Any]:
+        """Check for shifts in motifs or emotional slope."""
+
+        return self.identity_shift
+
+    def analyze_risk_patterns(self) -> Dict[str, Any]:
+        """Combine overdue work and sparse activity to surface risk."""
+
+        return self.risk_patterns
+
+    def analyze_goal_alignment(self) -> Dict[str, Any]:
+        """Compare focus areas against identity motifs."""
+
+        return self.goal_alignment
+
+    @cached_property
+    def _timeline_index(self) -> Dict[str, Any]:
+        """Walk the timeline once, parsing each event date a single time."""
+
         day_counts: Counter[str] = Counter()
+        week_counts: Counter[str] = Counter()
+        hour_counts: Counter[int] = Counter()
+        tag_counts: Counter[str] = Counter()
+        dated_events: List[Any] = []
         for event in self.timeline:
-            date_str = getattr(event, "date", None) or (event.get("date") if isinstance(event, dict) else None)
-            day_name = self._safe_day_name(date_str)
-            if day_name:
-                day_counts[day_name] += 1
+            tags = _field(event, "tags")
+            tag_counts.update(tags or [])
+
+            date_str = _field(event, "date")
+            date_obj = self._parse_date(date_str)
+            hour = self._metadata_hour(event)
+            if date_obj is not None:
+                day_counts[date_obj.strftime("%A")] += 1
+                start_of_week = date_obj - timedelta(days=date_obj.weekday())
+                week_counts[start_of_week.strftime("%Y-%m-%d")] += 1
+                if hour is None:
+                    hour = date_obj.hour
+                if date_obj.tzinfo is None:
+                    date_obj = date_obj.replace(tzinfo=UTC)
+                dated_events.append((date_obj, event))
+            if hour is not None:
+                hour_counts[hour] += 1
+
+        return {
+            "day_counts": day_counts,
+            "week_counts": week_counts,
+            "hour_counts": hour_counts,
+            "tag_counts": tag_counts,
+            "dated_events": dated_events,
+        }
+
+    @cached_property
+    def _timeline_sorted(self) -> Dict[str, List[Any]]:
+        """Dated events in chronological order with a parallel key list for bisect."""
 
-        peak_day, peak_count = (None, 0)
-        if day_counts:
-            peak_day, peak_count = max(day_counts.items(), key=lambda item: item[1])
+        ordered = sorted(self._timeline_index["dated_events"], key=itemgetter(0))
+        return {"dates": [event_date for event_date, _ in ordered], "events": [event for _, event in ordered]}
+
+    @cached_property
+    def _task_index(self) -> Dict[str, List[Any]]:
+        """Column-wise task fields, resolved once instead of per sort/overdue check."""
+
+        sort_keys: List[Any] = []
+        overdue: List[bool] = []
+        for task in self.tasks:
+            sort_keys.append(
+                (
+                    -int(_field(task, "priority") or 0),
+                    _field(task, "due_date") or "",
+                )
+            )
+            overdue.append(self._is_overdue(task))
+        return {"sort_keys": sort_keys, "overdue": overdue}
+
+    @cached_property
+    def cycles(self) -> Dict[str, Any]:
+        day_counts = self._timeline_index["day_counts"]
+
+        ((peak_day, peak_count),) = day_counts.most_common(1) or [(None, 0)]
 
         cadence_strength = min(1.0, peak_count / max(1, len(self.timeline))) if self.timeline else 0.0
         return {
             "peak_day": peak_day,
-            "day_counts": dict(day_counts),
+            "day_counts": day_counts,
             "cadence_strength": cadence_strength,
         }
 
-    def analyze_focus_patterns(self) -> Dict[str, Any]:
-        """Aggregate tags/categories across tasks and timeline."""
-
-        tag_counter: Counter[str] = Counter()
-        for event in self.timeline:
-            tags = getattr(event, "tags", None) or (event.get("tags") if isinstance(event, dict) else [])
-            tag_counter.update(tags or [])
-
+    @cached_property
+    def focus_patterns(self) -> Dict[str, Any]:
+        tag_counter: Counter[str] = Counter(self._timeline_index["tag_counts"])
         for task in self.tasks:
-            category = self._get_task_field(task, "category")
+            category = _field(task, "category")
             if category:
                 tag_counter[category] += 1
-            tags = self._get_task_field(task, "tags") or []
+            tags = _field(task, "tags") or []
             if isinstance(tags, list):
                 tag_counter.update(tags)
 
         focus_areas = [area for area, _ in tag_counter.most_common(3)]
         return {"focus_areas": focus_areas, "evidence": dict(tag_counter)}
 
-    def analyze_identity_shift(self) -> Dict[str, Any]:
-        """Check for shifts in motifs or emotional slope."""
-
+    @cached_property
+    def identity_shift(self) -> Dict[str, Any]:
         emotional_slope = float(self.identity.get("emotional_slope", 0.0) or 0.0)
-        motifs = set(self.identity.get("motifs", []) or [])
         previous_motifs = set(self.identity.get("previous_motifs", []) or [])
-        motif_delta = motifs.difference(previous_motifs)
+        motif_delta = self._motifs.difference(previous_motifs)
         shift_detected = abs(emotional_slope) >= 0.25 or bool(motif_delta)
 
         arc_phase = self.arcs.get("current_phase") or self.arcs.get("current")
@@ -98,10 +227,9 @@ class AutopilotEngine:
             "arc_transition": (arc_phase, prior_phase),
         }
 
-    def analyze_risk_patterns(self) -> Dict[str, Any]:
-        """Combine overdue work and sparse activity to surface risk."""
-
-        overdue = [t for t in self.tasks if self._is_overdue(t)]
+    @cached_property
+    def risk_patterns(self) -> Dict[str, Any]:
+        overdue = [task for task, late in zip(self.tasks, self._task_index["overdue"]) if late]
         recent_events = self._recent_events(days=7)
         workload = len(overdue)
         cadence = len(recent_events)
@@ -113,13 +241,12 @@ class AutopilotEngine:
             "burnout_level": burn_risk,
         }
 
-    def analyze_goal_alignment(self) -> Dict[str, Any]:
-        """Compare focus areas against identity motifs."""
-
-        motifs = set(self.identity.get("motifs", []) or [])
-        focus = set(self.analyze_focus_patterns().get("focus_areas", []))
-        alignment = len(focus & motifs) / max(1, len(focus or {"misc"}))
-        return {"alignment": alignment, "aligned_tags": sorted(focus & motifs)}
+    @cached_property
+    def goal_alignment(self) -> Dict[str, Any]:
+        focus = frozenset(self.focus_patterns.get("focus_areas", []))
+        aligned = focus & self._motifs
+        alignment = len(aligned) / max(1, len(focus or {"misc"}))
+        return {"alignment": alignment, "aligned_tags": sorted(aligned)}
 
     # === Recommendations Layer ===
     def generate_daily_plan(self) -> DailyRecommendation:
@@ -205,12 +332,7 @@ class AutopilotEngine:
         return RiskAlert(alert_type="burnout_risk", confidence=round(confidence, 2), evidence=evidence, risk_level=risk_level)
 
     def detect_slump_cycles(self) -> RiskAlert:
-        weekly_counts: Dict[str, int] = defaultdict(int)
-        for event in self.timeline:
-            date_str = getattr(event, "date", None) or (event.get("date") if isinstance(event, dict) else None)
-            week_bucket = self._safe_week_bucket(date_str)
-            if week_bucket:
-                weekly_counts[week_bucket] += 1
+        weekly_counts = self._timeline_index["week_counts"]
 
         low_weeks = [week for week, count in weekly_counts.items() if count <= 1]
         evidence = [f"Low-activity weeks: {len(low_weeks)}"]
@@ -219,11 +341,7 @@ class AutopilotEngine:
         return RiskAlert(alert_type="slump_cycle", confidence=round(confidence, 2), evidence=evidence, risk_level=risk_level)
 
     def detect_focus_windows(self) -> RiskAlert:
-        hours = Counter()
-        for event in self.timeline:
-            hour = self._extract_hour(event)
-            if hour is not None:
-                hours[hour] += 1
+        hours = self._timeline_index["hour_counts"]
 
         if not hours:
             return RiskAlert(alert_type="focus_window", confidence=0.3, evidence=["No timing metadata"], risk_level=1)
@@ -238,11 +356,11 @@ class AutopilotEngine:
         window = datetime.now(UTC) - timedelta(days=14)
         completions: Counter[str] = Counter()
         for task in self.tasks:
-            completed_at = self._get_task_field(task, "completed_at") or self._get_task_field(task, "completedAt")
-            category = self._get_task_field(task, "category") or "general"
+            completed_at = _field(task, "completed_at") or _field(task, "completedAt")
+            category = _field(task, "category") or "general"
             if completed_at:
                 try:
-                    completed_date = datetime.fromisoformat(completed_at.replace("Z", "+00:00"))
+                    completed_date = _parse_iso(completed_at)
                     if completed_date >= window:
                         completions[category] += 1
                 except ValueError:
@@ -259,6 +377,20 @@ class AutopilotEngine:
 
     # === Rendering ===
     def render_markdown(self) -> str:
+        return self._cached_render("markdown", self._build_markdown)
+
+    def render_json(self) -> str:
+        return self._cached_render("json", self._build_json)
+
+    def render_console(self) -> str:
+        return self._cached_render("console", self._build_console)
+
+    def _cached_render(self, kind: str, build: Callable[[], str]) -> str:
+        if kind not in self._renders:
+            self._renders[kind] = build()
+        return self._renders[kind]
+
+    def _build_markdown(self) -> str:
         plan = self.generate_daily_plan()
         weekly = self.generate_weekly_strategy()
         monthly = self.generate_monthly_course_correction()
@@ -287,22 +419,22 @@ class AutopilotEngine:
         ]
         return "\n".join(lines)
 
-    def render_json(self) -> str:
+    def _build_json(self) -> str:
         payload = {
-            "daily_plan": asdict(self.generate_daily_plan()),
-            "weekly_strategy": asdict(self.generate_weekly_strategy()),
-            "monthly_correction": asdict(self.generate_monthly_course_correction()),
-            "arc_transition": asdict(self.generate_arc_transition_guidance()),
+            "daily_plan": self.generate_daily_plan(),
+            "weekly_strategy": self.generate_weekly_strategy(),
+            "monthly_correction": self.generate_monthly_course_correction(),
+            "arc_transition": self.generate_arc_transition_guidance(),
             "alerts": {
-                "burnout": asdict(self.detect_burnout_risk()),
-                "slump": asdict(self.detect_slump_cycles()),
-                "focus_window": asdict(self.detect_focus_windows()),
+                "burnout": self.detect_burnout_risk(),
+                "slump": self.detect_slump_cycles(),
+                "focus_window": self.detect_focus_windows(),
             },
-            "momentum": asdict(self.detect_skill_momentum()),
+            "momentum": self.detect_skill_momentum(),
         }
-        return json.dumps(payload, default=str)
+        return _dumps(payload)
 
-    def render_console(self) -> str:
+    def _build_console(self) -> str:
         plan = self.generate_daily_plan()
         weekly = self.generate_weekly_strategy()
         monthly = self.generate_monthly_course_correction()
@@ -314,78 +446,39 @@ class AutopilotEngine:
         )
 
     # === Helpers ===
-    def _safe_day_name(self, date_str: Optional[str]) -> Optional[str]:
+    def _parse_date(self, date_str: Optional[str]) -> Optional[datetime]:
         if not date_str:
             return None
         try:
-            return datetime.fromisoformat(date_str).strftime("%A")
+            return _parse_iso(date_str)
         except ValueError:
-            try:
-                return datetime.fromisoformat(date_str.replace("Z", "+00:00")).strftime("%A")
-            except ValueError:
-                return None
-
-    def _safe_week_bucket(self, date_str: Optional[str]) -> Optional[str]:
-        if not date_str:
             return None
-        try:
-            date_obj = datetime.fromisoformat(date_str)
-        except ValueError:
-            try:
-                date_obj = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-            except ValueError:
-                return None
-        start_of_week = date_obj - timedelta(days=date_obj.weekday())
-        return start_of_week.strftime("%Y-%m-%d")
 
     def _recent_events(self, days: int) -> List[Any]:
-        now = datetime.now(UTC)
-        cutoff = now - timedelta(days=days)
-        recent: List[Any] = []
-        for event in self.timeline:
-            date_str = getattr(event, "date", None) or (event.get("date") if isinstance(event, dict) else None)
-            if not date_str:
-                continue
-            try:
-                event_date = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-                if event_date.tzinfo is None:
-                    event_date = event_date.replace(tzinfo=UTC)
-                if event_date >= cutoff:
-                    recent.append(event)
-            except ValueError:
-                continue
-        return recent
+        cutoff = datetime.now(UTC) - timedelta(days=days)
+        ordered = self._timeline_sorted
+        return ordered["events"][bisect_left(ordered["dates"], cutoff):]
 
     def _is_overdue(self, task: Any) -> bool:
-        due = self._get_task_field(task, "due_date") or self._get_task_field(task, "dueDate")
-        status = self._get_task_field(task, "status") or "incomplete"
+        due = _field(task, "due_date") or _field(task, "dueDate")
+        status = _field(task, "status") or "incomplete"
         if not due or status == "complete":
             return False
         try:
-            due_date = datetime.fromisoformat(str(due).replace("Z", "+00:00"))
-            return due_date.date() < datetime.now(UTC).date()
+            due_date = _parse_iso(str(due))
+            return due_date.date() < self._today
         except ValueError:
             return False
 
-    def _get_task_field(self, task: Any, field_name: str) -> Any:
-        if hasattr(task, field_name):
-            return getattr(task, field_name)
-        if isinstance(task, dict):
-            return task.get(field_name)
-        return None
-
     def _prioritize_tasks(self, limit: int = 3) -> List[Any]:
-        prioritized = sorted(
-            self.tasks,
-            key=lambda t: (
-                -int(self._get_task_field(t, "priority") or 0),
-                self._get_task_field(t, "due_date") or "",
-            ),
-        )
-        return prioritized[:limit]
-
-    def _extract_hour(self, event: Any) -> Optional[int]:
-        metadata = getattr(event, "metadata", None) or (event.get("metadata") if isinstance(event, dict) else {})
+        if limit not in self._prioritized:
+            sort_keys = self._task_index["sort_keys"]
+            order = heapq.nsmallest(limit, range(len(self.tasks)), key=sort_keys.__getitem__)
+            self._prioritized[limit] = [self.tasks[i] for i in order]
+        return self._prioritized[limit]
+
+    def _metadata_hour(self, event: Any) -> Optional[int]:
+        metadata = _field(event, "metadata")
         if isinstance(metadata, dict) and "hour" in metadata:
             try:
                 hour_val = int(metadata["hour"])
@@ -393,12 +486,6 @@ class AutopilotEngine:
                     return hour_val
             except (TypeError, ValueError):
                 pass
-        date_str = getattr(event, "date", None) or (event.get("date") if isinstance(event, dict) else None)
-        if date_str:
-            try:
-                return datetime.fromisoformat(date_str.replace("Z", "+00:00")).hour
-            except ValueError:
-                return None
         return None
 
     def _render_list(self, items: Iterable[Any]) -> str:
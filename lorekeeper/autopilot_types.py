@@ -3,7 +3,7 @@ from dataclasses import dataclass, field
 from typing import List, Any
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DailyRecommendation:
     """Actionable daily recommendation payload."""
 
@@ -14,7 +14,7 @@ class DailyRecommendation:
     urgency: str = "normal"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WeeklyStrategy:
     """Weekly focus strategy."""
 
@@ -24,7 +24,7 @@ class WeeklyStrategy:
     focus_areas: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MonthlyCorrection:
     """Monthly course correction guidance."""
 
@@ -34,7 +34,7 @@ class MonthlyCorrection:
     adjustments: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TransitionGuidance:
     """Arc transition notes when identity shifts occur."""
 
@@ -44,7 +44,7 @@ class TransitionGuidance:
     recommended_behavior: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RiskAlert:
     """Risk alert for burnout or slump cycles."""
 
@@ -54,7 +54,7 @@ class RiskAlert:
     risk_level: int = 1  # 1–5
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MomentumSignal:
     """Positive signal that momentum is building in a skill area."""
 
@@ -1,8 +1,15 @@
 """Analytics entry point for chronology engine."""
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from .clustering import cluster_events
 from .causality import detect_causality
 from .sequences import sequence_alignment
@@ -24,18 +31,17 @@ def analyze(events: List[Dict[str, Any]]) -> Dict[str, Any]:
                 "patterns": [],
             }
 
-        # Run all analytics modules
-        clusters = cluster_events(events)
-        causality = detect_causality(events)
-        alignment = sequence_alignment(events)
-        patterns = pattern_detection(events)
-
-        return {
-            "clusters": clusters,
-            "causality": causality,
-            "alignment": alignment,
-            "patterns": patterns,
-        }
+        # Run the independent analytics modules concurrently; HDBSCAN and
+        # NumPy release the GIL, so threads are enough
+        analyses = (
+            ("clusters", cluster_events),
+            ("causality", detect_causality),
+            ("alignment", sequence_alignment),
+            ("patterns", pattern_detection),
+        )
+        with ThreadPoolExecutor(max_workers=len(analyses)) as executor:
+            futures = {name: executor.submit(fn, events) for name, fn in analyses}
+            return {name: future.result() for name, future in futures.items()}
     except Exception as e:
         # Return empty results on failure
         return {
@@ -55,7 +61,10 @@ def handle(**kwargs) -> Dict[str, Any]:
 
 if __name__ == "__main__":
     # Read from stdin if called directly
-    payload = json.loads(sys.stdin.read() or "{}")
+    if ORJSON_AVAILABLE:
+        payload = orjson.loads(sys.stdin.buffer.read() or b"{}")
+    else:
+        payload = json.loads(sys.stdin.read() or "{}")
     events = payload.get("events", [])
     result = analyze(events)
     print(json.dumps(result, default=str))
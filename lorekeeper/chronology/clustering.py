@@ -17,26 +17,38 @@ def cluster_events(events: List[Dict[str, Any]]) -> Dict[str, Any]:
         return {"labels": []}
 
     try:
-        # Extract embeddings
-        embeddings = []
-        valid_indices = []
-        
-        for i, event in enumerate(events):
-            embedding = event.get("embedding")
-            if embedding and isinstance(embedding, list) and len(embedding) > 0:
-                embeddings.append(embedding)
-                valid_indices.append(i)
-
-        if len(embeddings) < 3:
+        # Locate usable embeddings first so the matrix is allocated once
+        valid_indices = [
+            i
+            for i, event in enumerate(events)
+            if isinstance(event.get("embedding"), list) and len(event["embedding"]) > 0
+        ]
+
+        if len(valid_indices) < 3:
             # Not enough events for clustering
             return {"labels": [-1] * len(events)}
 
-        # Convert to numpy array
-        X = np.array(embeddings)
+        # Fill a contiguous float32 matrix row by row (halves memory vs float64)
+        X = np.empty((len(valid_indices), len(events[valid_indices[0]]["embedding"])), dtype=np.float32)
+        for row, idx in enumerate(valid_indices):
+            X[row] = events[idx]["embedding"]
+
+        if np.unique(X, axis=0).shape[0] < 3:
+            # Identical/degenerate embeddings cannot form a cluster
+            return {"labels": [-1] * len(events)}
 
-        # Run HDBSCAN
-        clusterer = hdbscan.HDBSCAN(min_cluster_size=3, min_samples=2)
-        labels = clusterer.fit_predict(X)
+        # Run HDBSCAN; unit-norm embeddings get a BLAS-computed cosine distance matrix
+        norms = np.linalg.norm(X, axis=1)
+        if np.allclose(norms, 1.0, atol=1e-3):
+            D = 1.0 - (X @ X.T)
+            np.clip(D, 0.0, 2.0, out=D)
+            np.fill_diagonal(D, 0.0)
+            clusterer = hdbscan.HDBSCAN(min_cluster_size=3, min_samples=2, metric="precomputed")
+            labels = clusterer.fit_predict(D.astype(np.float64))
+        else:
+            clusterer = hdbscan.HDBSCAN(min_cluster_size=3, min_samples=2, core_dist_n_jobs=-1)
+            labels = clusterer.fit_predict(X)
+        noise_count = int(np.sum(labels == -1))
 
         # Map labels back to original event indices
         full_labels = [-1] * len(events)
@@ -46,8 +58,8 @@ def cluster_events(events: List[Dict[str, Any]]) -> Dict[str, Any]:
         return {
             "labels": full_labels,
             "metadata": {
-                "cluster_count": len(set(labels)) - (1 if -1 in labels else 0),
-                "noise_count": int(np.sum(labels == -1)),
+                "cluster_count": len(set(labels)) - (1 if noise_count else 0),
+                "noise_count": noise_count,
             },
         }
     except Exception as e:
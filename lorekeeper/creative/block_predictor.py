@@ -5,6 +5,21 @@ Predicts likelihood of creative blocks
 
 from typing import List, Dict, Any
 from collections import defaultdict
+from datetime import datetime, timezone
+
+
+def _event_times(events: List[Dict[str, Any]]) -> List[datetime]:
+    """Parsed event timestamps as naive UTC; missing or unparseable ones are skipped"""
+    times = []
+    for event in events:
+        try:
+            parsed = datetime.fromisoformat(str(event.get('timestamp', '')).replace('Z', '+00:00'))
+        except ValueError:
+            continue
+        if parsed.tzinfo is not None:
+            parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+        times.append(parsed)
+    return times
 
 
 def predict_blocks(events: List[Dict[str, Any]], blocks: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -28,13 +43,14 @@ def predict_blocks(events: List[Dict[str, Any]], blocks: List[Dict[str, Any]]) -
     risk_factors = []
     risk_score = 0.0
     
-    # Check for decreasing activity
-    if len(events) >= 4:
-        sorted_events = sorted(events, key=lambda e: e.get('timestamp', ''))
-        first_half = sorted_events[:len(sorted_events)//2]
-        second_half = sorted_events[len(sorted_events)//2:]
+    # Check for decreasing activity: fewer events after the midpoint of the time span than before it
+    times = _event_times(events)
+    if len(times) >= 4:
+        midpoint = min(times) + (max(times) - min(times)) / 2
+        first_half = sum(1 for t in times if t <= midpoint)
+        second_half = len(times) - first_half
         
-        if len(second_half) < len(first_half) * 0.5:
+        if second_half < first_half * 0.5:
             risk_score += 0.3
             risk_factors.append("decreasing_activity")
     
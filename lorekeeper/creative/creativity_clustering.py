@@ -4,7 +4,7 @@ Clusters creative events by medium, action, and patterns
 """
 
 from typing import List, Dict, Any
-from collections import defaultdict
+from collections import Counter
 
 
 def cluster_creative_events(events: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -19,22 +19,19 @@ def cluster_creative_events(events: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     clusters = []
     
-    # Group by medium
-    medium_groups = defaultdict(list)
+    # Group by medium and action in one pass, keeping first-seen order
+    medium_counts = Counter()
+    medium_groups = {}
     for event in events:
         medium = event.get('medium', 'unknown')
-        medium_groups[medium].append(event)
+        action = event.get('action', 'worked_on')
+        medium_counts[medium] += 1
+        medium_groups.setdefault(medium, {}).setdefault(action, []).append(event)
     
     # Create clusters from medium groups
     cluster_id = 0
-    for medium, medium_events in medium_groups.items():
-        if len(medium_events) >= 2:
-            # Group by action
-            action_groups = defaultdict(list)
-            for event in medium_events:
-                action = event.get('action', 'worked_on')
-                action_groups[action].append(event)
-            
+    for medium, action_groups in medium_groups.items():
+        if medium_counts[medium] >= 2:
             for action, action_events in action_groups.items():
                 clusters.append({
                     "id": f"cluster_{cluster_id}",
@@ -3,8 +3,28 @@ Creative Cycle Regression
 Predicts creative cycles using regression analysis
 """
 
-from typing import List, Dict, Any
+from operator import itemgetter
+from typing import List, Dict, Any, Tuple
 import statistics
+import numpy as np
+
+from .._jit import JIT_KW, NUMBA_AVAILABLE, njit
+
+# Below this many buckets the JIT dispatch costs more than the pure-Python scan
+JIT_MIN_SIZE = 32
+
+
+@njit(**JIT_KW)
+def _cycle_stats_kernel(counts):
+    return counts.mean(), counts.max(), counts.min()
+
+
+def _cycle_stats(week_counts: List[int]) -> Tuple[float, int, int]:
+    """Return (mean, max, min) of the weekly counts."""
+    if NUMBA_AVAILABLE and len(week_counts) >= JIT_MIN_SIZE:
+        avg_count, max_count, min_count = _cycle_stats_kernel(np.asarray(week_counts, dtype=np.int64))
+        return float(avg_count), int(max_count), int(min_count)
+    return statistics.mean(week_counts), max(week_counts), min(week_counts)
 
 
 def predict_cycle(events: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -24,8 +44,11 @@ def predict_cycle(events: List[Dict[str, Any]]) -> Dict[str, Any]:
             "confidence": 0
         }
     
-    # Sort by timestamp
-    sorted_events = sorted(events, key=lambda e: e.get('timestamp', ''))
+    # Sort by timestamp (C-level itemgetter key when every event has one)
+    if all('timestamp' in e for e in events):
+        sorted_events = sorted(events, key=itemgetter('timestamp'))
+    else:
+        sorted_events = sorted(events, key=lambda e: e.get('timestamp', ''))
     
     # Group by week
     weeks = {}
@@ -52,9 +75,7 @@ def predict_cycle(events: List[Dict[str, Any]]) -> Dict[str, Any]:
     week_counts = [len(events) for events in weeks.values()]
     
     # Simple cycle detection: find periodicity
-    avg_count = statistics.mean(week_counts)
-    max_count = max(week_counts)
-    min_count = min(week_counts)
+    avg_count, max_count, min_count = _cycle_stats(week_counts)
     
     # Detect if there's a pattern
     if max_count > avg_count * 1.5 and min_count < avg_count * 0.5:
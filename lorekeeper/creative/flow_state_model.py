@@ -3,8 +3,34 @@ Flow State Modeling
 Models flow states and predicts flow likelihood
 """
 
-from typing import List, Dict, Any
-import statistics
+from typing import List, Dict, Any, Tuple
+import numpy as np
+
+from .._jit import JIT_KW, NUMBA_AVAILABLE, njit
+
+# Below this many states the JIT dispatch costs more than NumPy's two passes
+JIT_MIN_SIZE = 32
+
+
+@njit(**JIT_KW)
+def _mean_var_kernel(y):
+    # Welford's online update: mean and sample variance in one stable pass
+    mean = 0.0
+    m2 = 0.0
+    for i in range(y.shape[0]):
+        delta = y[i] - mean
+        mean += delta / (i + 1)
+        m2 += delta * (y[i] - mean)
+    variance = m2 / (y.shape[0] - 1) if y.shape[0] > 1 else 0.0
+    return mean, variance
+
+
+def _mean_var(levels: np.ndarray) -> Tuple[float, float]:
+    """Return (mean, sample variance) of the flow levels."""
+    if NUMBA_AVAILABLE and len(levels) >= JIT_MIN_SIZE:
+        mean, variance = _mean_var_kernel(levels)
+        return float(mean), float(variance)
+    return float(levels.mean()), float(levels.var(ddof=1)) if len(levels) > 1 else 0
 
 
 def model_flow_states(flow_states: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -24,13 +50,13 @@ def model_flow_states(flow_states: List[Dict[str, Any]]) -> Dict[str, Any]:
             "confidence": 0
         }
     
-    levels = [f.get('level', 0.5) for f in flow_states]
-    avg_level = statistics.mean(levels)
+    levels = np.fromiter((f.get('level', 0.5) for f in flow_states), dtype=np.float64, count=len(flow_states))
+    avg_level, variance = _mean_var(levels)
     
     # Calculate trend
     if len(levels) >= 3:
-        recent_avg = statistics.mean(levels[-3:])
-        earlier_avg = statistics.mean(levels[:3])
+        recent_avg = levels[-3:].mean()
+        earlier_avg = levels[:3].mean()
         
         if recent_avg > earlier_avg * 1.1:
             trend = "improving"
@@ -41,8 +67,7 @@ def model_flow_states(flow_states: List[Dict[str, Any]]) -> Dict[str, Any]:
     else:
         trend = "stable"
     
-    # Calculate variance (lower = more consistent flow)
-    variance = statistics.variance(levels) if len(levels) > 1 else 0
+    # Variance from above (lower = more consistent flow)
     consistency = max(0, 1 - variance)
     
     return {
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import json
+from dataclasses import asdict
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
 
@@ -169,7 +170,7 @@ class DailyBriefingEngine:
 
     def _serialize(self, obj: Any) -> Any:
         if isinstance(obj, TimelineEvent):
-            return obj.__dict__
+            return asdict(obj)
         return str(obj)
 
 
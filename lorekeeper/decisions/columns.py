@@ -0,0 +1,54 @@
+"""
+Decision Columns
+Column-wise (SoA) view of decision records for vectorized scoring
+"""
+
+from dataclasses import dataclass
+from typing import List, Dict, Any
+import numpy as np
+
+
+@dataclass
+class DecisionColumns:
+    """Parallel arrays over a decision list, one entry per decision"""
+    ids: List[Any]
+    descriptions: List[str]
+    categories: np.ndarray
+    outcomes: np.ndarray
+    risk_levels: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+def decision_columns(decisions: List[Dict[str, Any]]) -> DecisionColumns:
+    """
+    Convert decision dicts into parallel arrays in a single pass
+    
+    Args:
+        decisions: List of decisions with id, description, category, outcome, risk_level
+        
+    Returns:
+        DecisionColumns with object arrays for categories/outcomes and float64 risk levels
+    """
+    n = len(decisions)
+    ids = [None] * n
+    descriptions = [''] * n
+    categories = np.empty(n, dtype=object)
+    outcomes = np.empty(n, dtype=object)
+    risk_levels = np.empty(n, dtype=np.float64)
+    
+    for i, decision in enumerate(decisions):
+        ids[i] = decision.get('id')
+        descriptions[i] = decision.get('description', '')
+        categories[i] = decision.get('category', 'other')
+        outcomes[i] = decision.get('outcome')
+        risk_levels[i] = decision.get('risk_level', 0.5)
+    
+    return DecisionColumns(
+        ids=ids,
+        descriptions=descriptions,
+        categories=categories,
+        outcomes=outcomes,
+        risk_levels=risk_levels,
+    )
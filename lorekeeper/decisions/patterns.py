@@ -3,7 +3,7 @@ Decision Pattern Detection
 """
 
 from typing import List, Dict, Any
-from collections import defaultdict
+import numpy as np
 
 
 def detect_patterns(decisions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -14,19 +14,28 @@ def detect_patterns(decisions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
     patterns = []
     
-    # Group by category and outcome
-    category_outcome_map = defaultdict(lambda: defaultdict(int))
+    # Factorize (category, outcome) pairs in first-seen order and count them in one pass
+    pair_codes: Dict[Any, int] = {}
+    category_pairs: Dict[Any, List[Any]] = {}
+    inverse = np.empty(len(decisions), dtype=np.intp)
     
-    for decision in decisions:
+    for i, decision in enumerate(decisions):
         category = decision.get('category', 'other')
         outcome = decision.get('outcome', 'unknown')
-        category_outcome_map[category][outcome] += 1
+        code = pair_codes.get((category, outcome))
+        if code is None:
+            code = pair_codes[(category, outcome)] = len(pair_codes)
+            category_pairs.setdefault(category, []).append((outcome, code))
+        inverse[i] = code
+    
+    pair_counts = np.bincount(inverse, minlength=len(pair_codes))
     
     # Detect patterns
-    for category, outcomes in category_outcome_map.items():
-        total = sum(outcomes.values())
+    for category, pairs in category_pairs.items():
+        outcome_counts = [(outcome, int(pair_counts[code])) for outcome, code in pairs]
+        total = sum(count for _, count in outcome_counts)
         if total >= 3:
-            dominant_outcome = max(outcomes.items(), key=lambda x: x[1])
+            dominant_outcome = max(outcome_counts, key=lambda x: x[1])
             percentage = (dominant_outcome[1] / total) * 100
             
             if percentage >= 70:
@@ -4,6 +4,37 @@ Decision Consequence Prediction
 
 from typing import List, Dict, Any
 from datetime import datetime
+import numpy as np
+
+from .columns import decision_columns
+
+HIGH_IMPACT_CATEGORIES = frozenset(['financial', 'career', 'relationship'])
+
+
+def _prediction_variants(base_prediction: str) -> tuple:
+    """(neutral, high risk, low risk) wordings of a category prediction"""
+    return (
+        base_prediction,
+        f'High risk: {base_prediction}. Potential negative consequences.',
+        f'Low risk: {base_prediction}. Likely positive outcomes.',
+    )
+
+
+# Category-based predictions, pre-rendered per risk bucket
+CATEGORY_PREDICTIONS = {
+    category: _prediction_variants(base_prediction)
+    for category, base_prediction in {
+        'career': 'May impact professional growth and opportunities',
+        'financial': 'Could affect financial stability and resources',
+        'relationship': 'May influence relationship dynamics and connections',
+        'health': 'Could impact physical or mental well-being',
+        'education': 'May affect learning and skill development',
+        'location': 'Could change daily routine and environment',
+        'family': 'May influence family relationships and dynamics',
+        'social': 'Could affect social connections and activities',
+    }.items()
+}
+DEFAULT_PREDICTION = _prediction_variants('Mixed outcomes possible')
 
 
 def predict(decisions: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -17,36 +48,37 @@ def predict(decisions: List[Dict[str, Any]]) -> Dict[str, Any]:
         Dictionary with consequences list
     """
     consequences = []
+    timestamp = datetime.now().isoformat()
+    columns = decision_columns(decisions)
     
-    for decision in decisions:
-        description = decision.get('description', '')
-        category = decision.get('category', 'other')
-        outcome = decision.get('outcome')
-        risk_level = decision.get('risk_level', 0.5)
+    # Calculate confidence based on available data, as mask adds over the batch
+    confidence = np.full(len(columns), 0.5)
+    confidence += np.where(columns.outcomes.astype(bool), 0.2, 0.0)  # Historical outcome increases confidence
+    confidence += np.where((columns.risk_levels >= 0.7) | (columns.risk_levels <= 0.3), 0.1, 0.0)  # Clear risk level increases confidence
+    confidence += np.fromiter(
+        (category in HIGH_IMPACT_CATEGORIES for category in columns.categories),
+        dtype=bool,
+        count=len(columns),
+    ) * 0.1  # High-impact categories have more predictable patterns
+    
+    for i, decision_id in enumerate(columns.ids):
+        description = columns.descriptions[i]
         
         # Predict based on category, risk level, and historical outcome
-        predicted = predict_consequence(description, category, outcome, risk_level)
+        predicted = predict_consequence(description, columns.categories[i], columns.outcomes[i], columns.risk_levels[i])
         
         if predicted:
-            # Calculate confidence based on available data
-            confidence = 0.5
-            if outcome:
-                confidence += 0.2  # Historical outcome increases confidence
-            if risk_level >= 0.7 or risk_level <= 0.3:
-                confidence += 0.1  # Clear risk level increases confidence
-            if category in ['financial', 'career', 'relationship']:
-                confidence += 0.1  # High-impact categories have more predictable patterns
-            
+            score = float(confidence[i])
             consequences.append({
-                "id": f"cons_{decision.get('id')}",
+                "id": f"cons_{decision_id}",
                 "type": "consequence_prediction",
                 "message": f'Predicted outcomes for "{description[:50]}...": {predicted}',
-                "confidence": min(0.9, confidence),
-                "timestamp": datetime.now().isoformat(),
-                "decisionId": decision.get('id'),
-                "decision_id": decision.get('id'),
+                "confidence": min(0.9, score),
+                "timestamp": timestamp,
+                "decisionId": decision_id,
+                "decision_id": decision_id,
                 "predicted_consequence": predicted,
-                "prediction_score": confidence,
+                "prediction_score": score,
             })
     
     return {"consequences": consequences}
@@ -56,35 +88,15 @@ def predict_consequence(description: str, category: str, outcome: str = None, ri
     """
     Predict consequence based on decision characteristics
     """
-    desc_lower = description.lower()
-    
     # If we have historical outcome, use it as primary indicator
     if outcome == 'positive':
         return 'Likely positive outcomes based on similar past decisions'
     if outcome == 'negative':
         return 'Potential negative consequences based on similar past decisions'
     
-    # Category-based predictions
-    category_predictions = {
-        'career': 'May impact professional growth and opportunities',
-        'financial': 'Could affect financial stability and resources',
-        'relationship': 'May influence relationship dynamics and connections',
-        'health': 'Could impact physical or mental well-being',
-        'education': 'May affect learning and skill development',
-        'location': 'Could change daily routine and environment',
-        'family': 'May influence family relationships and dynamics',
-        'social': 'Could affect social connections and activities',
-    }
-    
-    base_prediction = category_predictions.get(category, 'Mixed outcomes possible')
-    
-    # Adjust based on risk level
-    if risk_level >= 0.7:
-        return f'High risk: {base_prediction}. Potential negative consequences.'
-    if risk_level <= 0.3:
-        return f'Low risk: {base_prediction}. Likely positive outcomes.'
-    
-    return base_prediction
+    # Adjust based on risk level: 1 = high risk, 2 = low risk, 0 = neutral
+    bucket = 1 if risk_level >= 0.7 else 2 if risk_level <= 0.3 else 0
+    return CATEGORY_PREDICTIONS.get(category, DEFAULT_PREDICTION)[bucket]
 
 
 def handle(**kwargs) -> Dict[str, Any]:
@@ -3,6 +3,20 @@ Decision Risk Analysis
 """
 
 from typing import List, Dict, Any
+import numpy as np
+
+from .columns import decision_columns
+
+CATEGORY_RISKS = {
+    'financial': 0.2,
+    'career': 0.15,
+    'relationship': 0.15,
+    'health': 0.1,
+    'location': 0.1,
+    'family': 0.1,
+    'education': 0.05,
+    'social': 0.0,
+}
 
 
 def analyze_risk(decisions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -11,40 +25,27 @@ def analyze_risk(decisions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     
     TODO: Implement ML-based risk analysis
     """
-    risk_analyses = []
+    columns = decision_columns(decisions)
     
-    for decision in decisions:
-        # Basic risk calculation
-        risk = 0.5  # Base risk
-        
-        # Factor in outcome
-        outcome = decision.get('outcome')
-        if outcome == 'negative':
-            risk += 0.3
-        elif outcome == 'positive':
-            risk -= 0.2
-        
-        # Factor in category
-        category = decision.get('category', 'other')
-        category_risks = {
-            'financial': 0.2,
-            'career': 0.15,
-            'relationship': 0.15,
-            'health': 0.1,
-            'location': 0.1,
-            'family': 0.1,
-            'education': 0.05,
-            'social': 0.0,
-        }
-        risk += category_risks.get(category, 0.0)
-        
-        # Clamp between 0 and 1
-        risk = max(0.0, min(1.0, risk))
-        
-        risk_analyses.append({
-            'decision_id': decision.get('id'),
-            'risk_level': risk,
-        })
+    # Outcome and category lookups as flat arrays
+    negative = columns.outcomes == 'negative'
+    positive = columns.outcomes == 'positive'
+    category_risk = np.fromiter(
+        (CATEGORY_RISKS.get(category, 0.0) for category in columns.categories),
+        dtype=np.float64,
+        count=len(columns),
+    )
     
-    return risk_analyses
-
+    # Base risk, outcome adjustment and category factor in one branch-free expression
+    risk = 0.5 + 0.3 * negative - 0.2 * positive + category_risk
+    
+    # Clamp between 0 and 1
+    np.clip(risk, 0.0, 1.0, out=risk)
+    
+    return [
+        {
+            'decision_id': decision_id,
+            'risk_level': float(level),
+        }
+        for decision_id, level in zip(columns.ids, risk)
+    ]
@@ -5,13 +5,39 @@ Decision Similarity Analysis
 from typing import List, Dict, Any
 from datetime import datetime
 from difflib import SequenceMatcher
+import heapq
+import numpy as np
+
+try:
+    from rapidfuzz import fuzz, process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
 
 
 def similarity_score(str1: str, str2: str) -> float:
     """Calculate similarity between two strings"""
+    if RAPIDFUZZ_AVAILABLE:
+        return fuzz.ratio(str1.lower(), str2.lower()) / 100.0
     return SequenceMatcher(None, str1.lower(), str2.lower()).ratio()
 
 
+# Rows of the similarity matrix computed per RapidFuzz call; bounds memory to
+# _ROW_BLOCK x N scores instead of a dense N x N matrix.
+_ROW_BLOCK = 256
+
+
+def _similarity_rows(lowered: List[str], start: int):
+    """
+    (Lowercased) description similarity (0-100) of rows start..start+_ROW_BLOCK
+    against decisions start..N in one native RapidFuzz call; entry [r, c] is the
+    score of pair (start + r, start + c).
+    Scores under 20 are zeroed: even with the category boost they stay below 0.4.
+    """
+    block = lowered[start:start + _ROW_BLOCK]
+    return process.cdist(block, lowered[start:], scorer=fuzz.ratio, score_cutoff=20, dtype=np.float64, workers=-1)
+
+
 def analyze(decisions: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     Analyze similarity between decisions
@@ -23,27 +49,48 @@ def analyze(decisions: List[Dict[str, Any]]) -> Dict[str, Any]:
         Dictionary with matches list
     """
     matches = []
+    timestamp = datetime.now().isoformat()
+    
+    # Per-decision columns, extracted once instead of per pair
+    n = len(decisions)
+    ids = [d.get('id') for d in decisions]
+    descriptions = [d.get('description', '') for d in decisions]
+    lowered = [(desc or '').lower() for desc in descriptions]
+    lengths = [len(desc) for desc in lowered]
+    categories = [d.get('category') for d in decisions]
+    use_rapidfuzz = RAPIDFUZZ_AVAILABLE and n >= 2
+    score_rows = None
+    block_start = 0
     
-    # Compare each decision with others
+    # Compare each decision with the ones after it (avoids duplicate comparisons)
     for i, decision1 in enumerate(decisions):
+        if use_rapidfuzz and i % _ROW_BLOCK == 0:
+            block_start = i
+            score_rows = _similarity_rows(lowered, i)
         similar_decisions = []
+        desc1 = descriptions[i]
+        if not desc1:
+            continue
         
-        for j, decision2 in enumerate(decisions):
-            if i >= j:  # Avoid duplicate comparisons
-                continue
-            
-            # Calculate similarity
-            desc1 = decision1.get('description', '')
-            desc2 = decision2.get('description', '')
-            
-            if not desc1 or not desc2:
+        for j in range(i + 1, n):
+            if not descriptions[j]:
                 continue
             
             # Check category match
-            category_match = decision1.get('category') == decision2.get('category')
+            category_match = bool(categories[i] == categories[j])
             
             # Calculate description similarity
-            desc_similarity = similarity_score(desc1, desc2)
+            if lowered[i] == lowered[j]:
+                desc_similarity = 1.0
+            elif score_rows is not None:
+                desc_similarity = float(score_rows[i - block_start, j - block_start]) / 100.0
+            else:
+                # The ratio is at most 2*min(len)/(len1+len2); skip pairs that cannot
+                # reach 0.4 (0.2 with the category boost) before running the matcher
+                needed_fifths = 1 if category_match else 2
+                if 10 * min(lengths[i], lengths[j]) < needed_fifths * (lengths[i] + lengths[j]):
+                    continue
+                desc_similarity = SequenceMatcher(None, lowered[i], lowered[j]).ratio()
             
             # Combined similarity score
             similarity = desc_similarity
@@ -53,26 +100,23 @@ def analyze(decisions: List[Dict[str, Any]]) -> Dict[str, Any]:
             # If similarity is significant
             if similarity >= 0.4:
                 similar_decisions.append({
-                    'decision_id': decision2.get('id'),
+                    'decision_id': ids[j],
                     'similarity_score': similarity,
                 })
         
         # Create match insights for decisions with similar ones
         if similar_decisions:
-            # Sort by similarity
-            similar_decisions.sort(key=lambda x: x['similarity_score'], reverse=True)
-            
             # Take top 3 most similar
-            top_similar = similar_decisions[:3]
+            top_similar = heapq.nlargest(3, similar_decisions, key=lambda x: x['similarity_score'])
             
             matches.append({
                 "id": f"sim_{decision1['id']}",
                 "type": "similar_decision",
                 "message": f'Found {len(similar_decisions)} similar decision(s) for "{desc1[:50]}..."',
                 "confidence": min(0.9, 0.5 + (top_similar[0]['similarity_score'] * 0.4)),
-                "timestamp": datetime.now().isoformat(),
-                "decisionId": decision1.get('id'),
-                "decision_id": decision1.get('id'),
+                "timestamp": timestamp,
+                "decisionId": ids[i],
+                "decision_id": ids[i],
                 "similar_decision_id": top_similar[0]['decision_id'],
                 "similarity_score": top_similar[0]['similarity_score'],
             })
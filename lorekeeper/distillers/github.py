@@ -3,10 +3,18 @@ from __future__ import annotations
 
 from dataclasses import asdict, dataclass
 from datetime import datetime
-from typing import List, Sequence
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Tuple
 
+HIGH_IMPACT_TYPES = frozenset({"release", "deployment"})
 
-@dataclass
+
+@lru_cache(maxsize=64)
+def _tags_for(event_type: str) -> Tuple[str, ...]:
+    return tuple(sorted({"github", event_type.lower()}))
+
+
+@dataclass(slots=True)
 class GithubMilestone:
     title: str
     summary: str
@@ -15,21 +23,32 @@ class GithubMilestone:
     impact: str
     tags: List[str]
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "title": self.title,
+            "summary": self.summary,
+            "timestamp": self.timestamp,
+            "repo": self.repo,
+            "impact": self.impact,
+            "tags": list(self.tags),
+        }
+
 
 class GithubDistiller:
     def distill(self, raw_events: Sequence[dict]) -> List[GithubMilestone]:
-        milestones: List[GithubMilestone] = []
+        return list(self.iter_distill(raw_events))
+
+    def iter_distill(self, raw_events: Iterable[dict]) -> Iterator[GithubMilestone]:
         for event in raw_events:
-            milestones.append(self._distill_event(event))
-        return milestones
+            yield self._distill_event(event)
 
     def _distill_event(self, event: dict) -> GithubMilestone:
         repo = self._resolve_repo(event)
         title = event.get("title") or event.get("event") or "GitHub event"
         summary = self._build_summary(event, repo)
         timestamp = event.get("created_at") or event.get("timestamp") or datetime.utcnow().isoformat()
-        impact = "high" if event.get("type") in {"release", "deployment"} else "medium"
-        tags = sorted({"github", event.get("type", "event").lower()})
+        impact = "high" if event.get("type") in HIGH_IMPACT_TYPES else "medium"
+        tags = list(_tags_for(event.get("type", "event")))
 
         return GithubMilestone(
             title=title,
@@ -2,24 +2,28 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import List, Sequence
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Sequence, Tuple
+
+
+@lru_cache(maxsize=16)
+def _tags_for_media_type(media_type: str) -> Tuple[str, ...]:
+    return tuple(sorted({"social", "instagram", media_type.lower()}))
 
 
 class InstagramDistiller:
     def distill(self, raw_media: Sequence[dict]) -> List[dict]:
-        distilled: List[dict] = []
+        return list(self.iter_distill(raw_media))
+
+    def iter_distill(self, raw_media: Iterable[dict]) -> Iterator[dict]:
         for media in raw_media:
-            distilled.append(self._distill_media(media))
-        return distilled
+            yield self._distill_media(media)
 
     def _distill_media(self, media: dict) -> dict:
         caption = media.get("caption") or "Instagram memory"
         timestamp = media.get("timestamp") or datetime.utcnow().isoformat()
-        tags = {"social", "instagram"}
         media_type = media.get("media_type") or "post"
         location = media.get("location") or media.get("place")
-        if media_type:
-            tags.add(media_type.lower())
 
         summary = f"{caption} ({media_type})"
         return {
@@ -27,7 +31,7 @@ class InstagramDistiller:
             "timestamp": timestamp,
             "characters": media.get("tagged_users") or media.get("people") or [],
             "location": location,
-            "tags": sorted(tags),
+            "tags": list(_tags_for_media_type(media_type)),
         }
 
 
@@ -4,7 +4,8 @@ Groups dream signals into themes using clustering
 """
 
 from typing import List, Dict, Any
-from collections import defaultdict
+import heapq
+import numpy as np
 
 
 def cluster_dream_themes(signals: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -19,19 +20,36 @@ def cluster_dream_themes(signals: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     clusters = []
     
-    # Group by category first
-    category_groups = defaultdict(list)
-    for signal in signals:
+    # Factorize categories in first-seen order, then reduce every group at once
+    n = len(signals)
+    codes: Dict[Any, int] = {}
+    category_groups: List[List[Dict[str, Any]]] = []
+    inverse = np.empty(n, dtype=np.intp)
+    clarity = np.empty(n, dtype=np.float64)
+    desire = np.empty(n, dtype=np.float64)
+    for i, signal in enumerate(signals):
         category = signal.get('category', 'other')
-        category_groups[category].append(signal)
+        code = codes.get(category)
+        if code is None:
+            code = codes[category] = len(category_groups)
+            category_groups.append([])
+        category_groups[code].append(signal)
+        inverse[i] = code
+        clarity[i] = signal.get('clarity', 0)
+        desire[i] = signal.get('desire', 0)
+    
+    n_groups = len(category_groups)
+    clarity_totals = np.bincount(inverse, weights=clarity, minlength=n_groups)
+    desire_totals = np.bincount(inverse, weights=desire, minlength=n_groups)
     
     # Create clusters from category groups
     cluster_id = 0
-    for category, category_signals in category_groups.items():
+    for category, code in codes.items():
+        category_signals = category_groups[code]
         if len(category_signals) >= 2:
             # Calculate cluster metrics
-            total_clarity = sum(s.get('clarity', 0) for s in category_signals)
-            total_desire = sum(s.get('desire', 0) for s in category_signals)
+            total_clarity = float(clarity_totals[code])
+            total_desire = float(desire_totals[code])
             avg_clarity = total_clarity / len(category_signals)
             avg_desire = total_desire / len(category_signals)
             total_score = total_clarity + total_desire
@@ -61,10 +79,10 @@ def detect_core_dreams(clusters: List[Dict[str, Any]], top_n: int = 4) -> List[s
     Returns:
         List of core dream categories
     """
-    # Sort by total score (clarity + desire)
-    sorted_clusters = sorted(clusters, key=lambda c: c.get('total_score', 0), reverse=True)
+    # Top clusters by total score (clarity + desire)
+    top_clusters = heapq.nlargest(top_n, clusters, key=lambda c: c.get('total_score', 0))
     
-    core_dreams = [c.get('category') for c in sorted_clusters[:top_n]]
+    core_dreams = [c.get('category') for c in top_clusters]
     
     return core_dreams
 
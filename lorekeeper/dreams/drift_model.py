@@ -3,9 +3,44 @@ Dream Drift Detection
 Detects shifts in dreams and aspirations over time
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 from collections import defaultdict
 from datetime import datetime
+import numpy as np
+
+
+def _timestamp_key(point: Dict[str, Any]) -> str:
+    return point.get('timestamp', '')
+
+
+def _split_chronologically(points: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Split points into the chronologically first len//2 and the rest without a full sort
+    
+    Uses an O(N) partition around the midpoint timestamp; ties at the pivot go to the
+    first half in input order, matching what a stable sort would produce.
+    """
+    timestamps = np.array([_timestamp_key(p) for p in points])
+    midpoint = len(points) // 2
+    pivot = np.partition(timestamps, midpoint - 1)[midpoint - 1]
+    
+    in_first = timestamps < pivot
+    at_pivot = timestamps == pivot
+    in_first |= at_pivot & (np.cumsum(at_pivot) <= midpoint - int(in_first.sum()))
+    
+    first_half = [p for p, first in zip(points, in_first) if first]
+    second_half = [p for p, first in zip(points, in_first) if not first]
+    return first_half, second_half
+
+
+def _average_clarity_desire(points: List[Dict[str, Any]]) -> Tuple[float, float]:
+    """Mean clarity and desire of points, accumulated in a single pass"""
+    total_clarity = 0.0
+    total_desire = 0.0
+    for p in points:
+        total_clarity += p.get('clarity', 0)
+        total_desire += p.get('desire', 0)
+    return total_clarity / len(points), total_desire / len(points)
 
 
 def detect_dream_drift(dream_timeline: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -36,19 +71,11 @@ def detect_dream_drift(dream_timeline: List[Dict[str, Any]]) -> Dict[str, Any]:
         if len(points) < 2:
             continue
         
-        # Sort by timestamp
-        sorted_points = sorted(points, key=lambda p: p.get('timestamp', ''))
-        
-        # Compare first half vs second half
-        midpoint = len(sorted_points) // 2
-        first_half = sorted_points[:midpoint]
-        second_half = sorted_points[midpoint:]
+        # Compare chronological first half vs second half
+        first_half, second_half = _split_chronologically(points)
         
-        avg_clarity_first = sum(p.get('clarity', 0) for p in first_half) / len(first_half)
-        avg_clarity_last = sum(p.get('clarity', 0) for p in second_half) / len(second_half)
-        
-        avg_desire_first = sum(p.get('desire', 0) for p in first_half) / len(first_half)
-        avg_desire_last = sum(p.get('desire', 0) for p in second_half) / len(second_half)
+        avg_clarity_first, avg_desire_first = _average_clarity_desire(first_half)
+        avg_clarity_last, avg_desire_last = _average_clarity_desire(second_half)
         
         clarity_diff = avg_clarity_last - avg_clarity_first
         desire_diff = avg_desire_last - avg_desire_first
@@ -61,8 +88,8 @@ def detect_dream_drift(dream_timeline: List[Dict[str, Any]]) -> Dict[str, Any]:
                 "desire_drift": float(desire_diff),
                 "direction": "strengthening" if (clarity_diff > 0 or desire_diff > 0) else "weakening",
                 "magnitude": max(abs(clarity_diff), abs(desire_diff)),
-                "period_start": first_half[0].get('timestamp'),
-                "period_end": second_half[-1].get('timestamp')
+                "period_start": min(first_half, key=_timestamp_key).get('timestamp'),
+                "period_end": max(reversed(second_half), key=_timestamp_key).get('timestamp')
             })
     
     return {
@@ -87,29 +114,23 @@ def detect_category_shifts(evolution: Dict[str, List[str]]) -> Dict[str, Any]:
             "count": 0
         }
     
-    years = sorted(evolution.keys())
-    first_year_categories = set(evolution[years[0]])
-    last_year_categories = set(evolution[years[-1]])
-    
-    emerging = last_year_categories - first_year_categories
-    disappearing = first_year_categories - last_year_categories
+    # Only the endpoints matter, so skip sorting every year
+    first_year = min(evolution)
+    last_year = max(evolution)
+    first_year_categories = set(evolution[first_year])
+    last_year_categories = set(evolution[last_year])
     
     shifts = []
     
-    for category in emerging:
-        shifts.append({
-            "category": category,
-            "shift": "emerging",
-            "first_year": years[-1],
-            "last_year": years[-1]
-        })
-    
-    for category in disappearing:
+    # Categories present in exactly one endpoint year, tagged by the side they came from
+    for category in first_year_categories ^ last_year_categories:
+        emerging = category in last_year_categories
+        year = last_year if emerging else first_year
         shifts.append({
             "category": category,
-            "shift": "disappearing",
-            "first_year": years[0],
-            "last_year": years[0]
+            "shift": "emerging" if emerging else "disappearing",
+            "first_year": year,
+            "last_year": year
         })
     
     return {
@@ -39,22 +39,23 @@ def project_future_dreams(dream_timeline: List[Dict[str, Any]], years_ahead: int
         if len(points) < 2:
             continue
         
-        # Sort by timestamp
-        sorted_points = sorted(points, key=lambda p: p.get('timestamp', ''))
+        # Order by timestamp (regression needs the chronological sequence)
+        n = len(points)
+        order = sorted(range(n), key=lambda i: points[i].get('timestamp', ''))
         
-        # Extract clarity and desire values
-        clarities = [p.get('clarity', 0) for p in sorted_points]
-        desires = [p.get('desire', 0) for p in sorted_points]
+        # Extract clarity and desire values as float64 arrays
+        clarities = np.fromiter((points[i].get('clarity', 0) for i in order), dtype=np.float64, count=n)
+        desires = np.fromiter((points[i].get('desire', 0) for i in order), dtype=np.float64, count=n)
         
-        # Simple linear projection
-        x = np.arange(len(clarities))
+        # Least-squares slope for both series in one closed-form pass
+        x = np.arange(n, dtype=np.float64)
+        x -= x.mean()
+        clarity_slope, desire_slope = np.vstack((clarities, desires)) @ x / (x @ x)
         
         # Project clarity
-        clarity_slope = (clarities[-1] - clarities[0]) / len(clarities) if len(clarities) > 1 else 0
         projected_clarity = min(1.0, max(0.0, clarities[-1] + clarity_slope * years_ahead))
         
         # Project desire
-        desire_slope = (desires[-1] - desires[0]) / len(desires) if len(desires) > 1 else 0
         projected_desire = min(1.0, max(0.0, desires[-1] + desire_slope * years_ahead))
         
         # Calculate confidence based on data consistency
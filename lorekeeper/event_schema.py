@@ -4,7 +4,7 @@ import uuid
 from typing import List, Dict, Any
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TimelineEvent:
     """Immutable, atomic representation of a single timeline entry."""
 
@@ -17,3 +17,19 @@ class TimelineEvent:
     source: str = ""
     archived: bool = False
     metadata: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Field dict matching ``dataclasses.asdict`` for storage, with the tag list and
+        metadata copied one level deep instead of recursively."""
+
+        return {
+            "id": self.id,
+            "date": self.date,
+            "title": self.title,
+            "type": self.type,
+            "details": self.details,
+            "tags": list(self.tags),
+            "source": self.source,
+            "archived": self.archived,
+            "metadata": dict(self.metadata),
+        }
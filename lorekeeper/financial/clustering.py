@@ -4,7 +4,7 @@ Clusters transactions by category and patterns
 """
 
 from typing import List, Dict, Any
-from collections import defaultdict
+import numpy as np
 
 
 def cluster_transactions(transactions: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -19,17 +19,30 @@ def cluster_transactions(transactions: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     clusters = []
     
-    # Group by category
-    category_groups = defaultdict(list)
-    for transaction in transactions:
+    # Factorize categories in first-seen order, then reduce every group at once
+    n = len(transactions)
+    codes: Dict[Any, int] = {}
+    category_groups: List[List[Dict[str, Any]]] = []
+    inverse = np.empty(n, dtype=np.intp)
+    amounts = np.empty(n, dtype=np.float64)
+    for i, transaction in enumerate(transactions):
         category = transaction.get('category', 'uncategorized')
-        category_groups[category].append(transaction)
+        code = codes.get(category)
+        if code is None:
+            code = codes[category] = len(category_groups)
+            category_groups.append([])
+        category_groups[code].append(transaction)
+        inverse[i] = code
+        amounts[i] = transaction.get('amount', 0)
+    
+    totals = np.bincount(inverse, weights=amounts, minlength=len(category_groups))
     
     # Create clusters from category groups
     cluster_id = 0
-    for category, category_transactions in category_groups.items():
+    for category, code in codes.items():
+        category_transactions = category_groups[code]
         if len(category_transactions) >= 2:
-            total_amount = sum(t.get('amount', 0) for t in category_transactions)
+            total_amount = float(totals[code])
             avg_amount = total_amount / len(category_transactions)
             
             clusters.append({
@@ -5,6 +5,24 @@ Predicts financial trends using regression
 
 from typing import List, Dict, Any
 import statistics
+import numpy as np
+
+from .._jit import JIT_KW, NUMBA_AVAILABLE, njit
+
+# Below this many points the JIT dispatch costs more than the pure-Python sums
+JIT_MIN_SIZE = 32
+
+
+@njit(**JIT_KW)
+def _slope_kernel(y):
+    # x = 0..n-1, so x_mean and sum((x - x_mean)^2) have closed forms and
+    # the covariance reduces to a single pass over y
+    n = y.shape[0]
+    x_mean = (n - 1) / 2.0
+    numerator = 0.0
+    for i in range(n):
+        numerator += (i - x_mean) * y[i]
+    return numerator / (n * (n * n - 1) / 12.0)
 
 
 def predict_trend(values: List[float]) -> Dict[str, Any]:
@@ -22,19 +40,22 @@ def predict_trend(values: List[float]) -> Dict[str, Any]:
     
     # Simple linear regression
     n = len(values)
-    x = list(range(n))
-    y = values
-    
-    x_mean = statistics.mean(x)
-    y_mean = statistics.mean(y)
-    
-    numerator = sum((x[i] - x_mean) * (y[i] - y_mean) for i in range(n))
-    denominator = sum((x[i] - x_mean) ** 2 for i in range(n))
-    
-    if denominator == 0:
-        slope = 0
+    if NUMBA_AVAILABLE and n >= JIT_MIN_SIZE:
+        slope = float(_slope_kernel(np.asarray(values, dtype=np.float64)))
     else:
-        slope = numerator / denominator
+        x = list(range(n))
+        y = values
+        
+        x_mean = statistics.mean(x)
+        y_mean = statistics.mean(y)
+        
+        numerator = sum((x[i] - x_mean) * (y[i] - y_mean) for i in range(n))
+        denominator = sum((x[i] - x_mean) ** 2 for i in range(n))
+        
+        if denominator == 0:
+            slope = 0
+        else:
+            slope = numerator / denominator
     
     # Determine trend
     if slope > 0.01:
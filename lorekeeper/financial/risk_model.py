@@ -4,6 +4,7 @@ Assesses financial risk based on spending patterns and income
 """
 
 from typing import List, Dict, Any
+import numpy as np
 
 
 def assess_risk(transactions: List[Dict[str, Any]], income: float) -> Dict[str, Any]:
@@ -17,8 +18,19 @@ def assess_risk(transactions: List[Dict[str, Any]], income: float) -> Dict[str,
     Returns:
         Dictionary with risk assessment
     """
-    expenses = [t for t in transactions if t.get('direction') == 'out']
-    total_expenses = sum(t.get('amount', 0) for t in expenses)
+    # Single pass into parallel arrays; all reductions below run in NumPy
+    amounts = []
+    is_expense = []
+    is_debt = []
+    for t in transactions:
+        amounts.append(t.get('amount', 0))
+        is_expense.append(t.get('direction') == 'out')
+        is_debt.append(t.get('category') == 'debt')
+    amounts = np.array(amounts, dtype=np.float64)
+    expense_amounts = amounts[np.array(is_expense, dtype=bool)]
+    debt_amounts = amounts[np.array(is_debt, dtype=bool)]
+    
+    total_expenses = float(expense_amounts.sum())
     
     # Calculate expense-to-income ratio
     if income > 0:
@@ -38,9 +50,8 @@ def assess_risk(transactions: List[Dict[str, Any]], income: float) -> Dict[str,
         risk_factors.append("moderate_expense_ratio")
     
     # Debt presence
-    debt_transactions = [t for t in transactions if t.get('category') == 'debt']
-    if debt_transactions:
-        total_debt = sum(t.get('amount', 0) for t in debt_transactions)
+    if debt_amounts.size:
+        total_debt = float(debt_amounts.sum())
         if income > 0 and total_debt > income * 0.5:
             risk_score += 0.3
             risk_factors.append("high_debt_burden")
@@ -49,11 +60,9 @@ def assess_risk(transactions: List[Dict[str, Any]], income: float) -> Dict[str,
             risk_factors.append("debt_present")
     
     # Volatility in spending
-    if len(expenses) > 1:
-        amounts = [t.get('amount', 0) for t in expenses]
-        avg = sum(amounts) / len(amounts)
-        variance = sum((a - avg) ** 2 for a in amounts) / len(amounts)
-        std_dev = variance ** 0.5
+    if expense_amounts.size > 1:
+        avg = float(expense_amounts.mean())
+        std_dev = float(expense_amounts.std())
         coefficient_of_variation = std_dev / avg if avg > 0 else 0
         
         if coefficient_of_variation > 0.5:
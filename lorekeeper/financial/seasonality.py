@@ -4,7 +4,7 @@ Detects seasonal patterns in spending and income
 """
 
 from typing import List, Dict, Any
-from collections import defaultdict
+import numpy as np
 
 
 def detect_seasonality(transactions: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -17,38 +17,56 @@ def detect_seasonality(transactions: List[Dict[str, Any]]) -> Dict[str, Any]:
     Returns:
         Dictionary with seasonal patterns
     """
-    # Group by month
-    by_month = defaultdict(lambda: {"income": 0, "expenses": 0, "count": 0})
+    # Parse each transaction once; months are factorized in first-seen order
+    month_codes: Dict[int, int] = {}
+    codes = []
+    amounts = []
+    is_income = []
     
     for transaction in transactions:
         timestamp = transaction.get('timestamp', '')
         direction = transaction.get('direction', 'out')
-        amount = transaction.get('amount', 0)
         
         if timestamp:
             try:
-                month = int(timestamp.split('-')[1]) if '-' in timestamp else 1
-                by_month[month]["count"] += 1
-                if direction == 'in':
-                    by_month[month]["income"] += amount
-                else:
-                    by_month[month]["expenses"] += amount
-            except:
-                pass
+                month = int(timestamp.split('-', 2)[1]) if '-' in timestamp else 1
+            except (TypeError, ValueError):
+                continue
+            # A non-numeric amount still counts toward the month but adds nothing to its totals
+            amount = transaction.get('amount', 0)
+            try:
+                amount = 0.0 if isinstance(amount, (str, bytes)) else float(amount)
+            except (TypeError, ValueError):
+                amount = 0.0
+            codes.append(month_codes.setdefault(month, len(month_codes)))
+            amounts.append(amount)
+            is_income.append(direction == 'in')
     
-    # Find peak months
-    if by_month:
-        max_expenses = max(m["expenses"] for m in by_month.values())
-        peak_expense_months = [m for m, data in by_month.items() if data["expenses"] == max_expenses]
-        
-        max_income = max(m["income"] for m in by_month.values())
-        peak_income_months = [m for m, data in by_month.items() if data["income"] == max_income]
+    # Per-month totals and counts in three bincount reductions
+    n_months = len(month_codes)
+    codes = np.array(codes, dtype=np.intp)
+    amounts = np.array(amounts, dtype=np.float64)
+    is_income = np.array(is_income, dtype=bool)
+    income = np.bincount(codes, weights=np.where(is_income, amounts, 0.0), minlength=n_months)
+    expenses = np.bincount(codes, weights=np.where(is_income, 0.0, amounts), minlength=n_months)
+    counts = np.bincount(codes, minlength=n_months)
+    
+    months = list(month_codes)
+    by_month = {
+        month: {"income": float(income[code]), "expenses": float(expenses[code]), "count": int(counts[code])}
+        for month, code in month_codes.items()
+    }
+    
+    # Find peak months (all ties, in first-seen order)
+    if n_months:
+        peak_expense_months = [months[code] for code in np.flatnonzero(expenses == expenses.max())]
+        peak_income_months = [months[code] for code in np.flatnonzero(income == income.max())]
     else:
         peak_expense_months = []
         peak_income_months = []
     
     return {
-        "by_month": dict(by_month),
+        "by_month": by_month,
         "peak_expense_months": peak_expense_months,
         "peak_income_months": peak_income_months
     }
@@ -5,6 +5,14 @@ Goal Success Prediction
 from typing import List, Dict, Any
 from datetime import datetime
 
+# Base success probability per goal status; unknown statuses get 0.5
+STATUS_PROBABILITIES = {
+    'completed': 1.0,
+    'abandoned': 0.1,
+    'paused': 0.3,
+    'active': 0.6,
+}
+
 
 def predict(goals: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
@@ -17,6 +25,7 @@ def predict(goals: List[Dict[str, Any]]) -> Dict[str, Any]:
         Dictionary with predictions list
     """
     predictions = []
+    timestamp = datetime.now().isoformat()
     
     for goal in goals:
         # Calculate basic probability based on goal state
@@ -27,7 +36,7 @@ def predict(goals: List[Dict[str, Any]]) -> Dict[str, Any]:
             "type": "success_probability",
             "message": f"Predicted success probability for '{goal['title']}' is {(probability * 100):.0f}%.",
             "confidence": 0.7,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
             "relatedGoalId": goal['id'],
             "related_goal_id": goal['id'],
             "probability": probability,
@@ -40,18 +49,8 @@ def calculate_probability(goal: Dict[str, Any]) -> float:
     """
     Calculate success probability for a goal
     """
-    probability = 0.5  # Default
-    
     # Adjust based on status
-    status = goal.get('status', 'active')
-    if status == 'completed':
-        probability = 1.0
-    elif status == 'abandoned':
-        probability = 0.1
-    elif status == 'paused':
-        probability = 0.3
-    elif status == 'active':
-        probability = 0.6
+    probability = STATUS_PROBABILITIES.get(goal.get('status', 'active'), 0.5)
     
     # Adjust based on milestones
     milestones = goal.get('milestones', [])
@@ -2,38 +2,203 @@
 Goal Similarity Detection
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, FrozenSet, Iterable, Tuple
+import heapq
+import zlib
 import numpy as np
 
+from .._jit import JIT_KW, NUMBA_AVAILABLE, njit
 
-def find_similar_goals(goal: Dict[str, Any], all_goals: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """
-    Find similar goals
-    
-    TODO: Implement semantic similarity using embeddings
-    """
+# MinHash/LSH settings for approximate batch sweeps: 32 bands x 2 rows puts the
+# candidate probability at ~95% for the 0.3 Jaccard cutoff (~99.6% at 0.4)
+NUM_PERM = 64
+LSH_ROWS = 2
+LSH_MIN_SIZE = 2000
+
+# Exact batch sweeps switch to int bitmask Jaccard up to this corpus vocabulary;
+# beyond it the masks get wide enough that frozenset intersection wins again
+MASK_MAX_VOCAB = 4096
+_PRIME = (1 << 31) - 1
+_rng = np.random.default_rng(1)
+_HASH_A = _rng.integers(1, _PRIME, size=NUM_PERM, dtype=np.int64)
+_HASH_B = _rng.integers(0, _PRIME, size=NUM_PERM, dtype=np.int64)
+
+
+@njit(**JIT_KW)
+def _minhash_kernel(token_hashes, offsets, hash_a, hash_b):
+    # Row i's tokens are token_hashes[offsets[i]:offsets[i + 1]]; every value is < 2^31
+    # so (a * x + b) stays inside int64
+    n = offsets.shape[0] - 1
+    signatures = np.empty((n, hash_a.shape[0]), dtype=np.int64)
+    for i in range(n):
+        for p in range(hash_a.shape[0]):
+            lowest = _PRIME
+            for k in range(offsets[i], offsets[i + 1]):
+                value = (hash_a[p] * token_hashes[k] + hash_b[p]) % _PRIME
+                if value < lowest:
+                    lowest = value
+            signatures[i, p] = lowest
+    return signatures
+
+
+def _tokenize(goal: Dict[str, Any]) -> FrozenSet[str]:
+    """Lowercased word set of a goal's title and description"""
+    return frozenset((goal.get('title', '') + ' ' + goal.get('description', '')).lower().split())
+
+
+def _rank_similar(
+    goal: Dict[str, Any],
+    goal_words: FrozenSet[str],
+    tokenized: Iterable[Tuple[Dict[str, Any], FrozenSet[str]]],
+) -> List[Dict[str, Any]]:
+    """Top 5 goals by word overlap with `goal`, from pre-tokenized candidates"""
     similar = []
     
-    # Placeholder: Basic text similarity
-    goal_text = (goal.get('title', '') + ' ' + goal.get('description', '')).lower()
+    if not goal_words:
+        return similar
+    goal_size = len(goal_words)
     
-    for other_goal in all_goals:
+    for other_goal, other_words in tokenized:
         if other_goal['id'] == goal['id']:
             continue
         
-        other_text = (other_goal.get('title', '') + ' ' + other_goal.get('description', '')).lower()
-        
-        # Simple word overlap
-        goal_words = set(goal_text.split())
-        other_words = set(other_text.split())
-        
-        if goal_words and other_words:
-            overlap = len(goal_words & other_words) / len(goal_words | other_words)
+        # Simple word overlap; |A | B| = |A| + |B| - |A & B| saves the union join
+        if other_words:
+            shared = len(goal_words & other_words)
+            overlap = shared / (goal_size + len(other_words) - shared)
             if overlap > 0.3:
                 similar.append({
                     'goal': other_goal,
                     'similarity': overlap,
                 })
     
-    return sorted(similar, key=lambda x: x['similarity'], reverse=True)[:5]
+    return heapq.nlargest(5, similar, key=lambda x: x['similarity'])
+
 
+def find_similar_goals(goal: Dict[str, Any], all_goals: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Find similar goals
+    
+    TODO: Implement semantic similarity using embeddings
+    """
+    # Placeholder: Basic text similarity
+    goal_words = _tokenize(goal)
+    if not goal_words:
+        return []
+    
+    # Candidates are tokenized lazily, one at a time
+    tokenized = ((other_goal, _tokenize(other_goal)) for other_goal in all_goals)
+    return _rank_similar(goal, goal_words, tokenized)
+
+
+def find_similar_goals_batch(
+    all_goals: List[Dict[str, Any]],
+    approximate: bool = False,
+) -> Dict[Any, List[Dict[str, Any]]]:
+    """
+    Find similar goals for every goal, tokenizing each goal only once
+    
+    Args:
+        all_goals: Goals with id, title, description
+        approximate: Allow MinHash LSH candidate selection for batches of at least
+            LSH_MIN_SIZE goals when Numba is installed. Candidates are re-scored
+            exactly, but a similar pair that shares no LSH band (~5% at the 0.3
+            cutoff, rarer for closer pairs) is missed. Results are deterministic
+            for a given input. Without it, results always equal find_similar_goals
+            per goal.
+    
+    Returns:
+        Dictionary mapping goal id to its similar goals
+    """
+    tokenized = [(goal, _tokenize(goal)) for goal in all_goals]
+    if approximate and NUMBA_AVAILABLE and len(tokenized) >= LSH_MIN_SIZE:
+        return _lsh_sweep(tokenized)
+    
+    vocabulary: Dict[str, int] = {}
+    for _, words in tokenized:
+        for word in words:
+            vocabulary.setdefault(word, len(vocabulary))
+    if len(vocabulary) <= MASK_MAX_VOCAB:
+        return _mask_sweep(tokenized, vocabulary)
+    return {
+        goal['id']: _rank_similar(goal, goal_words, tokenized)
+        for goal, goal_words in tokenized
+    }
+
+
+def _mask_sweep(
+    tokenized: List[Tuple[Dict[str, Any], FrozenSet[str]]],
+    vocabulary: Dict[str, int],
+) -> Dict[Any, List[Dict[str, Any]]]:
+    """
+    Exact batch sweep with each goal's words as an int bitmask over the vocabulary
+    
+    Intersection sizes come from int.bit_count() on the AND of two masks, which is
+    cheaper than hashing through a frozenset intersection.
+    """
+    masks = []
+    for _, words in tokenized:
+        mask = 0
+        for word in words:
+            mask |= 1 << vocabulary[word]
+        masks.append(mask)
+    sizes = [len(words) for _, words in tokenized]
+    
+    results = {}
+    for i, (goal, _) in enumerate(tokenized):
+        similar = []
+        goal_mask = masks[i]
+        goal_size = sizes[i]
+        if goal_size:
+            for j, (other_goal, _) in enumerate(tokenized):
+                if other_goal['id'] == goal['id'] or not sizes[j]:
+                    continue
+                shared = (goal_mask & masks[j]).bit_count()
+                overlap = shared / (goal_size + sizes[j] - shared)
+                if overlap > 0.3:
+                    similar.append({
+                        'goal': other_goal,
+                        'similarity': overlap,
+                    })
+        results[goal['id']] = heapq.nlargest(5, similar, key=lambda x: x['similarity'])
+    return results
+
+
+def _lsh_sweep(tokenized: List[Tuple[Dict[str, Any], FrozenSet[str]]]) -> Dict[Any, List[Dict[str, Any]]]:
+    """
+    Batch sweep that only compares goals sharing a MinHash LSH band bucket
+    
+    Candidates are re-scored with exact Jaccard, so results match the full sweep
+    except for the rare similar pair that shares no band.
+    """
+    token_hashes = []
+    offsets = [0]
+    for _, words in tokenized:
+        # crc32 rather than the built-in hash(), which is salted per process
+        token_hashes.extend(zlib.crc32(word.encode('utf-8')) % _PRIME for word in words)
+        offsets.append(len(token_hashes))
+    signatures = _minhash_kernel(
+        np.array(token_hashes, dtype=np.int64), np.array(offsets, dtype=np.int64), _HASH_A, _HASH_B
+    )
+    
+    # (band, band signature) -> goal indices; goals without words never match
+    buckets: Dict[Tuple[int, bytes], List[int]] = {}
+    band_keys = []
+    for i, (_, words) in enumerate(tokenized):
+        keys = []
+        if words:
+            for band in range(NUM_PERM // LSH_ROWS):
+                key = (band, signatures[i, band * LSH_ROWS:(band + 1) * LSH_ROWS].tobytes())
+                buckets.setdefault(key, []).append(i)
+                keys.append(key)
+        band_keys.append(keys)
+    
+    results = {}
+    for i, (goal, goal_words) in enumerate(tokenized):
+        candidates = set()
+        for key in band_keys[i]:
+            candidates.update(buckets[key])
+        # Input order keeps tie-breaking identical to the full sweep
+        shortlist = [tokenized[j] for j in sorted(candidates)]
+        results[goal['id']] = _rank_similar(goal, goal_words, shortlist)
+    return results
@@ -3,37 +3,148 @@ Change Point Detection
 Detects significant changes in growth trajectory
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+import numpy as np
 
+from .._jit import JIT_KW, njit
 
-def detect_change_points(values: List[float], threshold: float = 0.2) -> List[Dict[str, Any]]:
+
+@njit(**JIT_KW)
+def _pelt_kernel(y, penalty):
+    # PELT (Killick et al. 2012) with the sum-of-squared-deviations segment cost.
+    # F[t] is the optimal penalized cost of y[:t]; last[t] the start of its final segment.
+    n = y.shape[0]
+    cumsum = np.zeros(n + 1)
+    cumsum_sq = np.zeros(n + 1)
+    for i in range(n):
+        cumsum[i + 1] = cumsum[i] + y[i]
+        cumsum_sq[i + 1] = cumsum_sq[i] + y[i] * y[i]
+    
+    F = np.empty(n + 1)
+    F[0] = -penalty
+    last = np.zeros(n + 1, dtype=np.int64)
+    candidates = np.empty(n + 1, dtype=np.int64)
+    candidates[0] = 0
+    n_candidates = 1
+    costs = np.empty(n + 1)
+    
+    for t in range(1, n + 1):
+        best_u = -1
+        best = 0.0
+        for k in range(n_candidates):
+            u = candidates[k]
+            segment_sum = cumsum[t] - cumsum[u]
+            cost = (cumsum_sq[t] - cumsum_sq[u]) - segment_sum * segment_sum / (t - u)
+            costs[k] = F[u] + cost
+            if best_u < 0 or costs[k] + penalty < best:
+                best = costs[k] + penalty
+                best_u = u
+        F[t] = best
+        last[t] = best_u
+        
+        # Pruning rule: u can never be optimal again once F[u] + C(y[u:t]) > F[t]
+        kept = 0
+        for k in range(n_candidates):
+            if costs[k] <= F[t]:
+                candidates[kept] = candidates[k]
+                kept += 1
+        candidates[kept] = t
+        n_candidates = kept + 1
+    
+    return last
+
+
+def detect_change_points(
+    values: List[float],
+    threshold: float = 0.2,
+    method: str = "diff",
+    penalty: Optional[float] = None
+) -> List[Dict[str, Any]]:
     """
     Detect change points in growth trajectory
     
     Args:
         values: List of growth values
         threshold: Minimum change magnitude to consider
+        method: "diff" compares consecutive values; "pelt" detects shifts in the mean
+            between whole segments
+        penalty: Cost of adding a segment for "pelt" (default: 2 log(n) times the
+            noise variance estimated from consecutive differences)
         
     Returns:
         List of change points with indices and magnitudes
+        
+    Raises:
+        ValueError: If method is not "diff" or "pelt"
     """
+    if method not in ("diff", "pelt"):
+        raise ValueError(f"Unknown change point method: {method!r} (expected 'diff' or 'pelt')")
+    
     if not values or len(values) < 2:
         return []
     
+    if method == "pelt":
+        return _detect_mean_shifts(np.asarray(values, dtype=np.float64), threshold, penalty)
+    
+    # Deltas and the threshold mask in one vectorized pass; dicts only for hits
+    arr = np.asarray(values, dtype=np.float64)
+    changes = np.diff(arr)
+    hits = np.flatnonzero(np.abs(changes) >= threshold)
+    
     change_points = []
     
-    for i in range(1, len(values)):
-        change = values[i] - values[i-1]
-        abs_change = abs(change)
-        
-        if abs_change >= threshold:
+    for k in hits.tolist():
+        change = float(changes[k])
+        change_points.append({
+            "index": k + 1,
+            "magnitude": change,
+            "type": "breakthrough" if change > 0 else "regression",
+            "from_value": float(arr[k]),
+            "to_value": float(arr[k + 1])
+        })
+    
+    return change_points
+
+
+def _detect_mean_shifts(arr: np.ndarray, threshold: float, penalty: Optional[float]) -> List[Dict[str, Any]]:
+    """
+    Multiple change points via PELT; each is reported with the shift between the
+    means of the regimes around it, if that shift is at least `threshold`
+    """
+    n = len(arr)
+    if penalty is None:
+        # Robust noise scale from the MAD of first differences (diff variance = 2 sigma^2)
+        diffs = np.diff(arr)
+        sigma = np.median(np.abs(diffs - np.median(diffs))) / (0.6745 * np.sqrt(2.0))
+        penalty = 2.0 * np.log(n) * max(sigma * sigma, 1e-12)
+    
+    # Backtrack segment starts from the end of the series
+    last = _pelt_kernel(arr, float(penalty))
+    bounds = [n]
+    while bounds[-1] > 0:
+        bounds.append(int(last[bounds[-1]]))
+    bounds.reverse()
+    
+    # Walk the segments, merging any whose mean shift is below threshold into the
+    # running regime so reported from/to values describe the regimes on each side
+    change_points = []
+    regime_start = 0
+    regime_mean = float(arr[:bounds[1]].mean())
+    for start, end in zip(bounds[1:], bounds[2:]):
+        segment_mean = float(arr[start:end].mean())
+        change = segment_mean - regime_mean
+        if abs(change) >= threshold:
             change_points.append({
-                "index": i,
-                "magnitude": float(change),
+                "index": start,
+                "magnitude": change,
                 "type": "breakthrough" if change > 0 else "regression",
-                "from_value": float(values[i-1]),
-                "to_value": float(values[i])
+                "from_value": regime_mean,
+                "to_value": segment_mean
             })
+            regime_start = start
+            regime_mean = segment_mean
+        else:
+            regime_mean = float(arr[regime_start:end].mean())
     
     return change_points
 
@@ -83,8 +194,10 @@ def handle(**kwargs) -> Dict[str, Any]:
     """
     values = kwargs.get("values", [])
     threshold = kwargs.get("threshold", 0.2)
+    method = kwargs.get("method", "diff")
+    penalty = kwargs.get("penalty")
     
-    change_points = detect_change_points(values, threshold)
+    change_points = detect_change_points(values, threshold, method, penalty)
     is_plateau = detect_plateau(values)
     is_breakthrough = detect_breakthrough(values, threshold)
     
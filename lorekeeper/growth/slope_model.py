@@ -3,30 +3,48 @@ Slope Model for Growth Velocity
 Calculates growth slopes and trends
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 import numpy as np
 
+from .._jit import JIT_KW, NUMBA_AVAILABLE, njit
 
-def calculate_slope(values: List[float], timestamps: List[str] = None) -> Dict[str, Any]:
-    """
-    Calculate slope of growth trajectory
+
+@njit(**JIT_KW)
+def _slope_kernel(y):
+    # x = 0..n-1, so sum(x) and sum(x^2) have closed forms; one pass gathers the
+    # y sums and a second fused pass gathers both residual sums for R-squared
+    n = y.shape[0]
+    sum_x = n * (n - 1) // 2
+    sum_x_squared = (n - 1) * n * (2 * n - 1) // 6
+    sum_y = 0.0
+    sum_xy = 0.0
+    for i in range(n):
+        sum_y += y[i]
+        sum_xy += i * y[i]
     
-    Args:
-        values: List of growth values over time
-        timestamps: Optional list of timestamps
-        
-    Returns:
-        Dictionary with slope analysis
-    """
-    if not values or len(values) < 2:
-        return {
-            "slope": 0.0,
-            "trend": "insufficient_data",
-            "r_squared": 0.0
-        }
+    denominator = n * sum_x_squared - sum_x * sum_x
+    slope = (n * sum_xy - sum_x * sum_y) / denominator if denominator != 0 else 0.0
+    intercept = (sum_y - slope * sum_x) / n
+    y_mean = sum_y / n
+    
+    ss_tot = 0.0
+    ss_res = 0.0
+    for i in range(n):
+        deviation = y[i] - y_mean
+        residual = y[i] - (slope * i + intercept)
+        ss_tot += deviation * deviation
+        ss_res += residual * residual
+    
+    r_squared = 1.0 if ss_tot == 0 else 1 - ss_res / ss_tot
+    return slope, r_squared
+
+
+def _slope_r_squared(y: np.ndarray) -> Tuple[float, float]:
+    """Return (slope, R-squared) of a least-squares line through y over x = 0..n-1."""
+    if NUMBA_AVAILABLE:
+        slope, r_squared = _slope_kernel(y)
+        return float(slope), float(r_squared)
     
-    # Convert to numpy array
-    y = np.array(values)
     x = np.arange(len(y))
     
     # Calculate linear regression slope
@@ -53,6 +71,29 @@ def calculate_slope(values: List[float], timestamps: List[str] = None) -> Dict[s
         ss_res = np.sum((y - y_pred) ** 2)
         r_squared = 1 - (ss_res / ss_tot)
     
+    return float(slope), float(r_squared)
+
+
+def calculate_slope(values: List[float], timestamps: List[str] = None) -> Dict[str, Any]:
+    """
+    Calculate slope of growth trajectory
+    
+    Args:
+        values: List of growth values over time
+        timestamps: Optional list of timestamps
+        
+    Returns:
+        Dictionary with slope analysis
+    """
+    if not values or len(values) < 2:
+        return {
+            "slope": 0.0,
+            "trend": "insufficient_data",
+            "r_squared": 0.0
+        }
+    
+    slope, r_squared = _slope_r_squared(np.asarray(values, dtype=np.float64))
+    
     # Determine trend
     if slope > 0.01:
         trend = "growing"
@@ -62,9 +103,9 @@ def calculate_slope(values: List[float], timestamps: List[str] = None) -> Dict[s
         trend = "stable"
     
     return {
-        "slope": float(slope),
+        "slope": slope,
         "trend": trend,
-        "r_squared": float(r_squared),
+        "r_squared": r_squared,
         "strength": "strong" if abs(r_squared) > 0.7 else "moderate" if abs(r_squared) > 0.4 else "weak"
     }
 
@@ -83,11 +124,8 @@ def calculate_velocity(values: List[float], timestamps: List[str] = None) -> flo
     if not values or len(values) < 2:
         return 0.0
     
-    # Calculate differences
-    deltas = [values[i] - values[i-1] for i in range(1, len(values))]
-    
-    # Average velocity
-    velocity = sum(deltas) / len(deltas)
+    # The deltas telescope, so their mean is just the end-to-end change per step
+    velocity = (values[-1] - values[0]) / (len(values) - 1)
     
     return float(velocity)
 
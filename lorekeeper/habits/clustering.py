@@ -4,7 +4,6 @@ Habit Clustering
 
 from typing import List, Dict, Any
 from datetime import datetime
-from collections import defaultdict
 
 
 def cluster(habits: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -18,32 +17,28 @@ def cluster(habits: List[Dict[str, Any]]) -> Dict[str, Any]:
         Dictionary with clusters list
     """
     clusters = []
+    timestamp = datetime.now().isoformat()
     
-    # Group by category first
-    category_groups = defaultdict(list)
+    # Group by category, then frequency band, in a single pass
+    category_groups: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
     for habit in habits:
         category = habit.get('category', 'other')
-        category_groups[category].append(habit)
+        freq = habit.get('frequency', 0)
+        freq_group = 'high' if freq >= 5 else 'medium' if freq >= 2 else 'low'
+        category_groups.setdefault(category, {}).setdefault(freq_group, []).append(habit)
     
-    # Create clusters
+    # Create clusters, one id per (category, frequency band)
     cluster_id = 0
-    for category, category_habits in category_groups.items():
-        # Further cluster by frequency if needed
-        frequency_groups = defaultdict(list)
-        for habit in category_habits:
-            freq = habit.get('frequency', 0)
-            freq_group = 'high' if freq >= 5 else 'medium' if freq >= 2 else 'low'
-            frequency_groups[freq_group].append(habit)
-        
+    for category, frequency_groups in category_groups.items():
         for freq_group, freq_habits in frequency_groups.items():
+            cluster_id_str = f"cluster_{cluster_id}"
             for habit in freq_habits:
-                cluster_id_str = f"cluster_{cluster_id}"
                 clusters.append({
                     "id": f"cluster_{habit['id']}",
                     "type": "cluster_assignment",
                     "message": f'Habit "{habit["action"]}" assigned to {category} cluster ({freq_group} frequency)',
                     "confidence": 0.6,
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": timestamp,
                     "habitId": habit['id'],
                     "habit_id": habit['id'],
                     "clusterId": cluster_id_str,
@@ -3,7 +3,45 @@ Habit Decay Prediction
 """
 
 from typing import List, Dict, Any
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+import warnings
+import numpy as np
+
+
+def _days_since_one(last_performed: str) -> float:
+    """Whole days since one ISO timestamp, or NaN when it cannot be parsed"""
+    try:
+        last_date = datetime.fromisoformat(last_performed.replace('Z', '+00:00'))
+        return float((datetime.now(last_date.tzinfo) - last_date).days)
+    except:
+        return float('nan')
+
+
+def _days_since(stamps: List[str]) -> np.ndarray:
+    """
+    Whole days since each ISO timestamp, or NaN when it cannot be parsed
+    
+    Naive and Z-suffixed timestamps are parsed in one datetime64 conversion (naive
+    against local time, Z against UTC, like datetime.now(tzinfo)); batches containing
+    explicit offsets or malformed values fall back to per-row fromisoformat.
+    """
+    if not all(isinstance(s, str) for s in stamps):
+        return np.array([_days_since_one(s) for s in stamps], dtype=np.float64)
+    
+    is_utc = np.array([s.endswith('Z') for s in stamps], dtype=bool)
+    try:
+        with warnings.catch_warnings():
+            # numpy only warns on explicit offsets; treat them as a fallback signal
+            warnings.simplefilter('error')
+            parsed = np.array([s[:-1] if utc else s for s, utc in zip(stamps, is_utc)], dtype='datetime64[us]')
+    except (ValueError, UserWarning, DeprecationWarning):
+        return np.array([_days_since_one(s) for s in stamps], dtype=np.float64)
+    
+    now_local = np.datetime64(datetime.now(), 'us')
+    now_utc = np.datetime64(datetime.now(timezone.utc).replace(tzinfo=None), 'us')
+    now = np.where(is_utc, now_utc, now_local)
+    days = (now - parsed) // np.timedelta64(1, 'D')
+    return days.astype(np.float64)
 
 
 def predict_decay(habits: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -13,34 +51,31 @@ def predict_decay(habits: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     TODO: Implement ML-based decay prediction
     """
     decay_predictions = []
+    timestamp = datetime.now().isoformat()
+    
+    # Basic decay prediction based on last_performed, vectorized over all habits
+    stamps = [habit.get('last_performed') for habit in habits]
+    dated = [i for i, stamp in enumerate(stamps) if stamp]
+    
+    decay_risks = np.ones(len(habits))  # No last_performed = 100% risk
+    if dated:
+        days_since = _days_since([stamps[i] for i in dated])
+        # Higher days since = higher decay risk; unparseable dates get 0.5
+        decay_risks[dated] = np.where(np.isnan(days_since), 0.5, np.minimum(1.0, days_since / 14))  # 14 days = 100% risk
     
-    for habit in habits:
-        # Basic decay prediction based on last_performed
-        last_performed = habit.get('last_performed')
-        if not last_performed:
-            decay_risk = 1.0
-        else:
-            # Calculate days since last performance
-            try:
-                last_date = datetime.fromisoformat(last_performed.replace('Z', '+00:00'))
-                days_since = (datetime.now(last_date.tzinfo) - last_date).days
-                
-                # Higher days since = higher decay risk
-                decay_risk = min(1.0, days_since / 14)  # 14 days = 100% risk
-            except:
-                decay_risk = 0.5
-        
-        if decay_risk >= 0.3:
-            decay_predictions.append({
-                "id": f"decay_{habit['id']}",
-                "type": "decay_warning",
-                "message": f"Habit '{habit['action']}' decay risk: {(decay_risk * 100):.0f}%",
-                "confidence": 0.8,
-                "timestamp": datetime.now().isoformat(),
-                "habitId": habit['id'],
-                "habit_id": habit['id'],
-                "decay_risk": decay_risk,
-            })
+    for i in np.flatnonzero(decay_risks >= 0.3).tolist():
+        habit = habits[i]
+        decay_risk = float(decay_risks[i])
+        decay_predictions.append({
+            "id": f"decay_{habit['id']}",
+            "type": "decay_warning",
+            "message": f"Habit '{habit['action']}' decay risk: {(decay_risk * 100):.0f}%",
+            "confidence": 0.8,
+            "timestamp": timestamp,
+            "habitId": habit['id'],
+            "habit_id": habit['id'],
+            "decay_risk": decay_risk,
+        })
     
     return decay_predictions
 
@@ -4,6 +4,7 @@ Habit Consistency Predictions
 
 from typing import List, Dict, Any
 from datetime import datetime
+import numpy as np
 
 
 def predict_consistency(habits: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -13,21 +14,23 @@ def predict_consistency(habits: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     TODO: Implement ML-based consistency prediction
     """
     predictions = []
+    timestamp = datetime.now().isoformat()
     
-    for habit in habits:
-        # Basic prediction based on streak and frequency
-        streak = habit.get('streak', 0)
-        frequency = habit.get('frequency', 0)
-        
-        # Higher streak and frequency = higher consistency
-        consistency = min(1.0, (streak / 30) * 0.5 + (frequency / 7) * 0.5)
-        
+    # Basic prediction based on streak and frequency, for all habits at once
+    n = len(habits)
+    streaks = np.fromiter((habit.get('streak', 0) for habit in habits), dtype=np.float64, count=n)
+    frequencies = np.fromiter((habit.get('frequency', 0) for habit in habits), dtype=np.float64, count=n)
+    
+    # Higher streak and frequency = higher consistency
+    consistencies = np.minimum(1.0, (streaks / 30) * 0.5 + (frequencies / 7) * 0.5)
+    
+    for habit, consistency in zip(habits, consistencies.tolist()):
         predictions.append({
             "id": f"pred_{habit['id']}",
             "type": "consistency_prediction",
             "message": f"Predicted consistency for '{habit['action']}': {(consistency * 100):.0f}%",
             "confidence": 0.7,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
             "habitId": habit['id'],
             "habit_id": habit['id'],
             "consistency": consistency,
@@ -4,7 +4,22 @@ Computes correlations between health metrics
 """
 
 from typing import List, Dict, Any
-import statistics
+import numpy as np
+
+
+def _correlation_matrix(series: np.ndarray) -> np.ndarray:
+    """
+    Pearson correlations between all rows of a (k, n) array in one matrix product
+    
+    Rows with zero variance correlate as 0.0 instead of NaN.
+    """
+    centered = series - series.mean(axis=1, keepdims=True)
+    covariance = centered @ centered.T
+    variance = np.diag(covariance)
+    denominator = np.sqrt(np.outer(variance, variance))
+    correlations = np.zeros_like(covariance)
+    np.divide(covariance, denominator, out=correlations, where=denominator != 0)
+    return correlations
 
 
 def compute_correlation(x: List[float], y: List[float]) -> float:
@@ -21,19 +36,7 @@ def compute_correlation(x: List[float], y: List[float]) -> float:
     if len(x) != len(y) or len(x) < 2:
         return 0.0
     
-    x_mean = statistics.mean(x)
-    y_mean = statistics.mean(y)
-    
-    numerator = sum((x[i] - x_mean) * (y[i] - y_mean) for i in range(len(x)))
-    x_variance = sum((x[i] - x_mean) ** 2 for i in range(len(x)))
-    y_variance = sum((y[i] - y_mean) ** 2 for i in range(len(y)))
-    
-    denominator = (x_variance * y_variance) ** 0.5
-    
-    if denominator == 0:
-        return 0.0
-    
-    return numerator / denominator
+    return float(_correlation_matrix(np.array([x, y], dtype=np.float64))[0, 1])
 
 
 def analyze_correlations(metrics: Dict[str, List[float]]) -> Dict[str, Any]:
@@ -47,12 +50,30 @@ def analyze_correlations(metrics: Dict[str, List[float]]) -> Dict[str, Any]:
         Dictionary with correlation matrix
     """
     metric_names = list(metrics.keys())
+    lengths = [len(metrics[name]) for name in metric_names]
     correlations = {}
     
+    # Only equal-length series are comparable: one correlation matrix per length
+    by_length: Dict[int, List[int]] = {}
+    for i, length in enumerate(lengths):
+        if length >= 2:
+            by_length.setdefault(length, []).append(i)
+    
+    matrix_rows = {}
+    for indices in by_length.values():
+        if len(indices) < 2:
+            continue
+        matrix = _correlation_matrix(np.array([metrics[metric_names[i]] for i in indices], dtype=np.float64))
+        for row, i in enumerate(indices):
+            matrix_rows[i] = (matrix, row)
+    
     for i, name1 in enumerate(metric_names):
-        for name2 in metric_names[i+1:]:
-            corr = compute_correlation(metrics[name1], metrics[name2])
-            key = f"{name1}_{name2}"
+        for j in range(i + 1, len(metric_names)):
+            corr = 0.0
+            if lengths[i] == lengths[j] and i in matrix_rows:
+                matrix, row_i = matrix_rows[i]
+                corr = float(matrix[row_i, matrix_rows[j][1]])
+            key = f"{name1}_{metric_names[j]}"
             correlations[key] = corr
     
     return {
@@ -30,12 +30,15 @@ def detect_seasonality(events: List[Dict[str, Any]]) -> Dict[str, Any]:
             except:
                 pass
     
-    # Find peak months
-    if by_month:
-        max_count = max(by_month.values())
-        peak_months = [m for m, c in by_month.items() if c == max_count]
-    else:
-        peak_months = []
+    # Find peak months (running max with ties, in one pass)
+    max_count = 0
+    peak_months = []
+    for m, c in by_month.items():
+        if c > max_count:
+            max_count = c
+            peak_months = [m]
+        elif c == max_count:
+            peak_months.append(m)
     
     return {
         "by_month": dict(by_month),
@@ -2,7 +2,51 @@
 Sentiment Model for Influence Analysis
 """
 
+import re
 from typing import List, Dict, Any
+import numpy as np
+
+from .._jit import JIT_KW, NUMBA_AVAILABLE, njit, prange
+
+# Simple keyword-based sentiment (placeholder)
+POSITIVE_WORDS = frozenset([
+    'happy', 'glad', 'excited', 'great', 'wonderful', 'amazing', 'love',
+    'enjoyed', 'fun', 'good', 'better', 'best', 'proud', 'grateful',
+    'thankful', 'blessed', 'lucky', 'pleased', 'satisfied', 'content'
+])
+
+NEGATIVE_WORDS = frozenset([
+    'sad', 'angry', 'frustrated', 'disappointed', 'upset', 'worried',
+    'anxious', 'stressed', 'tired', 'exhausted', 'bad', 'worse', 'worst',
+    'hate', 'regret', 'guilty', 'ashamed', 'embarrassed', 'hurt', 'pain'
+])
+
+_TOKEN_RE = re.compile(r"[a-z']+")
+
+# +1/-1 contribution of each keyword, for the batch kernel
+_WORD_POLARITY = {**dict.fromkeys(POSITIVE_WORDS, 1), **dict.fromkeys(NEGATIVE_WORDS, -1)}
+
+# Below this many texts thread start-up costs more than scoring serially
+JIT_MIN_SIZE = 1024
+
+
+@njit(parallel=True, **JIT_KW)
+def _score_kernel(polarities, offsets):
+    # Row i owns polarities[offsets[i]:offsets[i + 1]] (CSR layout); rows are independent
+    n = offsets.shape[0] - 1
+    scores = np.zeros(n)
+    for i in prange(n):
+        positive_count = 0
+        negative_count = 0
+        for k in range(offsets[i], offsets[i + 1]):
+            if polarities[k] > 0:
+                positive_count += 1
+            else:
+                negative_count += 1
+        total = positive_count + negative_count
+        if total > 0:
+            scores[i] = (positive_count - negative_count) / total
+    return scores
 
 
 def analyze_sentiment(text: str) -> float:
@@ -12,23 +56,11 @@ def analyze_sentiment(text: str) -> float:
     
     TODO: Replace with actual ML model (e.g., VADER, TextBlob, or custom model)
     """
-    text_lower = text.lower()
-    
-    # Simple keyword-based sentiment (placeholder)
-    positive_words = [
-        'happy', 'glad', 'excited', 'great', 'wonderful', 'amazing', 'love',
-        'enjoyed', 'fun', 'good', 'better', 'best', 'proud', 'grateful',
-        'thankful', 'blessed', 'lucky', 'pleased', 'satisfied', 'content'
-    ]
+    # Whole-word matches only, so e.g. "painting" no longer counts as "pain"
+    tokens = set(_TOKEN_RE.findall(text.lower()))
     
-    negative_words = [
-        'sad', 'angry', 'frustrated', 'disappointed', 'upset', 'worried',
-        'anxious', 'stressed', 'tired', 'exhausted', 'bad', 'worse', 'worst',
-        'hate', 'regret', 'guilty', 'ashamed', 'embarrassed', 'hurt', 'pain'
-    ]
-    
-    positive_count = sum(1 for word in positive_words if word in text_lower)
-    negative_count = sum(1 for word in negative_words if word in text_lower)
+    positive_count = len(tokens & POSITIVE_WORDS)
+    negative_count = len(tokens & NEGATIVE_WORDS)
     
     if positive_count == 0 and negative_count == 0:
         return 0.0
@@ -43,7 +75,21 @@ def analyze_sentiment_batch(texts: List[str]) -> List[float]:
     """
     Analyze sentiment for multiple texts
     """
-    return [analyze_sentiment(text) for text in texts]
+    if not NUMBA_AVAILABLE or len(texts) < JIT_MIN_SIZE:
+        return [analyze_sentiment(text) for text in texts]
+    
+    # Tokenize serially into one flat polarity array, then score rows in parallel
+    polarities = []
+    offsets = [0]
+    for text in texts:
+        for token in set(_TOKEN_RE.findall(text.lower())):
+            polarity = _WORD_POLARITY.get(token)
+            if polarity is not None:
+                polarities.append(polarity)
+        offsets.append(len(polarities))
+    
+    scores = _score_kernel(np.array(polarities, dtype=np.int8), np.array(offsets, dtype=np.int64))
+    return scores.tolist()
 
 
 def handle(**kwargs) -> Dict[str, Any]:
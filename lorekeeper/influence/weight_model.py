@@ -3,8 +3,28 @@ Influence Weight Model
 Calculates weighted influence scores based on frequency, recency, and impact
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Union
 from datetime import datetime, timedelta
+import warnings
+import numpy as np
+
+
+def _most_recent(timestamps: List[str]) -> datetime:
+    """
+    Latest of the ISO timestamps, as a naive datetime in its own wall-clock time
+    
+    Naive and Z-suffixed values are parsed in one datetime64 conversion; explicit
+    offsets fall back to per-row fromisoformat so they compare in absolute time.
+    """
+    try:
+        with warnings.catch_warnings():
+            # numpy only warns on explicit offsets; treat them as a fallback signal
+            warnings.simplefilter('error')
+            parsed = np.array([t[:-1] if t.endswith('Z') else t for t in timestamps], dtype='datetime64[us]')
+        return parsed.max().astype(datetime)
+    except (ValueError, UserWarning, DeprecationWarning):
+        most_recent = max(datetime.fromisoformat(t.replace('Z', '+00:00')) for t in timestamps)
+        return most_recent.replace(tzinfo=None)
 
 
 def calculate_influence_weight(
@@ -39,24 +59,19 @@ def calculate_influence_weight(
     frequency_weight = min(1.0, len(events) / 20.0)  # Normalize to 0-1
     
     # Recency weight (more recent = higher weight)
-    if events:
-        most_recent = max(
-            datetime.fromisoformat(e.get('timestamp', '').replace('Z', '+00:00'))
-            for e in events
-            if e.get('timestamp')
-        )
-        days_ago = (current_date - most_recent.replace(tzinfo=None)).days
+    timestamps = [e['timestamp'] for e in events if e.get('timestamp')]
+    if timestamps:
+        days_ago = (current_date - _most_recent(timestamps)).days
         recency_weight = max(0.0, 1.0 - (days_ago / 90.0))  # Decay over 90 days
     else:
         recency_weight = 0.0
     
     # Impact weight (average absolute sentiment)
-    sentiments = [
-        abs(e.get('sentiment', 0.0))
-        for e in events
-        if e.get('sentiment') is not None
-    ]
-    impact_weight = sum(sentiments) / len(sentiments) if sentiments else 0.0
+    sentiments = np.fromiter(
+        (e['sentiment'] for e in events if e.get('sentiment') is not None),
+        dtype=np.float64,
+    )
+    impact_weight = float(np.abs(sentiments).mean()) if sentiments.size else 0.0
     
     # Total weight (weighted combination)
     total_weight = (
@@ -108,6 +123,30 @@ def calculate_person_influence_score(
     return max(-1.0, min(1.0, weighted_score))
 
 
+def calculate_person_influence_score_batch(
+    emotional_impact: np.ndarray,
+    behavioral_impact: np.ndarray,
+    toxicity_score: np.ndarray,
+    uplift_score: np.ndarray,
+    weight: Union[float, np.ndarray] = 1.0
+) -> np.ndarray:
+    """
+    Vectorized calculate_person_influence_score over arrays of people
+    
+    Returns:
+        Array of final influence scores (-1 to +1); NaN scores map to 1.0 as in the scalar path
+    """
+    base_score = (
+        np.asarray(emotional_impact, dtype=np.float64) * 0.4 +
+        np.asarray(behavioral_impact, dtype=np.float64) * 0.4 -
+        np.asarray(toxicity_score, dtype=np.float64) * 0.6 +
+        np.asarray(uplift_score, dtype=np.float64) * 0.3
+    )
+    weighted_score = base_score * weight
+    # max(-1.0, min(1.0, nan)) is 1.0 in the scalar path, while np.clip keeps NaN
+    return np.where(np.isnan(weighted_score), 1.0, np.clip(weighted_score, -1.0, 1.0))
+
+
 def handle(**kwargs) -> Dict[str, Any]:
     """
     Handle function for Python bridge
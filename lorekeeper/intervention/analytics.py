@@ -19,14 +19,18 @@ def analyze(events: List[Dict[str, Any]]) -> Dict[str, Any]:
     from .drift import detect_drift
     from .anomaly import detect_anomalies
     from .patterns import detect_patterns
+    from .features import build_features
 
     interventions = []
     
+    # Extract features once; every detector reads the same columnar bundle
+    features = build_features(events)
+    
     # Run all detection modules
-    interventions.extend(detect_spirals(events))
-    interventions.extend(detect_drift(events))
-    interventions.extend(detect_anomalies(events))
-    interventions.extend(detect_patterns(events))
+    interventions.extend(detect_spirals(features))
+    interventions.extend(detect_drift(features))
+    interventions.extend(detect_anomalies(features))
+    interventions.extend(detect_patterns(features))
 
     return {
         "interventions": interventions
@@ -2,54 +2,108 @@
 Anomaly Detection
 """
 
-from typing import List, Dict, Any
+from collections import OrderedDict
+import copy
+from typing import List, Dict, Any, Union
+import hashlib
+import threading
 import numpy as np
 from sklearn.ensemble import IsolationForest
 
+from .features import FeatureBundle, as_features
 
-def detect_anomalies(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+# Fitted forests keyed by a digest of the matrix they last scored; when new events
+# are appended to a cached history the forest is reused as-is until REFIT_ROWS rows
+# have arrived since its last fit, then grown (warm start) instead of rebuilt
+MODEL_CACHE_SIZE = 8
+REFIT_ROWS = 50
+GROWTH_ESTIMATORS = 20
+MAX_ESTIMATORS = 300
+_model_cache: "OrderedDict[bytes, tuple]" = OrderedDict()
+_model_cache_lock = threading.Lock()
+
+
+def _digest(X: np.ndarray) -> bytes:
+    return hashlib.blake2b(X.tobytes() + repr(X.shape).encode(), digest_size=16).digest()
+
+
+def _fitted_forest(X: np.ndarray) -> IsolationForest:
+    """Return an IsolationForest fitted on X (or a recent prefix of it), reusing or growing a cached one.
+
+    Cached forests are never modified once published, so callers may predict with them
+    outside the lock; growth happens on a private copy and fitting runs unlocked.
+    """
+    key = _digest(X)
+    with _model_cache_lock:
+        if key in _model_cache:
+            _model_cache.move_to_end(key)
+            return _model_cache[key][1]
+        candidates = list(reversed(_model_cache.items()))
+    
+    # Near hit: a cached forest seen on a prefix of X is reused or grown
+    base = None
+    base_key = None
+    grow = False
+    fitted_rows = len(X)
+    for prefix_key, (n_rows, cached, cached_fitted_rows) in candidates:
+        if n_rows < len(X) and _digest(X[:n_rows]) == prefix_key:
+            if len(X) - cached_fitted_rows < REFIT_ROWS:
+                base, base_key, fitted_rows = cached, prefix_key, cached_fitted_rows
+            elif cached.n_estimators + GROWTH_ESTIMATORS <= MAX_ESTIMATORS:
+                base, base_key, grow = cached, prefix_key, True
+            break
+    
+    if base is None:
+        clf = IsolationForest(n_estimators=100, contamination=0.1, n_jobs=-1, warm_start=True, random_state=42)
+        clf.fit(X)
+    elif grow:
+        clf = copy.deepcopy(base)
+        clf.set_params(n_estimators=clf.n_estimators + GROWTH_ESTIMATORS)
+        clf.fit(X)
+    else:
+        clf = base
+    
+    with _model_cache_lock:
+        if base_key is not None:
+            _model_cache.pop(base_key, None)
+        _model_cache[key] = (len(X), clf, fitted_rows)
+        _model_cache.move_to_end(key)
+        if len(_model_cache) > MODEL_CACHE_SIZE:
+            _model_cache.popitem(last=False)
+    return clf
+
+
+def detect_anomalies(events: Union[List[Dict[str, Any]], FeatureBundle]) -> List[Dict[str, Any]]:
     """
     Detect anomalies using embeddings
     
     TODO: Implement Isolation Forest or autoencoder-based anomaly detection
     """
     interventions = []
+    features = as_features(events)
     
-    if len(events) < 10:
+    if features.n_events < 10:
         return interventions
     
-    # Extract embeddings
-    embeddings = []
-    valid_events = []
-    
-    for event in events:
-        if 'embedding' in event and event['embedding']:
-            embeddings.append(event['embedding'])
-            valid_events.append(event)
-    
-    if len(embeddings) < 10:
+    if len(features.embeddings) < 10:
         return interventions
     
     try:
-        # Use Isolation Forest for anomaly detection
-        X = np.array(embeddings)
-        clf = IsolationForest(contamination=0.1, random_state=42)
-        predictions = clf.fit_predict(X)
+        # Use Isolation Forest for anomaly detection; it works in float32 internally,
+        # so the bundle's float32 matrix is used without conversion
+        X = features.embeddings
+        clf = _fitted_forest(X)
         
-        # Find anomalies (predictions == -1)
-        anomalies = [valid_events[i] for i, pred in enumerate(predictions) if pred == -1]
+        # Only the two most recent entries are inspected, so only they are scored
+        recent_anomalies = clf.predict(X[-2:]) == -1
         
-        if len(anomalies) > 0:
-            # Check if anomalies are recent
-            recent_anomalies = [a for a in anomalies if a == valid_events[-1] or a == valid_events[-2]]
-            
-            if recent_anomalies:
-                interventions.append({
-                    "type": "risk_event",
-                    "severity": "high",
-                    "confidence": 0.8,
-                    "message": "Detected anomalous pattern in recent entries that may require attention.",
-                })
+        if recent_anomalies.any():
+            interventions.append({
+                "type": "risk_event",
+                "severity": "high",
+                "confidence": 0.8,
+                "message": "Detected anomalous pattern in recent entries that may require attention.",
+            })
     except Exception as e:
         # Silently fail if ML libraries not available
         pass
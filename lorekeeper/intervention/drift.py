@@ -2,44 +2,47 @@
 Semantic Drift Detection
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Union
 import numpy as np
 
+from .features import FeatureBundle, as_features
 
-def detect_drift(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+# Centroid shift, in multiples of what sampling noise alone would produce
+DRIFT_RATIO_THRESHOLD = 3.0
+
+
+def detect_drift(events: Union[List[Dict[str, Any]], FeatureBundle]) -> List[Dict[str, Any]]:
     """
     Detect semantic drift in content
     
     TODO: Implement embedding-based drift detection
     """
     interventions = []
+    features = as_features(events)
     
-    if len(events) < 5:
+    if features.n_events < 5:
         return interventions
     
     # Placeholder: Check for embedding drift
-    embeddings = []
-    for event in events:
-        if 'embedding' in event and event['embedding']:
-            embeddings.append(event['embedding'])
-    
-    if len(embeddings) >= 5:
-        # Calculate centroid drift
-        first_half = np.array(embeddings[:len(embeddings)//2])
-        second_half = np.array(embeddings[len(embeddings)//2:])
-        
-        first_centroid = np.mean(first_half, axis=0)
-        second_centroid = np.mean(second_half, axis=0)
+    if len(features.embeddings) >= 5:
+        # Center on the pooled mean so the shared embedding direction (which gives
+        # raw centroids a large positive cosine regardless of content) drops out;
+        # the bundle is shared with other detectors, so center a copy
+        X = features.embeddings - features.embeddings.mean(axis=0, keepdims=True)
+        mid = len(X) // 2
+        first_centroid = X[:mid].mean(axis=0)
+        second_centroid = X[mid:].mean(axis=0)
         
-        # Cosine similarity
-        dot_product = np.dot(first_centroid, second_centroid)
-        norm1 = np.linalg.norm(first_centroid)
-        norm2 = np.linalg.norm(second_centroid)
+        # Centered centroids of two halves are always antiparallel, so compare the
+        # shift between them against the spread expected from sampling noise
+        shift = float(np.sum((second_centroid - first_centroid) ** 2))
+        within = float(np.sum((X[:mid] - first_centroid) ** 2) + np.sum((X[mid:] - second_centroid) ** 2)) / (len(X) - 2)
+        expected_shift = within * (1.0 / mid + 1.0 / (len(X) - mid))
         
-        if norm1 > 0 and norm2 > 0:
-            similarity = dot_product / (norm1 * norm2)
+        if expected_shift > 0:
+            drift_ratio = shift / expected_shift
             
-            if similarity < 0.6:  # Significant drift
+            if drift_ratio > DRIFT_RATIO_THRESHOLD:  # Significant drift
                 interventions.append({
                     "type": "identity_drift",
                     "severity": "medium",
@@ -0,0 +1,73 @@
+"""
+Intervention Features
+Column-wise (SoA) view of an event batch, extracted once for all detectors
+"""
+
+from dataclasses import dataclass
+from typing import List, Dict, Any, Union
+import re
+import numpy as np
+
+# Detectors that look at recent behaviour only inspect this many trailing events
+RECENT_WINDOW = 10
+
+NEGATIVE_KEYWORDS = ['stress', 'anxiety', 'worry', 'frustrated', 'angry', 'sad', 'depressed']
+
+# One alternation scanned once per content string instead of a substring search per keyword
+_NEGATIVE_RE = re.compile('|'.join(map(re.escape, NEGATIVE_KEYWORDS)), re.IGNORECASE)
+
+
+@dataclass
+class FeatureBundle:
+    """Parallel arrays over an event batch"""
+    n_events: int
+    embeddings: np.ndarray
+    recent_sentiments: np.ndarray
+    recent_negative: np.ndarray
+
+
+def _sentiment(event: Dict[str, Any]) -> float:
+    """Event sentiment from the event or its metadata, NaN when absent or not numeric (e.g. a label)"""
+    if 'sentiment' in event:
+        value = event['sentiment']
+    elif 'metadata' in event and 'sentiment' in event['metadata']:
+        value = event['metadata']['sentiment']
+    else:
+        return np.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _mentions_negative(content: str) -> bool:
+    return _NEGATIVE_RE.search(content) is not None
+
+
+def build_features(events: List[Dict[str, Any]]) -> FeatureBundle:
+    """
+    Extract the per-event features every intervention detector needs, in one pass
+
+    Args:
+        events: List of events with id, timestamp, content, embedding
+
+    Returns:
+        FeatureBundle with a float32 (N, D) embedding matrix of events that have one,
+        and sentiment (NaN when missing) / negative-keyword columns over the recent window
+    """
+    embeddings = [event['embedding'] for event in events if event.get('embedding')]
+    recent = events[-RECENT_WINDOW:]
+
+    return FeatureBundle(
+        n_events=len(events),
+        embeddings=np.asarray(embeddings, dtype=np.float32) if embeddings else np.empty((0, 0), dtype=np.float32),
+        recent_sentiments=np.fromiter((_sentiment(event) for event in recent), dtype=np.float64, count=len(recent)),
+        recent_negative=np.fromiter(
+            (_mentions_negative(event.get('content', '')) for event in recent), dtype=bool, count=len(recent)
+        ),
+    )
+
+
+def as_features(events: Union[List[Dict[str, Any]], FeatureBundle]) -> FeatureBundle:
+    """Accept either raw events or an already-built bundle"""
+    return events if isinstance(events, FeatureBundle) else build_features(events)
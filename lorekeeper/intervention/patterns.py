@@ -2,33 +2,30 @@
 Behavior Pattern Detection
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Union
 from collections import Counter
 
+from .features import FeatureBundle, as_features
 
-def detect_patterns(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+
+def detect_patterns(events: Union[List[Dict[str, Any]], FeatureBundle]) -> List[Dict[str, Any]]:
     """
     Detect negative behavioral patterns
     
     TODO: Implement sequence mining or HMM-based pattern detection
     """
     interventions = []
+    features = as_features(events)
     
-    if len(events) < 5:
+    if features.n_events < 5:
         return interventions
     
     # Placeholder: Basic pattern detection
-    # Extract keywords or topics from events
-    negative_keywords = ['stress', 'anxiety', 'worry', 'frustrated', 'angry', 'sad', 'depressed']
-    
-    negative_count = 0
-    for event in events[-10:]:  # Last 10 events
-        content = event.get('content', '').lower()
-        if any(keyword in content for keyword in negative_keywords):
-            negative_count += 1
+    # Negative-keyword flags over the last 10 events come precomputed in the bundle
+    negative_count = int(features.recent_negative.sum())
     
     # If more than 50% of recent entries contain negative keywords
-    if negative_count > len(events[-10:]) * 0.5:
+    if negative_count > len(features.recent_negative) * 0.5:
         interventions.append({
             "type": "negative_pattern",
             "severity": "medium",
@@ -2,42 +2,68 @@
 Mood Spiral Detection
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Union
+import numpy as np
 
+from .._jit import JIT_KW, NUMBA_AVAILABLE, njit
+from .features import FeatureBundle, as_features
 
-def detect_spirals(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+
+# fastmath assumes no NaNs and would fold away the missing-sentiment check
+@njit(**{**JIT_KW, "fastmath": False})
+def _decline_kernel(sentiments):
+    """Average decline over the last three non-NaN sentiments, 0.0 unless strictly decreasing."""
+    found = 0
+    newest = middle = oldest = 0.0
+    for i in range(len(sentiments) - 1, -1, -1):
+        value = sentiments[i]
+        if value != value:
+            continue
+        found += 1
+        if found == 1:
+            newest = value
+        elif found == 2:
+            middle = value
+        else:
+            oldest = value
+            break
+    if found < 3 or not (middle < oldest and newest < middle):
+        return 0.0
+    return (oldest - newest) / 3.0
+
+
+def detect_spirals(events: Union[List[Dict[str, Any]], FeatureBundle]) -> List[Dict[str, Any]]:
     """
     Detect mood spirals using ML-based analysis
     
     TODO: Implement HMM or LSTM-based mood spiral detection
     """
     interventions = []
+    features = as_features(events)
     
     # Placeholder: Basic sentiment trend analysis
-    if len(events) < 3:
+    if features.n_events < 3:
         return interventions
     
-    # Extract sentiment from events (if available)
-    sentiments = []
-    for event in events[-10:]:  # Last 10 events
-        # Try to extract sentiment from metadata or calculate from content
-        if 'sentiment' in event:
-            sentiments.append(event['sentiment'])
-        elif 'metadata' in event and 'sentiment' in event['metadata']:
-            sentiments.append(event['metadata']['sentiment'])
+    # Sentiment of the last 10 events (event or metadata), NaN where unavailable
+    if NUMBA_AVAILABLE:
+        avg_decline = float(_decline_kernel(features.recent_sentiments))
+    else:
+        avg_decline = 0.0
+        sentiments = features.recent_sentiments[~np.isnan(features.recent_sentiments)]
+        if len(sentiments) >= 3:
+            # Check for downward trend
+            recent = sentiments[-3:]
+            if (np.diff(recent) < 0).all():
+                avg_decline = float(recent[0] - recent[-1]) / len(recent)
     
-    if len(sentiments) >= 3:
-        # Check for downward trend
-        recent = sentiments[-3:]
-        if all(recent[i] < recent[i-1] for i in range(1, len(recent))):
-            avg_decline = (recent[0] - recent[-1]) / len(recent)
-            if avg_decline > 0.3:
-                interventions.append({
-                    "type": "mood_spiral",
-                    "severity": "high" if avg_decline > 0.5 else "medium",
-                    "confidence": 0.75,
-                    "message": "Detected declining mood trajectory over recent entries.",
-                })
+    if avg_decline > 0.3:
+        interventions.append({
+            "type": "mood_spiral",
+            "severity": "high" if avg_decline > 0.5 else "medium",
+            "confidence": 0.75,
+            "message": "Detected declining mood trajectory over recent entries.",
+        })
     
     return interventions
 
@@ -6,6 +6,18 @@ Groups legacy signals into long-term themes
 from typing import List, Dict, Any
 from collections import defaultdict
 from datetime import datetime
+import re
+import numpy as np
+
+# Common legacy keywords
+LEGACY_KEYWORDS = (
+    'legacy', 'remembered', 'forever', 'lasting', 'impact', 'influence',
+    'purpose', 'meaning', 'heritage', 'tradition', 'teaching', 'mentoring',
+    'creating', 'building', 'sharing', 'passing on'
+)
+
+# Lookahead so overlapping keywords are all found in a single sweep
+_LEGACY_RE = re.compile('(?=(' + '|'.join(map(re.escape, LEGACY_KEYWORDS)) + '))')
 
 
 def cluster(signals: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -20,30 +32,33 @@ def cluster(signals: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     clusters = []
     
-    # Group by domain first
+    # Group by domain first, lowercasing each text once as it is grouped
     domain_groups = defaultdict(list)
+    domain_texts = defaultdict(list)
     for signal in signals:
         domain = signal.get('domain', 'other')
         domain_groups[domain].append(signal)
+        domain_texts[domain].append(signal.get('text', '').lower())
     
     # Create clusters from domain groups
     cluster_id = 0
     for domain, domain_signals in domain_groups.items():
         if len(domain_signals) >= 2:
             # Extract keywords from signals
-            keywords = extract_keywords([s.get('text', '') for s in domain_signals])
+            keywords = _keywords_in(' '.join(domain_texts[domain]))
             
             # Calculate significance
             significance = calculate_significance(domain_signals)
             
+            signal_ids = [s.get('id') for s in domain_signals]
             clusters.append({
                 "id": f"cluster_{cluster_id}",
                 "theme": f"{domain.title()} Legacy",
                 "keywords": keywords,
                 "significance": significance,
                 "domain": domain,
-                "signal_ids": [s.get('id') for s in domain_signals],
-                "signalIds": [s.get('id') for s in domain_signals],
+                "signal_ids": signal_ids,
+                "signalIds": list(signal_ids),
             })
             cluster_id += 1
     
@@ -54,20 +69,14 @@ def extract_keywords(texts: List[str]) -> List[str]:
     """
     Extract keywords from texts
     """
-    keywords = []
-    
-    # Common legacy keywords
-    legacy_keywords = [
-        'legacy', 'remembered', 'forever', 'lasting', 'impact', 'influence',
-        'purpose', 'meaning', 'heritage', 'tradition', 'teaching', 'mentoring',
-        'creating', 'building', 'sharing', 'passing on'
-    ]
-    
+    return _keywords_in(' '.join(texts).lower())
+
+
+def _keywords_in(text_combined: str) -> List[str]:
+    """extract_keywords over texts already joined and lowercased"""
     # Check which keywords appear in texts
-    text_combined = ' '.join(texts).lower()
-    for keyword in legacy_keywords:
-        if keyword in text_combined:
-            keywords.append(keyword)
+    found = set(_LEGACY_RE.findall(text_combined))
+    keywords = [keyword for keyword in LEGACY_KEYWORDS if keyword in found]
     
     # Add domain-specific keywords
     if 'tech' in text_combined or 'code' in text_combined or 'software' in text_combined:
@@ -89,10 +98,13 @@ def calculate_significance(signals: List[Dict[str, Any]]) -> float:
     if not signals:
         return 0.0
     
-    positive = sum(1 for s in signals if s.get('direction', 1) == 1)
-    negative = sum(1 for s in signals if s.get('direction', 1) == -1)
+    directions = np.fromiter((s.get('direction', 1) for s in signals), dtype=np.float64, count=len(signals))
+    intensities = np.fromiter((s.get('intensity', 0) for s in signals), dtype=np.float64, count=len(signals))
+    
+    positive = int(np.count_nonzero(directions == 1))
+    negative = int(np.count_nonzero(directions == -1))
     
-    avg_intensity = sum(s.get('intensity', 0) for s in signals) / len(signals)
+    avg_intensity = float(intensities.mean())
     
     # Significance based on signal count, intensity, and direction
     direction_score = (positive - negative) / len(signals)
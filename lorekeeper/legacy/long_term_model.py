@@ -8,6 +8,10 @@ from datetime import datetime, timedelta
 import numpy as np
 
 
+def _by_timestamp(trajectory_points: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return sorted(trajectory_points, key=lambda p: p.get('timestamp', ''))
+
+
 def model_progression(trajectory_points: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     Model long-term legacy progression
@@ -18,16 +22,18 @@ def model_progression(trajectory_points: List[Dict[str, Any]]) -> Dict[str, Any]
     Returns:
         Dictionary with progression analysis
     """
-    if not trajectory_points or len(trajectory_points) < 2:
+    return _model_progression_sorted(_by_timestamp(trajectory_points or []))
+
+
+def _model_progression_sorted(sorted_points: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """model_progression over points already sorted by timestamp"""
+    if len(sorted_points) < 2:
         return {
             "trend": "insufficient_data",
             "projected_significance": 0.0,
             "growth_rate": 0.0
         }
     
-    # Sort by timestamp
-    sorted_points = sorted(trajectory_points, key=lambda p: p.get('timestamp', ''))
-    
     # Extract values
     significances = [p.get('significance', 0) for p in sorted_points]
     
@@ -35,12 +41,12 @@ def model_progression(trajectory_points: List[Dict[str, Any]]) -> Dict[str, Any]
     x = np.arange(len(significances))
     y = np.array(significances)
     
-    # Linear regression
+    # Linear regression; x is 0..n-1, so its sums have exact integer closed forms
     n = len(x)
-    sum_x = np.sum(x)
+    sum_x = n * (n - 1) // 2
     sum_y = np.sum(y)
-    sum_xy = np.sum(x * y)
-    sum_x_squared = np.sum(x ** 2)
+    sum_xy = np.dot(x, y)
+    sum_x_squared = (n - 1) * n * (2 * n - 1) // 6
     
     denominator = n * sum_x_squared - sum_x ** 2
     if denominator == 0:
@@ -77,28 +83,29 @@ def detect_legacy_phases(trajectory_points: List[Dict[str, Any]]) -> List[Dict[s
     
     TODO: Implement phase detection (foundation, growth, maturity, decline)
     """
+    return _detect_phases_sorted(_by_timestamp(trajectory_points or []))
+
+
+def _detect_phases_sorted(sorted_points: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """detect_legacy_phases over points already sorted by timestamp"""
     phases = []
     
-    if not trajectory_points or len(trajectory_points) < 3:
+    if len(sorted_points) < 3:
         return phases
     
     # Simple phase detection based on trend changes
-    sorted_points = sorted(trajectory_points, key=lambda p: p.get('timestamp', ''))
-    significances = [p.get('significance', 0) for p in sorted_points]
-    
-    # Detect phase transitions
-    for i in range(1, len(significances) - 1):
-        prev = significances[i - 1]
-        curr = significances[i]
-        next_val = significances[i + 1]
-        
-        # Phase transition if trend changes
-        if (prev < curr < next_val) or (prev > curr > next_val):
-            phases.append({
-                "timestamp": sorted_points[i].get('timestamp'),
-                "type": "growth" if curr > prev else "decline",
-                "significance": float(curr)
-            })
+    significances = np.array([p.get('significance', 0) for p in sorted_points], dtype=np.float64)
+    
+    # Detect phase transitions: point i continues a strict rise or fall through i-1 and i+1
+    d = np.diff(significances)
+    rising = (d[:-1] > 0) & (d[1:] > 0)
+    falling = (d[:-1] < 0) & (d[1:] < 0)
+    for i in np.flatnonzero(rising | falling) + 1:
+        phases.append({
+            "timestamp": sorted_points[i].get('timestamp'),
+            "type": "growth" if rising[i - 1] else "decline",
+            "significance": float(significances[i])
+        })
     
     return phases
 
@@ -109,8 +116,10 @@ def handle(**kwargs) -> Dict[str, Any]:
     """
     trajectory_points = kwargs.get("trajectory_points", [])
     
-    progression = model_progression(trajectory_points)
-    phases = detect_legacy_phases(trajectory_points)
+    # Both analyses walk the points in time order; sort once and share
+    sorted_points = _by_timestamp(trajectory_points or [])
+    progression = _model_progression_sorted(sorted_points)
+    phases = _detect_phases_sorted(sorted_points)
     
     return {
         "progression": progression,
@@ -2,23 +2,62 @@
 from __future__ import annotations
 
 import json
+import time
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
 from datetime import date, datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from ..event_schema import TimelineEvent
 
 UTC = timezone.utc
 
+_EPIC_TAGS: Dict[str, str] = {
+    "robotics": "Robotics: Omega-1",
+    "omega1": "Robotics: Omega-1",
+    "japanese": "Japanese Language",
+    "bjj": "Brazilian Jiu-Jitsu",
+    "finances": "Finances",
+    "relationships": "Relationships",
+    "health": "Health",
+    "career": "Career",
+}
+
+
+def _counts(codes: Dict[str, int], ids: List[int]) -> Dict[str, int]:
+    """Histogram of interned ids, keyed by name in first-seen order."""
+    counts = np.bincount(np.asarray(ids, dtype=np.intp), minlength=len(codes))
+    return {name: int(counts[code]) for name, code in codes.items()}
+
 
 class MonthlyArcEngine:
     """Compose and render monthly arcs from timeline, tasks, and narrative systems."""
 
+    # Weeks are independent, so the weekly arc engine is called for them concurrently;
+    # set to False for engines that are not thread-safe
+    parallel_weekly_arcs = True
+    MAX_WEEK_WORKERS = 8
+    # Full archived timeline fetched by standalone drift audits is reused within this window
+    ARCHIVED_TTL_SECONDS = 60
+
     def __init__(self, timeline_manager, weekly_arc_engine, narrative_stitcher, task_engine, drift_auditor):
         self.timeline_manager = timeline_manager
         self.weekly_arc_engine = weekly_arc_engine
         self.narrative_stitcher = narrative_stitcher
         self.task_engine = task_engine
         self.drift_auditor = drift_auditor
+        # Timeline fetches keyed by query, only live while construct_month_arc runs
+        self._events_cache: Optional[Dict[Tuple[Tuple[str, Any], ...], List[TimelineEvent]]] = None
+        self._archived_cache: Optional[Tuple[int, List[TimelineEvent]]] = None
 
     # ------------------------------------------------------------------
     # Helpers
@@ -61,21 +100,48 @@ class MonthlyArcEngine:
 
         return start, end
 
-    def _week_ranges(self, start: date, end: date, events: Sequence[TimelineEvent]) -> List[Tuple[str, date, date, List[TimelineEvent]]]:
-        weeks: List[Tuple[str, date, date, List[TimelineEvent]]] = []
+    def _get_events(self, **query: Any) -> List[TimelineEvent]:
+        if self._events_cache is None:
+            return self.timeline_manager.get_events(**query)
+        key = tuple(sorted(query.items()))
+        if key not in self._events_cache:
+            self._events_cache[key] = self.timeline_manager.get_events(**query)
+        return self._events_cache[key]
+
+    def _get_archived_events(self) -> List[TimelineEvent]:
+        bucket = int(time.time() // self.ARCHIVED_TTL_SECONDS)
+        if self._archived_cache is None or self._archived_cache[0] != bucket:
+            self._archived_cache = (bucket, self._get_events(include_archived=True))
+        return list(self._archived_cache[1])
+
+    def _sorted_dates(self, events: Sequence[TimelineEvent]) -> Tuple[List[str], List[int]]:
+        dates = [event.date for event in events]
+        order = sorted(range(len(events)), key=dates.__getitem__)
+        sorted_dates = [dates[i] for i in order]
+        return sorted_dates, order
+
+    def _week_bounds(self, start: date, end: date) -> List[Tuple[str, date, date]]:
+        bounds: List[Tuple[str, date, date]] = []
         cursor = start
         week_index = 1
         while cursor <= end:
             week_end = min(cursor + timedelta(days=6), end)
-            events_in_week = [
-                event
-                for event in events
-                if cursor.isoformat() <= getattr(event, "date", "") <= week_end.isoformat()
-            ]
             label = f"Week {week_index} ({cursor.isoformat()} to {week_end.isoformat()})"
-            weeks.append((label, cursor, week_end, events_in_week))
+            bounds.append((label, cursor, week_end))
             week_index += 1
             cursor = week_end + timedelta(days=1)
+        return bounds
+
+    def _week_ranges(self, start: date, end: date, events: Sequence[TimelineEvent]) -> List[Tuple[str, date, date, List[TimelineEvent]]]:
+        # Sort dates once and carve each week out by bisection instead of rescanning every event
+        sorted_dates, order = self._sorted_dates(events)
+        weeks: List[Tuple[str, date, date, List[TimelineEvent]]] = []
+        for label, w_start, w_end in self._week_bounds(start, end):
+            lo = bisect_left(sorted_dates, w_start.isoformat())
+            hi = bisect_right(sorted_dates, w_end.isoformat(), lo)
+            # Keep each week's events in their original order
+            events_in_week = [events[i] for i in sorted(order[lo:hi])]
+            weeks.append((label, w_start, w_end, events_in_week))
         return weeks
 
     def _safe_task_call(self, method_name: str) -> List[Any]:
@@ -93,29 +159,47 @@ class MonthlyArcEngine:
         """Load all events for the target month and compute quick statistics."""
 
         start, end = self._resolve_month_range(start_date, end_date)
-        events = self.timeline_manager.get_events(start_date=start.isoformat(), end_date=end.isoformat())
-
-        categories: Dict[str, int] = {}
-        tags: Dict[str, int] = {}
-        sentiment_summary: Dict[str, int] = {}
+        events = self._get_events(start_date=start.isoformat(), end_date=end.isoformat())
+
+        # Intern names to small ints and bucket weeks in one pass, then count each
+        # histogram with bincount
+        bounds = self._week_bounds(start, end)
+        week_starts = [w_start.isoformat() for _, w_start, _ in bounds]
+        week_ends = [w_end.isoformat() for _, _, w_end in bounds]
+        week_counts = [0] * len(bounds)
+        category_codes: Dict[str, int] = {}
+        tag_codes: Dict[str, int] = {}
+        sentiment_codes: Dict[str, int] = {}
+        category_ids: List[int] = []
+        tag_ids: List[int] = []
+        sentiment_ids: List[int] = []
 
         for event in events:
-            category = getattr(event, "type", "") or "uncategorized"
-            categories[category] = categories.get(category, 0) + 1
+            category = event.type or "uncategorized"
+            category_ids.append(category_codes.setdefault(category, len(category_codes)))
 
-            for tag in getattr(event, "tags", []) or []:
-                tags[tag] = tags.get(tag, 0) + 1
+            for tag in event.tags or []:
+                tag_ids.append(tag_codes.setdefault(tag, len(tag_codes)))
 
-            meta = getattr(event, "metadata", {}) or {}
+            meta = event.metadata or {}
             sentiment = meta.get("sentiment") or meta.get("tone") or "neutral"
-            sentiment_summary[sentiment] = sentiment_summary.get(sentiment, 0) + 1
+            sentiment_ids.append(sentiment_codes.setdefault(sentiment, len(sentiment_codes)))
+
+            # Weeks are contiguous, so the only candidate is the last one starting at or before the date
+            week = bisect_right(week_starts, event.date) - 1
+            if week >= 0 and event.date <= week_ends[week]:
+                week_counts[week] += 1
+
+        categories = _counts(category_codes, category_ids)
+        tags = _counts(tag_codes, tag_ids)
+        sentiment_summary = _counts(sentiment_codes, sentiment_ids)
 
         week_splits: Dict[str, Dict[str, Any]] = {}
-        for label, w_start, w_end, week_events in self._week_ranges(start, end, events):
+        for (label, _, _), w_start, w_end, count in zip(bounds, week_starts, week_ends, week_counts):
             week_splits[label] = {
-                "start": w_start.isoformat(),
-                "end": w_end.isoformat(),
-                "count": len(week_events),
+                "start": w_start,
+                "end": w_end,
+                "count": count,
             }
 
         return {
@@ -188,23 +272,31 @@ class MonthlyArcEngine:
         """Run the WeeklyArcEngine across each week in the month."""
 
         start, end = self._resolve_month_range(start_date, end_date)
-        month_events = events or self.timeline_manager.get_events(start_date=start.isoformat(), end_date=end.isoformat())
+        month_events = events or self._get_events(start_date=start.isoformat(), end_date=end.isoformat())
 
-        weekly_arcs: List[Dict[str, Any]] = []
-        for label, w_start, w_end, week_events in self._week_ranges(start, end, month_events):
-            weekly_arcs.append({
+        def build(week: Tuple[str, date, date, List[TimelineEvent]]) -> Dict[str, Any]:
+            label, w_start, w_end, week_events = week
+            return {
                 "week_label": label,
                 "arc": self._call_weekly_arc_engine(week_events, w_start, w_end),
-            })
-        return weekly_arcs
+            }
+
+        weeks = self._week_ranges(start, end, month_events)
+        if not self.parallel_weekly_arcs or len(weeks) < 2:
+            return [build(week) for week in weeks]
+        with ThreadPoolExecutor(max_workers=min(self.MAX_WEEK_WORKERS, len(weeks))) as executor:
+            return list(executor.map(build, weeks))
 
     def infer_monthly_themes(self, events: Sequence[TimelineEvent], weekly_arcs: Sequence[Dict[str, Any]]) -> List[str]:
         """Detect aggregated themes and motifs across the month."""
 
-        tag_counts: Dict[str, int] = {}
-        for event in events:
-            for tag in getattr(event, "tags", []) or []:
-                tag_counts[tag] = tag_counts.get(tag, 0) + 1
+        tag_codes: Dict[str, int] = {}
+        tag_ids = [
+            tag_codes.setdefault(tag, len(tag_codes))
+            for event in events
+            for tag in event.tags or []
+        ]
+        tag_counts = _counts(tag_codes, tag_ids)
 
         trending = [tag for tag, count in tag_counts.items() if count > 1]
         if not trending and tag_counts:
@@ -220,7 +312,7 @@ class MonthlyArcEngine:
 
         emotional_patterns = []
         for event in events:
-            meta = getattr(event, "metadata", {}) or {}
+            meta = event.metadata or {}
             mood = meta.get("sentiment") or meta.get("tone")
             if mood:
                 emotional_patterns.append(mood)
@@ -245,27 +337,16 @@ class MonthlyArcEngine:
     def detect_epic_progression(self, events: Sequence[TimelineEvent]) -> List[Dict[str, Any]]:
         """Cluster events by epic tags to track milestone progress."""
 
-        epic_tags = {
-            "robotics": "Robotics: Omega-1",
-            "omega1": "Robotics: Omega-1",
-            "japanese": "Japanese Language",
-            "bjj": "Brazilian Jiu-Jitsu",
-            "finances": "Finances",
-            "relationships": "Relationships",
-            "health": "Health",
-            "career": "Career",
-        }
-
         epic_events: Dict[str, List[TimelineEvent]] = {}
         for event in events:
-            for tag in getattr(event, "tags", []) or []:
-                if tag in epic_tags:
-                    epic_key = epic_tags[tag]
+            for tag in event.tags or []:
+                epic_key = _EPIC_TAGS.get(tag)
+                if epic_key is not None:
                     epic_events.setdefault(epic_key, []).append(event)
 
         epics: List[Dict[str, Any]] = []
         for epic, epic_group in epic_events.items():
-            milestones = [getattr(e, "title", "") for e in epic_group if getattr(e, "title", "")]
+            milestones = [e.title for e in epic_group if e.title]
             progress_note = f"{len(epic_group)} updates recorded."
             epics.append({"epic": epic, "progress": progress_note, "milestones": milestones})
 
@@ -294,7 +375,7 @@ class MonthlyArcEngine:
                             turning_points.append(str(tp))
 
         if not turning_points:
-            turning_points = [getattr(event, "title", "") for event in month_events[:3] if getattr(event, "title", "")]
+            turning_points = [event.title for event in month_events[:3] if event.title]
 
         return {
             "hook": stitched if isinstance(stitched, str) else getattr(stitched, "hook", ""),
@@ -306,9 +387,12 @@ class MonthlyArcEngine:
         }
 
     def run_monthly_drift_audit(self, events: Optional[List[TimelineEvent]] = None) -> Dict[str, Any]:
-        """Audit for drift issues across the monthly slice."""
+        """Audit for drift issues across the monthly slice.
+
+        Without ``events`` (direct external calls) the whole archived timeline is audited.
+        """
 
-        month_events = events or self.timeline_manager.get_events(include_archived=True)
+        month_events = events or self._get_archived_events()
         issues = self.drift_auditor.audit(month_events) if hasattr(self.drift_auditor, "audit") else []
         severity = "low"
         if len(issues) > 5:
@@ -322,8 +406,22 @@ class MonthlyArcEngine:
     def construct_month_arc(self, start_date: Optional[date | datetime | str] = None, end_date: Optional[date | datetime | str] = None) -> Dict[str, Any]:
         """Assemble the full monthly arc payload."""
 
+        # Share timeline fetches between the helpers for the duration of this build
+        self._events_cache = {}
+        try:
+            return self._construct_month_arc(start_date, end_date)
+        finally:
+            self._events_cache = None
+
+    def _construct_month_arc(self, start_date: Optional[date | datetime | str], end_date: Optional[date | datetime | str]) -> Dict[str, Any]:
         month_data = self.gather_month_events(start_date=start_date, end_date=end_date)
         events = month_data.get("events", [])
+        start, end = self._resolve_month_range(start_date, end_date)
+        time_window = f"{start.isoformat()} to {end.isoformat()}"
+
+        if not events:
+            return self._empty_arc_payload(time_window, month_data)
+
         weekly_arcs = self.synthesize_weekly_arcs(start_date=start_date, end_date=end_date, events=events)
         narrative = self.generate_month_narrative(events=events, weekly_arcs=weekly_arcs)
         themes = self.infer_monthly_themes(events, weekly_arcs)
@@ -331,9 +429,6 @@ class MonthlyArcEngine:
         drift = self.run_monthly_drift_audit(events)
         tasks = self.summarize_month_tasks()
 
-        start, end = self._resolve_month_range(start_date, end_date)
-        time_window = f"{start.isoformat()} to {end.isoformat()}"
-
         return {
             "time_window": time_window,
             "events": month_data,
@@ -345,6 +440,27 @@ class MonthlyArcEngine:
             "drift": drift,
         }
 
+    def _empty_arc_payload(self, time_window: str, month_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Arc for a month with no events: skip the event pipeline, tasks are still summarized."""
+
+        return {
+            "time_window": time_window,
+            "events": month_data,
+            "tasks": self.summarize_month_tasks(),
+            "weekly_arcs": [],
+            "narrative": {
+                "hook": "",
+                "arc": "",
+                "subplots": [],
+                "turning_points": [],
+                "climax": "",
+                "resolution": "Trajectory set for next month.",
+            },
+            "themes": ["No major themes detected."],
+            "epics": [],
+            "drift": {"issues": [], "severity": "low", "notes": "No drift detected."},
+        }
+
     def render_arc(self, template: str = "default", start_date: Optional[date | datetime | str] = None, end_date: Optional[date | datetime | str] = None) -> str:
         """Render the monthly arc in markdown, JSON, or HTML."""
 
@@ -352,6 +468,11 @@ class MonthlyArcEngine:
         from .monthly_templates import compressed_md_template, default_md_template
 
         if template == "json":
+            if ORJSON_AVAILABLE:
+                # orjson serializes TimelineEvent dataclasses natively; dates still go
+                # through _serialize so they render exactly as with stdlib json
+                option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+                return orjson.dumps(arc, default=self._serialize, option=option).decode("utf-8")
             return json.dumps(arc, default=self._serialize, indent=2)
         if template == "compressed":
             return compressed_md_template(arc)
@@ -362,7 +483,7 @@ class MonthlyArcEngine:
 
     def _serialize(self, obj: Any) -> Any:
         if isinstance(obj, TimelineEvent):
-            return obj.__dict__
+            return asdict(obj)
         return str(obj)
 
 
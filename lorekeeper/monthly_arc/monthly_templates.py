@@ -14,99 +14,75 @@ def default_md_template(arc: Dict[str, Any]) -> str:
     themes = arc.get("themes", [])
     epics = arc.get("epics", [])
     drift = arc.get("drift", {})
+    subplots = narrative.get("subplots")
+    turning_points = narrative.get("turning_points")
 
-    lines = [
-        f"# 🟣 Monthly Arc — {time_window}",
-        "",
-        "## 🔥 Opening Hook",
-        str(narrative.get("hook", "")),
-        "",
-        "## 📘 Month’s Main Arc",
-        str(narrative.get("arc", "")),
-        "",
-        "## 🧩 Subplots",
-    ]
-
-    for subplot in narrative.get("subplots", []) or []:
-        lines.append(f"- {subplot}")
-    if not narrative.get("subplots"):
-        lines.append("- None recorded.")
-
-    lines.extend([
-        "",
-        "## ⚡ Turning Points",
-    ])
-    for turning in narrative.get("turning_points", []) or []:
-        lines.append(f"- {turning}")
-    if not narrative.get("turning_points"):
-        lines.append("- No clear turning points identified.")
-
-    lines.extend([
-        "",
-        "## 🏁 Resolution",
-        str(narrative.get("resolution", "")),
-        "",
-        "---",
-        "",
-        "## 📅 Weekly Beats",
-    ])
-
+    # Build each repeated section as one block, then fill a single document f-string
+    weeks = []
     for week in weekly_arcs:
-        week_label = week.get("week_label", "Week")
         week_arc = week.get("arc", {})
         week_narrative = week_arc.get("narrative", {}) if isinstance(week_arc, dict) else {}
-        lines.append(f"### {week_label}")
-        lines.append(str(week_narrative.get("hook", week_arc if week_arc else "")))
-        lines.append(f"- {week_narrative.get('arc', '')}")
-    if not weekly_arcs:
-        lines.append("No weekly arcs available.")
-
-    lines.extend([
-        "",
-        "---",
-        "",
-        "## 📌 Tasks Summary",
-        f"- Completed: {tasks.get('completed', [])}",
-        f"- Overdue: {tasks.get('overdue', [])}",
-        f"- Priority: {tasks.get('priority', [])}",
-        f"- Efficiency Score: {tasks.get('efficiency_score', 0.0)}",
-        "",
-        "---",
-        "",
-        "## 🎭 Monthly Themes",
-    ])
-
-    for theme in themes:
-        lines.append(f"- {theme}")
-    if not themes:
-        lines.append("- No themes identified.")
-
-    lines.extend([
-        "",
-        "---",
-        "",
-        "## 🧵 Epics in Motion",
-    ])
+        weeks.append(
+            f"### {week.get('week_label', 'Week')}\n"
+            f"{week_narrative.get('hook', week_arc if week_arc else '')}\n"
+            f"- {week_narrative.get('arc', '')}"
+        )
 
+    epic_lines = []
     for epic in epics:
-        title = epic.get("epic", "Epic")
-        progress = epic.get("progress", "")
-        lines.append(f"### {title}")
-        lines.append(str(progress))
-        for milestone in epic.get("milestones", []) or []:
-            lines.append(f"- {milestone}")
-    if not epics:
-        lines.append("No epic progress detected.")
-
-    lines.extend([
-        "",
-        "---",
-        "",
-        "## ⚠️ Drift Auditor",
-        str(drift.get("notes", "")),
-    ])
-
-    return "\n".join(lines)
+        epic_lines.append(f"### {epic.get('epic', 'Epic')}\n{epic.get('progress', '')}")
+        epic_lines.extend([f"- {milestone}" for milestone in epic.get("milestones", []) or []])
+
+    subplots_block = "\n".join([f"- {subplot}" for subplot in subplots]) if subplots else "- None recorded."
+    turning_block = "\n".join([f"- {turning}" for turning in turning_points]) if turning_points else "- No clear turning points identified."
+    weeks_block = "\n".join(weeks) if weeks else "No weekly arcs available."
+    themes_block = "\n".join([f"- {theme}" for theme in themes]) if themes else "- No themes identified."
+    epics_block = "\n".join(epic_lines) if epic_lines else "No epic progress detected."
+
+    return f"""# 🟣 Monthly Arc — {time_window}
+
+## 🔥 Opening Hook
+{narrative.get("hook", "")}
+
+## 📘 Month’s Main Arc
+{narrative.get("arc", "")}
+
+## 🧩 Subplots
+{subplots_block}
+
+## ⚡ Turning Points
+{turning_block}
+
+## 🏁 Resolution
+{narrative.get("resolution", "")}
+
+---
+
+## 📅 Weekly Beats
+{weeks_block}
+
+---
+
+## 📌 Tasks Summary
+- Completed: {tasks.get("completed", [])}
+- Overdue: {tasks.get("overdue", [])}
+- Priority: {tasks.get("priority", [])}
+- Efficiency Score: {tasks.get("efficiency_score", 0.0)}
+
+---
+
+## 🎭 Monthly Themes
+{themes_block}
+
+---
+
+## 🧵 Epics in Motion
+{epics_block}
+
+---
+
+## ⚠️ Drift Auditor
+{drift.get("notes", "")}"""
 
 
 def compressed_md_template(arc: Dict[str, Any]) -> str:
@@ -117,14 +93,12 @@ def compressed_md_template(arc: Dict[str, Any]) -> str:
     tasks = arc.get("tasks", {})
     themes = arc.get("themes", [])
 
-    snippet = " ".join(
-        [
-            f"🟣 {time_window}",
-            f"Hook: {narrative.get('hook', '')}",
-            f"Arc: {narrative.get('arc', '')}",
-            f"Tasks✓ {len(tasks.get('completed', []))} ✅ / {len(tasks.get('overdue', []))} ❌",
-            f"Themes: {', '.join(themes) if themes else 'None'}",
-        ]
+    snippet = (
+        f"🟣 {time_window} "
+        f"Hook: {narrative.get('hook', '')} "
+        f"Arc: {narrative.get('arc', '')} "
+        f"Tasks✓ {len(tasks.get('completed', []))} ✅ / {len(tasks.get('overdue', []))} ❌ "
+        f"Themes: {', '.join(themes) if themes else 'None'}"
     )
     return snippet.strip()
 
@@ -11,8 +11,10 @@ from .monthly_templates import compressed_md_template, default_md_template
 class FakeTimelineManager:
     def __init__(self, events=None):
         self.events = events or []
+        self.get_events_calls = 0
 
     def get_events(self, start_date=None, end_date=None, include_archived=False, **_kwargs):
+        self.get_events_calls += 1
         filtered = []
         for event in self.events:
             if start_date and event.date < start_date:
@@ -22,7 +24,7 @@ class FakeTimelineManager:
             if not include_archived and getattr(event, "archived", False):
                 continue
             filtered.append(event)
-        return list(filtered)
+        return filtered
 
 
 class FakeWeeklyArcEngine:
@@ -60,7 +62,7 @@ class FakeDriftAuditor:
         self.audit_calls = []
 
     def audit(self, events):
-        self.audit_calls.append(list(events))
+        self.audit_calls.append(events)
         return self.issues
 
 
@@ -94,6 +96,14 @@ class MonthlyArcEngineTests(unittest.TestCase):
         self.assertTrue(all("week_label" in w for w in weekly_arcs))
         self.assertTrue(any("Weekly hook" in str(w.get("arc")) for w in weekly_arcs))
 
+    def test_weekly_arcs_see_events_appended_to_same_list(self):
+        events = [TimelineEvent(date="2024-01-02", title="Kickoff", type="work")]
+        first = self.engine.synthesize_weekly_arcs(start_date=date(2024, 1, 1), end_date=date(2024, 1, 31), events=events)
+        events.append(TimelineEvent(date="2024-01-03", title="Follow-up", type="work"))
+        second = self.engine.synthesize_weekly_arcs(start_date=date(2024, 1, 1), end_date=date(2024, 1, 31), events=events)
+        self.assertEqual(first[0]["arc"]["narrative"]["arc"], "1 events")
+        self.assertEqual(second[0]["arc"]["narrative"]["arc"], "2 events")
+
     def test_task_summary(self):
         tasks = self.engine.summarize_month_tasks()
         self.assertIn("completed", tasks)
@@ -121,6 +131,22 @@ class MonthlyArcEngineTests(unittest.TestCase):
         self.assertIn("themes", arc)
         self.assertEqual(arc["time_window"], "2024-01-01 to 2024-01-31")
 
+    def test_empty_month_skips_event_pipeline(self):
+        arc = self.engine.construct_month_arc(start_date=date(2023, 6, 1), end_date=date(2023, 6, 30))
+        self.assertEqual(self.timeline.get_events_calls, 1)
+        self.assertEqual(self.weekly_engine.calls, [])
+        self.assertEqual(self.drift_auditor.audit_calls, [])
+        self.assertEqual(arc["weekly_arcs"], [])
+        self.assertEqual(arc["drift"]["severity"], "low")
+        self.assertAlmostEqual(arc["tasks"]["efficiency_score"], 0.5)
+        self.assertIn("Monthly Arc", default_md_template(arc))
+
+    def test_standalone_drift_audit_reuses_archived_fetch(self):
+        self.engine.run_monthly_drift_audit()
+        self.engine.run_monthly_drift_audit()
+        self.assertEqual(self.timeline.get_events_calls, 1)
+        self.assertEqual(len(self.drift_auditor.audit_calls[1]), len(self.events))
+
     def test_markdown_rendering(self):
         arc = self.engine.construct_month_arc(start_date=date(2024, 1, 1), end_date=date(2024, 1, 31))
         md = default_md_template(arc)
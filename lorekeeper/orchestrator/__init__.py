@@ -24,16 +24,3 @@ __all__ = [
     "TimelineContext",
     "dataclass_to_dict",
 ]
-from .orchestrator import LoreOrchestrator
-from .schema import (
-    OrchestratorSummary,
-    TimelineContext,
-    IdentityContext,
-    ContinuityContext,
-    CharacterContext,
-    SagaContext,
-    ArcContext,
-    AutopilotContext,
-    HQIResult,
-    FabricCluster,
-)
@@ -1,7 +1,8 @@
 """Lore Orchestrator: unified data layer for UI components."""
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, List, Optional
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from .schema import (
     AutopilotContext,
@@ -33,6 +34,7 @@ class LoreOrchestrator:
         continuity_engine: Any = None,
         autopilot_engine: Any = None,
         saga_engine: Any = None,
+        cache_ttl: float = 0.0,
     ) -> None:
         self.timeline_engine = timeline_engine
         self.memory_fabric = memory_fabric
@@ -46,6 +48,9 @@ class LoreOrchestrator:
         self.continuity_engine = continuity_engine
         self.autopilot_engine = autopilot_engine
         self.saga_engine = saga_engine
+        # Opt-in memoization of context lookups: results are reused for cache_ttl seconds
+        self.cache_ttl = cache_ttl
+        self._cache: Dict[str, Tuple[float, Any]] = {}
 
     # ------------------------------------------------------------------
     # Public API consumed by UI
@@ -83,12 +88,20 @@ class LoreOrchestrator:
         return dataclass_to_dict(summary)
 
     def get_timeline_context(self) -> TimelineContext:
+        return self._memo("timeline", self._build_timeline_context)
+
+    def _build_timeline_context(self) -> TimelineContext:
         events = self._safe_call(self.timeline_engine, "list_events", default=[])
         arcs = self._safe_call(self.arc_engine, "get_arcs", default=[])
         season = self._safe_call(self.season_engine, "get_current_season", default={})
         return TimelineContext(events=events, arcs=arcs, season=season)
 
     def get_character_context(self, character_id: Any) -> CharacterContext:
+        return self._memo(
+            f"character:{character_id}", lambda: self._build_character_context(character_id)
+        )
+
+    def _build_character_context(self, character_id: Any) -> CharacterContext:
         character = self._safe_call(
             self.character_engine, "get_character", default={}, args=(character_id,)
         )
@@ -98,26 +111,36 @@ class LoreOrchestrator:
         return CharacterContext(character=character, relationships=relationships)
 
     def get_identity_context(self) -> IdentityContext:
+        return self._memo("identity", self._build_identity_context)
+
+    def _build_identity_context(self) -> IdentityContext:
         identity_state = self._safe_call(self.identity_engine, "get_identity_state", default={})
         persona_state = self._safe_call(self.persona_engine, "get_persona_state", default={})
         return IdentityContext(identity=identity_state, persona=persona_state)
 
     def get_continuity_state(self) -> ContinuityContext:
+        return self._memo("continuity", self._build_continuity_state)
+
+    def _build_continuity_state(self) -> ContinuityContext:
         canonical = self._safe_call(self.continuity_engine, "get_canonical_facts", default=[])
         conflicts = self._safe_call(self.continuity_engine, "get_conflicts", default=[])
         return ContinuityContext(canonical=canonical, conflicts=conflicts)
 
     def get_saga_context(self) -> Dict[str, Any]:
+        return self._memo("saga", self._build_saga_context)
+
+    def _build_saga_context(self) -> Dict[str, Any]:
         saga = self._safe_call(self.saga_engine, "get_saga", default={})
         return saga or {}
 
     def get_arc_context(self) -> TimelineContext:
-        arcs = self._safe_call(self.arc_engine, "get_arcs", default=[])
-        season = self._safe_call(self.season_engine, "get_current_season", default={})
-        events = self._safe_call(self.timeline_engine, "list_events", default=[])
-        return TimelineContext(events=events, arcs=arcs, season=season)
+        # Same engine calls as the timeline context, so both share one cache entry
+        return self._memo("timeline", self._build_timeline_context)
 
     def get_autopilot_context(self) -> AutopilotContext:
+        return self._memo("autopilot", self._build_autopilot_context)
+
+    def _build_autopilot_context(self) -> AutopilotContext:
         daily = self._safe_call(self.autopilot_engine, "get_daily_signals", default={})
         weekly = self._safe_call(self.autopilot_engine, "get_weekly_signals", default={})
         momentum = self._safe_call(self.task_engine, "get_momentum", default={})
@@ -138,9 +161,28 @@ class LoreOrchestrator:
         normalized = [self._result_to_dict(result) for result in results]
         return HQIResultSchema(query=query, results=normalized)
 
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """Drop one memoized context (e.g. ``"timeline"``) or all of them."""
+
+        if key is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(key, None)
+
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
+    def _memo(self, key: str, build: Callable[[], Any]) -> Any:
+        if self.cache_ttl <= 0:
+            return build()
+        now = time.monotonic()
+        cached = self._cache.get(key)
+        if cached is not None and now - cached[0] < self.cache_ttl:
+            return cached[1]
+        value = build()
+        self._cache[key] = (now, value)
+        return value
+
     def _safe_call(
         self, engine: Any, method: str, default: Any, args: Optional[tuple] = None
     ) -> Any:
@@ -168,206 +210,3 @@ class LoreOrchestrator:
         if hasattr(result, "__dict__"):
             return dict(result.__dict__)
         return {"result": result}
-"""
-Lore Orchestrator — Central data aggregation layer for all engines.
-"""
-
-from .schema import (
-    ArcContext,
-    AutopilotContext,
-    CharacterContext,
-    ContinuityContext,
-    FabricCluster,
-    HQIResult,
-    IdentityContext,
-    OrchestratorSummary,
-    SagaContext,
-    TimelineContext,
-)
-
-
-class _TimelineManager:
-    def __init__(self, user_id: str):
-        self.user_id = user_id
-
-    def get_events(self):
-        return []
-
-
-class _IdentityEngine:
-    def __init__(self, user_id: str):
-        self.user_id = user_id
-
-    def get_state(self):
-        return {"identity": {"user_id": self.user_id}}
-
-    def get_pulse(self):
-        return {"status": "stable"}
-
-
-class _PersonaEngine:
-    def __init__(self, user_id: str):
-        self.user_id = user_id
-
-    def get_snapshot(self):
-        return {"persona": "default"}
-
-
-class _WeeklyArcEngine:
-    def __init__(self, user_id: str):
-        self.user_id = user_id
-
-    def get_latest_arc(self):
-        return {"title": "Demo Arc", "owner": self.user_id}
-
-    def list_arcs(self):
-        return []
-
-    def list_monthly(self):
-        return []
-
-
-class _SeasonEngine:
-    def __init__(self, user_id: str):
-        self.user_id = user_id
-
-    def get_current_season(self):
-        return {"name": "Season 1", "user_id": self.user_id}
-
-    def get_all_seasons(self):
-        return []
-
-
-class _SagaEngine:
-    def __init__(self, user_id: str):
-        self.user_id = user_id
-
-    def get_saga_state(self):
-        return {"status": "draft", "user_id": self.user_id}
-
-    def get_saga_context(self):
-        return SagaContext(seasons=[], arcs=[], turning_points=[])
-
-
-class _ContinuityEngine:
-    def __init__(self, user_id: str):
-        self.user_id = user_id
-
-    def get_state(self):
-        return {"stability": "steady"}
-
-    def get_context(self):
-        return ContinuityContext(
-            canonical_facts=[],
-            conflicts=[],
-            stability={"score": 1.0},
-        )
-
-    def get_drift_report(self):
-        return []
-
-
-class _AutopilotEngine:
-    def __init__(self, user_id: str):
-        self.user_id = user_id
-
-    def get_context(self):
-        return AutopilotContext(daily={}, weekly={}, alerts=[])
-
-
-class _HQIEngine:
-    def __init__(self, user_id: str):
-        self.user_id = user_id
-
-    def search(self, query: str):
-        return HQIResult(query=query, results=[])
-
-
-class _MemoryFabric:
-    def __init__(self, user_id: str):
-        self.user_id = user_id
-
-    def get_neighbors(self, memory_id: str):
-        return FabricCluster(memory_id=memory_id, neighbors=[])
-
-
-class _CharacterEngine:
-    def __init__(self, user_id: str):
-        self.user_id = user_id
-
-    def get_character_context(self, character_id: str):
-        return CharacterContext(
-            profile={"id": character_id, "user_id": self.user_id},
-            relationships=[],
-            shared_memories=[],
-            closeness_trend=[],
-        )
-
-
-class LoreOrchestrator:
-    def __init__(self, user_id: str):
-        self.user_id = user_id
-
-        self.timeline = _TimelineManager(user_id)
-        self.identity = _IdentityEngine(user_id)
-        self.persona = _PersonaEngine(user_id)
-        self.arcs = _WeeklyArcEngine(user_id)
-        self.seasons = _SeasonEngine(user_id)
-        self.saga = _SagaEngine(user_id)
-        self.continuity = _ContinuityEngine(user_id)
-        self.fabric = _MemoryFabric(user_id)
-        self.hqi = _HQIEngine(user_id)
-        self.autopilot = _AutopilotEngine(user_id)
-        self.characters = _CharacterEngine(user_id)
-
-    # ---- HIGH LEVEL ----
-    def get_summary(self) -> OrchestratorSummary:
-        return OrchestratorSummary(
-            identity=self.identity.get_state(),
-            persona=self.persona.get_snapshot(),
-            arcs=self.arcs.get_latest_arc(),
-            tasks={},
-            continuity=self.continuity.get_state(),
-            season=self.seasons.get_current_season(),
-            saga=self.saga.get_saga_state(),
-        )
-
-    # ---- SPECIFIC CONTEXTS ----
-    def get_timeline_context(self) -> TimelineContext:
-        return TimelineContext(
-            events=self.timeline.get_events(),
-            arcs=self.arcs.list_arcs(),
-            seasons=self.seasons.get_all_seasons(),
-            drift=self.continuity.get_drift_report(),
-        )
-
-    def get_identity_context(self) -> IdentityContext:
-        return IdentityContext(
-            identity_state=self.identity.get_state(),
-            persona_state=self.persona.get_snapshot(),
-            pulse=self.identity.get_pulse(),
-        )
-
-    def get_continuity_context(self) -> ContinuityContext:
-        return self.continuity.get_context()
-
-    def get_character_context(self, character_id: str) -> CharacterContext:
-        return self.characters.get_character_context(character_id)
-
-    def get_saga_context(self) -> SagaContext:
-        return self.saga.get_saga_context()
-
-    def get_arc_context(self) -> ArcContext:
-        return ArcContext(
-            weekly_arcs=self.arcs.list_arcs(),
-            monthly_arcs=self.arcs.list_monthly(),
-        )
-
-    def get_autopilot_context(self) -> AutopilotContext:
-        return self.autopilot.get_context()
-
-    def search_hqi(self, query: str) -> HQIResult:
-        return self.hqi.search(query)
-
-    def get_fabric_neighbors(self, memory_id: str) -> FabricCluster:
-        return self.fabric.get_neighbors(memory_id)
@@ -5,59 +5,24 @@ from dataclasses import dataclass, field, asdict
 from typing import Any, Dict, List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class TimelineContext:
     """Aggregated timeline view (events + arcs + season)."""
 
     events: List[Any] = field(default_factory=list)
     arcs: List[Any] = field(default_factory=list)
     season: Dict[str, Any] = field(default_factory=dict)
-"""
-Typed dataclasses defining unified orchestrator output.
-"""
 
-from dataclasses import dataclass
-from typing import Any, Dict, List
 
-
-@dataclass
-class OrchestratorSummary:
-    identity: Dict[str, Any]
-    persona: Dict[str, Any]
-    arcs: Dict[str, Any]
-    tasks: Dict[str, Any]
-    continuity: Dict[str, Any]
-    season: Dict[str, Any]
-    saga: Dict[str, Any]
-
-
-@dataclass
-class TimelineContext:
-    events: List[Dict[str, Any]]
-    arcs: List[Dict[str, Any]]
-    seasons: List[Dict[str, Any]]
-    drift: List[Dict[str, Any]]
-
-
-@dataclass
+@dataclass(slots=True)
 class IdentityContext:
     """Identity + persona snapshot."""
 
     identity: Dict[str, Any] = field(default_factory=dict)
     persona: Dict[str, Any] = field(default_factory=dict)
-    identity_state: Dict[str, Any]
-    persona_state: Dict[str, Any]
-    pulse: Dict[str, Any]
-
-
-@dataclass
-class ContinuityContext:
-    canonical_facts: List[Dict[str, Any]]
-    conflicts: List[Dict[str, Any]]
-    stability: Dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class CharacterContext:
     """Character state + relationship graph."""
 
@@ -65,7 +30,7 @@ class CharacterContext:
     relationships: List[Dict[str, Any]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ContinuityContext:
     """Continuity canonical facts and conflicts."""
 
@@ -73,7 +38,7 @@ class ContinuityContext:
     conflicts: List[Dict[str, Any]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class AutopilotContext:
     """Autopilot momentum and guidance signals."""
 
@@ -82,7 +47,7 @@ class AutopilotContext:
     momentum: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class FabricNeighborhood:
     """Graph neighborhood for a given memory node."""
 
@@ -90,7 +55,7 @@ class FabricNeighborhood:
     neighbors: List[Dict[str, Any]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class HQIResultSchema:
     """Search results coming out of the HQI engine."""
 
@@ -98,7 +63,7 @@ class HQIResultSchema:
     results: List[Dict[str, Any]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class OrchestratorSummary:
     """Unified payload presented to the UI via the orchestrator."""
 
@@ -125,39 +90,3 @@ def dataclass_to_dict(data: Any) -> Any:
     if isinstance(data, dict):
         return {key: dataclass_to_dict(value) for key, value in data.items()}
     return data
-    profile: Dict[str, Any]
-    relationships: List[Dict[str, Any]]
-    shared_memories: List[Dict[str, Any]]
-    closeness_trend: List[Dict[str, Any]]
-
-
-@dataclass
-class SagaContext:
-    seasons: List[Dict[str, Any]]
-    arcs: List[Dict[str, Any]]
-    turning_points: List[Dict[str, Any]]
-
-
-@dataclass
-class ArcContext:
-    weekly_arcs: List[Dict[str, Any]]
-    monthly_arcs: List[Dict[str, Any]]
-
-
-@dataclass
-class AutopilotContext:
-    daily: Dict[str, Any]
-    weekly: Dict[str, Any]
-    alerts: List[Dict[str, Any]]
-
-
-@dataclass
-class HQIResult:
-    query: str
-    results: List[Dict[str, Any]]
-
-
-@dataclass
-class FabricCluster:
-    memory_id: str
-    neighbors: List[Dict[str, Any]]
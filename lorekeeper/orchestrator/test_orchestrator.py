@@ -184,18 +184,21 @@ def test_summary_includes_all_components(orchestrator):
     assert summary["autopilot"]["daily"]["next_action"] == "Draft chapter outline"
     assert len(summary["characters"]) == 2
     assert summary["saga"]["title"] == "Reclamation"
-import unittest
 
-from lorekeeper.orchestrator import LoreOrchestrator
 
+def test_contexts_are_memoized_when_cache_enabled():
+    class CountingTimeline(StubTimeline):
+        calls = 0
 
-class TestOrchestrator(unittest.TestCase):
-    def test_summary(self):
-        orchestrator = LoreOrchestrator("demo")
-        summary = orchestrator.get_summary()
-        self.assertIn("identity", summary.identity)
-        self.assertIsNotNone(summary.persona)
+        def list_events(self):
+            CountingTimeline.calls += 1
+            return super().list_events()
 
+    orchestrator = LoreOrchestrator(timeline_engine=CountingTimeline(), cache_ttl=60.0)
+    orchestrator.get_summary()
+    orchestrator.get_summary()
+    assert CountingTimeline.calls == 1
 
-if __name__ == "__main__":
-    unittest.main()
+    orchestrator.invalidate("timeline")
+    orchestrator.get_timeline_context()
+    assert CountingTimeline.calls == 2
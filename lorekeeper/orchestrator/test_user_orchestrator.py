@@ -0,0 +1,22 @@
+import unittest
+
+from lorekeeper.orchestrator.user_orchestrator import LoreOrchestrator
+
+
+class TestOrchestrator(unittest.TestCase):
+    def test_summary(self):
+        orchestrator = LoreOrchestrator("demo")
+        summary = orchestrator.get_summary()
+        self.assertIn("identity", summary.identity)
+        self.assertIsNotNone(summary.persona)
+
+    def test_engines_built_on_first_use(self):
+        orchestrator = LoreOrchestrator("demo")
+        self.assertNotIn("hqi", vars(orchestrator))
+        orchestrator.search_hqi("plan")
+        self.assertEqual(set(vars(orchestrator)), {"user_id", "hqi"})
+        self.assertIs(orchestrator.hqi, orchestrator.hqi)
+
+
+if __name__ == "__main__":
+    unittest.main()
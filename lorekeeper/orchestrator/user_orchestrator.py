@@ -0,0 +1,238 @@
+"""
+User-scoped Lore Orchestrator — Central data aggregation layer for all engines.
+"""
+
+from functools import cached_property
+
+from .user_schema import (
+    ArcContext,
+    AutopilotContext,
+    CharacterContext,
+    ContinuityContext,
+    FabricCluster,
+    HQIResult,
+    IdentityContext,
+    OrchestratorSummary,
+    SagaContext,
+    TimelineContext,
+)
+
+
+class _TimelineManager:
+    def __init__(self, user_id: str):
+        self.user_id = user_id
+
+    def get_events(self):
+        return []
+
+
+class _IdentityEngine:
+    def __init__(self, user_id: str):
+        self.user_id = user_id
+
+    def get_state(self):
+        return {"identity": {"user_id": self.user_id}}
+
+    def get_pulse(self):
+        return {"status": "stable"}
+
+
+class _PersonaEngine:
+    def __init__(self, user_id: str):
+        self.user_id = user_id
+
+    def get_snapshot(self):
+        return {"persona": "default"}
+
+
+class _WeeklyArcEngine:
+    def __init__(self, user_id: str):
+        self.user_id = user_id
+
+    def get_latest_arc(self):
+        return {"title": "Demo Arc", "owner": self.user_id}
+
+    def list_arcs(self):
+        return []
+
+    def list_monthly(self):
+        return []
+
+
+class _SeasonEngine:
+    def __init__(self, user_id: str):
+        self.user_id = user_id
+
+    def get_current_season(self):
+        return {"name": "Season 1", "user_id": self.user_id}
+
+    def get_all_seasons(self):
+        return []
+
+
+class _SagaEngine:
+    def __init__(self, user_id: str):
+        self.user_id = user_id
+
+    def get_saga_state(self):
+        return {"status": "draft", "user_id": self.user_id}
+
+    def get_saga_context(self):
+        return SagaContext(seasons=[], arcs=[], turning_points=[])
+
+
+class _ContinuityEngine:
+    def __init__(self, user_id: str):
+        self.user_id = user_id
+
+    def get_state(self):
+        return {"stability": "steady"}
+
+    def get_context(self):
+        return ContinuityContext(
+            canonical_facts=[],
+            conflicts=[],
+            stability={"score": 1.0},
+        )
+
+    def get_drift_report(self):
+        return []
+
+
+class _AutopilotEngine:
+    def __init__(self, user_id: str):
+        self.user_id = user_id
+
+    def get_context(self):
+        return AutopilotContext(daily={}, weekly={}, alerts=[])
+
+
+class _HQIEngine:
+    def __init__(self, user_id: str):
+        self.user_id = user_id
+
+    def search(self, query: str):
+        return HQIResult(query=query, results=[])
+
+
+class _MemoryFabric:
+    def __init__(self, user_id: str):
+        self.user_id = user_id
+
+    def get_neighbors(self, memory_id: str):
+        return FabricCluster(memory_id=memory_id, neighbors=[])
+
+
+class _CharacterEngine:
+    def __init__(self, user_id: str):
+        self.user_id = user_id
+
+    def get_character_context(self, character_id: str):
+        return CharacterContext(
+            profile={"id": character_id, "user_id": self.user_id},
+            relationships=[],
+            shared_memories=[],
+            closeness_trend=[],
+        )
+
+
+class LoreOrchestrator:
+    def __init__(self, user_id: str):
+        self.user_id = user_id
+
+    # ---- ENGINES (built on first use) ----
+    @cached_property
+    def timeline(self) -> _TimelineManager:
+        return _TimelineManager(self.user_id)
+
+    @cached_property
+    def identity(self) -> _IdentityEngine:
+        return _IdentityEngine(self.user_id)
+
+    @cached_property
+    def persona(self) -> _PersonaEngine:
+        return _PersonaEngine(self.user_id)
+
+    @cached_property
+    def arcs(self) -> _WeeklyArcEngine:
+        return _WeeklyArcEngine(self.user_id)
+
+    @cached_property
+    def seasons(self) -> _SeasonEngine:
+        return _SeasonEngine(self.user_id)
+
+    @cached_property
+    def saga(self) -> _SagaEngine:
+        return _SagaEngine(self.user_id)
+
+    @cached_property
+    def continuity(self) -> _ContinuityEngine:
+        return _ContinuityEngine(self.user_id)
+
+    @cached_property
+    def fabric(self) -> _MemoryFabric:
+        return _MemoryFabric(self.user_id)
+
+    @cached_property
+    def hqi(self) -> _HQIEngine:
+        return _HQIEngine(self.user_id)
+
+    @cached_property
+    def autopilot(self) -> _AutopilotEngine:
+        return _AutopilotEngine(self.user_id)
+
+    @cached_property
+    def characters(self) -> _CharacterEngine:
+        return _CharacterEngine(self.user_id)
+
+    # ---- HIGH LEVEL ----
+    def get_summary(self) -> OrchestratorSummary:
+        return OrchestratorSummary(
+            identity=self.identity.get_state(),
+            persona=self.persona.get_snapshot(),
+            arcs=self.arcs.get_latest_arc(),
+            tasks={},
+            continuity=self.continuity.get_state(),
+            season=self.seasons.get_current_season(),
+            saga=self.saga.get_saga_state(),
+        )
+
+    # ---- SPECIFIC CONTEXTS ----
+    def get_timeline_context(self) -> TimelineContext:
+        return TimelineContext(
+            events=self.timeline.get_events(),
+            arcs=self.arcs.list_arcs(),
+            seasons=self.seasons.get_all_seasons(),
+            drift=self.continuity.get_drift_report(),
+        )
+
+    def get_identity_context(self) -> IdentityContext:
+        return IdentityContext(
+            identity_state=self.identity.get_state(),
+            persona_state=self.persona.get_snapshot(),
+            pulse=self.identity.get_pulse(),
+        )
+
+    def get_continuity_context(self) -> ContinuityContext:
+        return self.continuity.get_context()
+
+    def get_character_context(self, character_id: str) -> CharacterContext:
+        return self.characters.get_character_context(character_id)
+
+    def get_saga_context(self) -> SagaContext:
+        return self.saga.get_saga_context()
+
+    def get_arc_context(self) -> ArcContext:
+        return ArcContext(
+            weekly_arcs=self.arcs.list_arcs(),
+            monthly_arcs=self.arcs.list_monthly(),
+        )
+
+    def get_autopilot_context(self) -> AutopilotContext:
+        return self.autopilot.get_context()
+
+    def search_hqi(self, query: str) -> HQIResult:
+        return self.hqi.search(query)
+
+    def get_fabric_neighbors(self, memory_id: str) -> FabricCluster:
+        return self.fabric.get_neighbors(memory_id)
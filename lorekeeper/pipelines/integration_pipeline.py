@@ -2,10 +2,16 @@
 from __future__ import annotations
 
 import json
-from dataclasses import asdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List
+from typing import Callable, Dict, List
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from lorekeeper.distillers.github import GithubDistiller, GithubMilestone
 from lorekeeper.distillers.instagram import InstagramDistiller
@@ -14,12 +20,28 @@ from lorekeeper.timeline_manager import TimelineManager
 
 INBOX_ROOT = Path(__file__).resolve().parent.parent / "inbox"
 
+# Payload keys promoted to TimelineEvent fields rather than kept in metadata
+_METADATA_EXCLUDE = ("summary", "tags")
+
+
+def _loads_line(line: bytes) -> dict:
+    try:
+        return orjson.loads(line)
+    except orjson.JSONDecodeError:
+        # orjson rejects the NaN/Infinity tokens json.loads accepts
+        return json.loads(line)
+
 
 def _read_jsonl(path: Path) -> List[dict]:
     if not path.exists():
         return []
-    content = path.read_text(encoding="utf-8")
-    return [json.loads(line) for line in content.splitlines() if line.strip()]
+    # Parse line by line rather than holding the whole file and its split copy in memory
+    if ORJSON_AVAILABLE:
+        # orjson parses the UTF-8 bytes directly, skipping the text decode
+        with path.open("rb") as handle:
+            return [_loads_line(line) for line in handle if line.strip()]
+    with path.open("r", encoding="utf-8") as handle:
+        return [json.loads(line) for line in handle if line.strip()]
 
 
 def read_inbox(source: str, user_id: str | None = None) -> List[dict]:
@@ -35,10 +57,14 @@ def _instagram_events(raw_events: List[dict]) -> List[dict]:
     return InstagramDistiller().distill(raw_events)
 
 
+def _distill_inbox(source: str, distill: Callable[[List[dict]], list], user_id: str | None = None) -> list:
+    return distill(read_inbox(source, user_id))
+
+
 def get_distilled(integration: str, user_id: str | None = None):
     raw_events = read_inbox(integration, user_id)
     if integration == "github":
-        distilled = [asdict(evt) for evt in _github_events(raw_events)]
+        distilled = [evt.to_dict() for evt in _github_events(raw_events)]
     elif integration == "instagram":
         distilled = _instagram_events(raw_events)
     else:
@@ -57,35 +83,43 @@ def _to_timeline_event(payload: dict, source: str) -> TimelineEvent:
         details=payload.get("summary") or payload.get("description") or title,
         tags=list(tags),
         source=source,
-        metadata={k: v for k, v in payload.items() if k not in {"summary", "tags"}},
+        metadata=_payload_metadata(payload),
     )
 
 
-def run_pipeline(user_id: str) -> Dict[str, int]:
-    github_raw = read_inbox("github", user_id)
-    instagram_raw = read_inbox("instagram", user_id)
+def _payload_metadata(payload: dict) -> dict:
+    metadata = dict(payload)
+    for key in _METADATA_EXCLUDE:
+        metadata.pop(key, None)
+    return metadata
+
 
-    github_clean = _github_events(github_raw)
-    instagram_clean = _instagram_events(instagram_raw)
+def _milestone_to_timeline_event(evt: GithubMilestone) -> TimelineEvent:
+    """``_to_timeline_event`` for a GitHub milestone, read straight from its fields."""
+    timestamp = evt.timestamp or datetime.utcnow().isoformat()
+    title = evt.title or evt.summary or "github event"
+    return TimelineEvent(
+        date=timestamp,
+        title=title,
+        type="github",
+        details=evt.summary or title,
+        tags=list(evt.tags or []),
+        source="github",
+        metadata={"title": evt.title, "timestamp": evt.timestamp, "repo": evt.repo, "impact": evt.impact},
+    )
+
+
+def run_pipeline(user_id: str) -> Dict[str, int]:
+    # The two inboxes are independent, so read and distill them side by side
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        github_future = executor.submit(_distill_inbox, "github", _github_events, user_id)
+        instagram_future = executor.submit(_distill_inbox, "instagram", _instagram_events, user_id)
+        github_clean = github_future.result()
+        instagram_clean = instagram_future.result()
 
     manager = TimelineManager()
-    for evt in github_clean:
-        manager.add_event(
-            _to_timeline_event(
-                {
-                    "title": evt.title,
-                    "summary": evt.summary,
-                    "timestamp": evt.timestamp,
-                    "tags": evt.tags,
-                    "repo": evt.repo,
-                    "impact": evt.impact,
-                },
-                "github",
-            )
-        )
-
-    for media in instagram_clean:
-        manager.add_event(_to_timeline_event(media, "instagram"))
+    manager.add_events(_milestone_to_timeline_event(evt) for evt in github_clean)
+    manager.add_events(_to_timeline_event(media, "instagram") for media in instagram_clean)
 
     return {"github": len(github_clean), "instagram": len(instagram_clean)}
 
@@ -96,4 +130,5 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Run integration pipeline")
     parser.add_argument("user_id", nargs="?", default="demo")
     args = parser.parse_args()
-    print(json.dumps(run_pipeline(args.user_id)))
+    result = run_pipeline(args.user_id)
+    print(orjson.dumps(result).decode("utf-8") if ORJSON_AVAILABLE else json.dumps(result))
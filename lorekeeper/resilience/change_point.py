@@ -3,11 +3,54 @@ Change Point Detection for Emotional Shifts
 Detects significant emotional transitions in time series data
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Sequence
 import numpy as np
 
+from .._jit import JIT_KW, NUMBA_AVAILABLE, njit
 
-def detect_change_points(sentiments: List[float], timestamps: List[str]) -> List[Dict[str, Any]]:
+# Tiny series are not worth the first-call dispatch; the kernel already wins at ~16 points
+JIT_MIN_SIZE = 8
+CHANGE_THRESHOLD = 0.3
+TS_KEYS = ("timestamp", "date", "created_at")
+
+
+@njit(**JIT_KW)
+def _scan_kernel(s, threshold):
+    # Indices whose jumps from the previous and to the next point both exceed threshold
+    n = len(s)
+    hits = np.empty(max(n - 2, 0), dtype=np.int64)
+    count = 0
+    for i in range(1, n - 1):
+        if abs(s[i] - s[i - 1]) > threshold and abs(s[i + 1] - s[i]) > threshold:
+            hits[count] = i
+            count += 1
+    return hits[:count]
+
+
+def _change_indices(s: np.ndarray) -> np.ndarray:
+    if NUMBA_AVAILABLE and len(s) >= JIT_MIN_SIZE:
+        return _scan_kernel(s, CHANGE_THRESHOLD)
+    d = np.abs(np.diff(s))
+    return np.flatnonzero((d[:-1] > CHANGE_THRESHOLD) & (d[1:] > CHANGE_THRESHOLD)) + 1
+
+
+class _EntryTimestamps:
+    """Timestamps of entries, resolved only for the indices that are looked up"""
+    __slots__ = ("entries",)
+
+    def __init__(self, entries: List[Dict[str, Any]]):
+        self.entries = entries
+
+    def __getitem__(self, i: int) -> str:
+        entry = self.entries[i]
+        for key in TS_KEYS[:-1]:
+            value = entry.get(key)
+            if value:
+                return value
+        return entry.get(TS_KEYS[-1], "")
+
+
+def detect_change_points(sentiments: Sequence[float], timestamps: Sequence[str]) -> List[Dict[str, Any]]:
     """
     Detect change points in emotional trajectory
     
@@ -21,27 +64,25 @@ def detect_change_points(sentiments: List[float], timestamps: List[str]) -> List
     if len(sentiments) < 3:
         return []
     
-    change_points = []
+    # Simple change point detection: significant shifts in sentiment on both sides of a point
+    s = np.asarray(sentiments, dtype=np.float64)
+    hits = _change_indices(s)
     
-    # Simple change point detection: significant shifts in sentiment
-    for i in range(1, len(sentiments) - 1):
+    # Only the hits are materialized, from the original values (plain floats for arrays)
+    if isinstance(sentiments, np.ndarray):
+        sentiments = s.tolist()
+    change_points = []
+    for i in hits.tolist():
         prev = sentiments[i - 1]
         curr = sentiments[i]
         next_val = sentiments[i + 1]
-        
-        # Detect significant change (difference > threshold)
-        diff_prev = abs(curr - prev)
-        diff_next = abs(next_val - curr)
-        
-        # Change point if both differences are significant
-        if diff_prev > 0.3 and diff_next > 0.3:
-            change_points.append({
-                "timestamp": timestamps[i],
-                "index": i,
-                "sentiment": curr,
-                "change_magnitude": max(diff_prev, diff_next),
-                "direction": "up" if curr > prev else "down"
-            })
+        change_points.append({
+            "timestamp": timestamps[i],
+            "index": i,
+            "sentiment": curr,
+            "change_magnitude": max(abs(curr - prev), abs(next_val - curr)),
+            "direction": "up" if curr > prev else "down"
+        })
     
     return change_points
 
@@ -59,9 +100,9 @@ def detect_emotional_shifts(entries: List[Dict[str, Any]]) -> List[Dict[str, Any
     if not entries or len(entries) < 3:
         return []
     
-    # Extract sentiments and timestamps
-    sentiments = [e.get("sentiment", 0.0) for e in entries]
-    timestamps = [e.get("timestamp") or e.get("date") or e.get("created_at", "") for e in entries]
+    # Extract sentiments; timestamps are only needed for the detected change points
+    sentiments = np.fromiter((e.get("sentiment", 0.0) for e in entries), dtype=np.float64, count=len(entries))
+    timestamps = _EntryTimestamps(entries)
     
     # Detect change points
     change_points = detect_change_points(sentiments, timestamps)
@@ -3,6 +3,7 @@ Emotional Recovery Analysis
 """
 
 from typing import List, Dict, Any
+import numpy as np
 
 
 def analyze_emotional_recovery(sentiments: List[float]) -> Dict[str, Any]:
@@ -22,8 +23,11 @@ def analyze_emotional_recovery(sentiments: List[float]) -> Dict[str, Any]:
             "trend": "insufficient_data"
         }
     
+    # Step comparisons for the rising check and consistency ratio run on one array
+    s = np.asarray(sentiments, dtype=np.float64)
+    
     # Check if trend is rising
-    rising = all(sentiments[i] <= sentiments[i+1] for i in range(len(sentiments)-1))
+    rising = bool(np.all(s[:-1] <= s[1:]))
     
     # Calculate improvement
     initial = sentiments[0]
@@ -36,7 +40,7 @@ def analyze_emotional_recovery(sentiments: List[float]) -> Dict[str, Any]:
     # Calculate confidence based on consistency
     if len(sentiments) >= 3:
         # Check consistency of rise
-        consistent_rise = sum(1 for i in range(len(sentiments)-1) if sentiments[i+1] > sentiments[i])
+        consistent_rise = int(np.count_nonzero(s[1:] > s[:-1]))
         consistency_ratio = consistent_rise / (len(sentiments) - 1)
         confidence = min(0.95, 0.5 + consistency_ratio * 0.45)
     else:
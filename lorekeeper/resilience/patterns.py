@@ -3,7 +3,7 @@ Resilience Pattern Detection
 """
 
 from typing import List, Dict, Any
-from collections import defaultdict
+from collections import Counter, defaultdict
 
 
 def detect_resilience_patterns(setbacks: List[Dict[str, Any]], recoveries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -19,18 +19,15 @@ def detect_resilience_patterns(setbacks: List[Dict[str, Any]], recoveries: List[
     """
     patterns = []
     
-    # Group setbacks by category
-    category_setbacks = defaultdict(list)
-    for setback in setbacks:
-        category = setback.get('category', 'other')
-        category_setbacks[category].append(setback)
+    # Count setbacks and recoveries by category in one pass each
+    setback_counts = Counter(setback.get('category', 'other') for setback in setbacks)
+    recovery_counts = Counter(recovery.get('category') for recovery in recoveries)
     
     # Detect category-specific patterns
-    for category, category_setbacks_list in category_setbacks.items():
-        if len(category_setbacks_list) >= 3:
+    for category, setback_count in setback_counts.items():
+        if setback_count >= 3:
             # Check recovery rate for this category
-            category_recoveries = [r for r in recoveries if r.get('category') == category]
-            recovery_rate = len(category_recoveries) / len(category_setbacks_list) if category_setbacks_list else 0
+            recovery_rate = recovery_counts[category] / setback_count
             
             if recovery_rate >= 0.8:
                 patterns.append({
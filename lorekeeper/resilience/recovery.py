@@ -4,6 +4,7 @@ Recovery Pattern Analysis
 
 from typing import List, Dict, Any
 from datetime import datetime, timedelta
+import numpy as np
 
 
 def analyze_recovery_patterns(recovery_events: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -24,14 +25,16 @@ def analyze_recovery_patterns(recovery_events: List[Dict[str, Any]]) -> Dict[str
         }
     
     # Calculate average recovery time
-    durations = [e.get('recovery_duration_days', 0) for e in recovery_events if e.get('recovery_duration_days')]
-    avg_duration = sum(durations) / len(durations) if durations else 0
+    durations = np.fromiter(
+        (e['recovery_duration_days'] for e in recovery_events if e.get('recovery_duration_days')),
+        dtype=np.float64,
+    )
+    avg_duration = float(durations.mean()) if durations.size else 0
     
     # Analyze consistency
-    if len(durations) >= 2:
-        # Calculate variance
-        variance = sum((d - avg_duration) ** 2 for d in durations) / len(durations)
-        std_dev = variance ** 0.5
+    if durations.size >= 2:
+        # Population standard deviation
+        std_dev = float(durations.std())
         # Consistency is inverse of coefficient of variation
         consistency = 1.0 / (1.0 + (std_dev / avg_duration if avg_duration > 0 else 1.0))
     else:
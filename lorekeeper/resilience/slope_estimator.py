@@ -3,9 +3,67 @@ Slope Estimator for Recovery Speed
 Estimates recovery speed using linear regression
 """
 
-from typing import List, Dict, Any
+from datetime import datetime
+from functools import lru_cache
+from typing import List, Dict, Any, Tuple
 import numpy as np
 
+from .._jit import JIT_KW, NUMBA_AVAILABLE, njit
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO-8601 timestamp, accepting a trailing ``Z`` for UTC."""
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+@njit(**JIT_KW)
+def _regress_kernel(x, y):
+    # Means in one pass, centered sums in a second, with no temporary arrays
+    n = x.shape[0]
+    x_mean = 0.0
+    y_mean = 0.0
+    for i in range(n):
+        x_mean += x[i]
+        y_mean += y[i]
+    x_mean /= n
+    y_mean /= n
+    sxx = 0.0
+    sxy = 0.0
+    syy = 0.0
+    for i in range(n):
+        dx = x[i] - x_mean
+        dy = y[i] - y_mean
+        sxx += dx * dx
+        sxy += dx * dy
+        syy += dy * dy
+    slope = sxy / sxx if sxx != 0 else 0.0
+    r_squared = (sxy * sxy) / (sxx * syy) if sxx != 0 and syy > 0 else 0.0
+    return slope, y_mean - slope * x_mean, r_squared
+
+
+def _regress(x: np.ndarray, y: np.ndarray) -> Tuple[float, float, float]:
+    """
+    Least-squares slope, intercept and R-squared from centered dot products
+    
+    R-squared is Sxy² / (Sxx·Syy), so no predicted or residual arrays are built.
+    """
+    # The compiled kernel beats the five NumPy dispatches below even at two points
+    if NUMBA_AVAILABLE:
+        return _regress_kernel(x, y)
+    x_mean = x.mean()
+    y_mean = y.mean()
+    x_c = x - x_mean
+    y_c = y - y_mean
+    sxx = np.dot(x_c, x_c)
+    sxy = np.dot(x_c, y_c)
+    syy = np.dot(y_c, y_c)
+    
+    slope = sxy / sxx if sxx != 0 else 0.0
+    intercept = y_mean - slope * x_mean
+    r_squared = (sxy * sxy) / (sxx * syy) if sxx != 0 and syy > 0 else 0.0
+    return slope, intercept, r_squared
+
 
 def estimate_recovery_slope(recovery_data: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
@@ -39,12 +97,11 @@ def estimate_recovery_slope(recovery_data: List[Dict[str, Any]]) -> Dict[str, An
         }
     
     try:
-        from datetime import datetime
-        first_time = datetime.fromisoformat(timestamps[0].replace('Z', '+00:00'))
+        first_time = _parse_iso(timestamps[0])
         time_indices = []
         for ts in timestamps:
             try:
-                dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
+                dt = _parse_iso(ts)
                 days = (dt - first_time).total_seconds() / (24 * 3600)
                 time_indices.append(days)
             except:
@@ -54,31 +111,15 @@ def estimate_recovery_slope(recovery_data: List[Dict[str, Any]]) -> Dict[str, An
         time_indices = list(range(len(recovery_data)))
     
     # Linear regression
-    x = np.array(time_indices)
-    y = np.array(improvements)
-    
-    n = len(x)
-    sum_x = np.sum(x)
-    sum_y = np.sum(y)
-    sum_xy = np.sum(x * y)
-    sum_x_squared = np.sum(x ** 2)
-    
-    denominator = n * sum_x_squared - sum_x ** 2
-    if denominator == 0:
-        slope = 0.0
-    else:
-        slope = (n * sum_xy - sum_x * sum_y) / denominator
-    
-    intercept = (sum_y - slope * sum_x) / n
-    
-    # Calculate R-squared
-    y_pred = slope * x + intercept
-    ss_res = np.sum((y - y_pred) ** 2)
-    ss_tot = np.sum((y - np.mean(y)) ** 2)
-    r_squared = 1 - (ss_res / ss_tot) if ss_tot > 0 else 0.0
+    x = np.asarray(time_indices, dtype=np.float64)
+    y = np.asarray(improvements, dtype=np.float64)
+    slope, intercept, r_squared = _regress(x, y)
     
     # Recovery speed: slope normalized to 0-1 (positive slope = faster recovery)
-    recovery_speed = max(0.0, min(1.0, (slope + 1) / 2))
+    # Same result as max(0.0, min(1.0, ...)), NaN included, without the two builtin calls
+    recovery_speed = (slope + 1) / 2
+    recovery_speed = recovery_speed if recovery_speed < 1.0 else 1.0
+    recovery_speed = recovery_speed if recovery_speed > 0.0 else 0.0
     
     return {
         "slope": float(slope),
@@ -88,6 +129,53 @@ def estimate_recovery_slope(recovery_data: List[Dict[str, Any]]) -> Dict[str, An
     }
 
 
+def estimate_recovery_slopes(xs: np.ndarray, ys: np.ndarray, valid_lens: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Batched regression for many recovery series at once (e.g. one row per user)
+    
+    Args:
+        xs: (B, N) day offsets per series, padded past each series' length
+        ys: (B, N) improvements, padded the same way
+        valid_lens: (B,) number of real points in each row
+        
+    Returns:
+        Dictionary of (B,) arrays with the same keys as ``estimate_recovery_slope``;
+        rows with fewer than two points are all zeros
+    """
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
+    lens = np.asarray(valid_lens, dtype=np.int64)
+    mask = np.arange(xs.shape[1]) < lens[:, None]
+    counts = np.maximum(lens, 1)
+    
+    x_mean = np.where(mask, xs, 0.0).sum(axis=1) / counts
+    y_mean = np.where(mask, ys, 0.0).sum(axis=1) / counts
+    x_c = np.where(mask, xs - x_mean[:, None], 0.0)
+    y_c = np.where(mask, ys - y_mean[:, None], 0.0)
+    sxx = np.einsum("ij,ij->i", x_c, x_c)
+    sxy = np.einsum("ij,ij->i", x_c, y_c)
+    syy = np.einsum("ij,ij->i", y_c, y_c)
+    
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = np.where(sxx != 0, sxy / sxx, 0.0)
+        r_squared = np.where((sxx != 0) & (syy > 0), (sxy * sxy) / (sxx * syy), 0.0)
+    intercept = y_mean - slope * x_mean
+    recovery_speed = (slope + 1) / 2
+    recovery_speed = np.where(recovery_speed < 1.0, recovery_speed, 1.0)
+    recovery_speed = np.where(recovery_speed > 0.0, recovery_speed, 0.0)
+    
+    short = lens < 2
+    result = {
+        "slope": slope,
+        "intercept": intercept,
+        "recovery_speed": recovery_speed,
+        "r_squared": r_squared,
+    }
+    for values in result.values():
+        values[short] = 0.0
+    return result
+
+
 def handle(**kwargs) -> Dict[str, Any]:
     """
     Handle function for Python bridge
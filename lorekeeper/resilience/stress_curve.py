@@ -3,7 +3,8 @@ Stress → Recovery Curve Modeling
 Builds stress and recovery curves over time
 """
 
-from typing import List, Dict, Any
+from bisect import bisect_right
+from typing import List, Dict, Any, Tuple
 import numpy as np
 from datetime import datetime
 
@@ -29,6 +30,7 @@ def build_stress_curve(setbacks: List[Dict[str, Any]], entries: List[Dict[str, A
     # Create time series
     stress_points = []
     recovery_points = []
+    recovery_index = _build_recovery_index(entries)
     
     for setback in setbacks:
         setback_time = setback.get("timestamp", "")
@@ -40,7 +42,7 @@ def build_stress_curve(setbacks: List[Dict[str, Any]], entries: List[Dict[str, A
         })
         
         # Find recovery after setback
-        recovery = find_recovery_after_setback(setback, entries)
+        recovery = _find_recovery_indexed(setback, entries, recovery_index)
         if recovery:
             recovery_points.append({
                 "timestamp": recovery.get("timestamp", setback_time),
@@ -85,9 +87,17 @@ def find_recovery_after_setback(setback: Dict[str, Any], entries: List[Dict[str,
             best_sentiment = sentiment
             best_entry = entry
     
+    return _recovery_signal(best_entry, best_sentiment)
+
+
+def _entry_time(entry: Dict[str, Any]) -> str:
+    return entry.get("timestamp") or entry.get("date") or entry.get("created_at", "")
+
+
+def _recovery_signal(best_entry: Dict[str, Any] | None, best_sentiment: float) -> Dict[str, Any] | None:
     if best_entry and best_sentiment > -0.5:
         return {
-            "timestamp": best_entry.get("timestamp") or best_entry.get("date") or best_entry.get("created_at", ""),
+            "timestamp": _entry_time(best_entry),
             "improvement": (best_sentiment + 1) / 2,  # Normalize to 0-1
             "sentiment": best_sentiment
         }
@@ -95,6 +105,47 @@ def find_recovery_after_setback(setback: Dict[str, Any], entries: List[Dict[str,
     return None
 
 
+def _build_recovery_index(entries: List[Dict[str, Any]]) -> Tuple[List[str], List[int | None]]:
+    """
+    Sort entry times once and record, for each sorted position, the entry with the
+    best sentiment at or after it (earliest entry wins ties, as in the linear scan)
+    """
+    order = sorted(range(len(entries)), key=lambda i: _entry_time(entries[i]))
+    times = [_entry_time(entries[i]) for i in order]
+    
+    suffix_best: List[int | None] = [None] * (len(order) + 1)
+    best_sentiment = -1.0
+    best_index = None
+    for position in range(len(order) - 1, -1, -1):
+        index = order[position]
+        sentiment = entries[index].get("sentiment", -1.0)
+        if sentiment > best_sentiment or (best_index is not None and sentiment == best_sentiment and index < best_index):
+            best_sentiment = sentiment
+            best_index = index
+        suffix_best[position] = best_index
+    
+    return times, suffix_best
+
+
+def _find_recovery_indexed(
+    setback: Dict[str, Any],
+    entries: List[Dict[str, Any]],
+    recovery_index: Tuple[List[str], List[int | None]],
+) -> Dict[str, Any] | None:
+    """``find_recovery_after_setback`` over a ``_build_recovery_index`` result"""
+    setback_time = setback.get("timestamp", "")
+    if not setback_time:
+        return None
+    
+    times, suffix_best = recovery_index
+    best_index = suffix_best[bisect_right(times, setback_time)]
+    if best_index is None:
+        return None
+    
+    best_entry = entries[best_index]
+    return _recovery_signal(best_entry, best_entry.get("sentiment", -1.0))
+
+
 def calculate_baseline_stress(entries: List[Dict[str, Any]], setbacks: List[Dict[str, Any]]) -> float:
     """
     Calculate baseline stress level (when no active setbacks)
@@ -105,12 +156,11 @@ def calculate_baseline_stress(entries: List[Dict[str, Any]], setbacks: List[Dict
     # Get sentiments from entries not during setbacks
     setback_times = {s.get("timestamp", "") for s in setbacks}
     
-    baseline_sentiments = []
-    for entry in entries:
-        entry_time = entry.get("timestamp") or entry.get("date") or entry.get("created_at", "")
-        if entry_time not in setback_times:
-            sentiment = entry.get("sentiment", 0.0)
-            baseline_sentiments.append(sentiment)
+    baseline_sentiments = [
+        entry.get("sentiment", 0.0)
+        for entry in entries
+        if (entry.get("timestamp") or entry.get("date") or entry.get("created_at", "")) not in setback_times
+    ]
     
     if not baseline_sentiments:
         return 0.0
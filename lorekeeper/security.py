@@ -5,6 +5,12 @@ import json
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 SAFE_EXTENSIONS = {".json"}
 
 
@@ -30,4 +36,12 @@ def secure_load_json(path: str | Path, base_dir: Path | None = None) -> Any:
         target_path.parent.mkdir(parents=True, exist_ok=True)
         target_path.write_text("[]", encoding="utf-8")
 
+    if ORJSON_AVAILABLE:
+        # orjson parses the UTF-8 bytes directly, skipping the text decode
+        raw = target_path.read_bytes()
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson rejects the NaN/Infinity tokens json.dumps writes for non-finite floats
+            return json.loads(raw)
     return json.loads(target_path.read_text(encoding="utf-8"))
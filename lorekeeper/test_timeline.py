@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import json
+import math
 from datetime import datetime, timedelta, date
 from pathlib import Path
 from tempfile import TemporaryDirectory
@@ -51,6 +52,56 @@ class TimelineManagerTests(unittest.TestCase):
         self.assertEqual(len(filtered), 1)
         self.assertEqual(filtered[0].title, "Christmas")
 
+    def test_add_events_writes_each_shard_once_and_dedupes(self) -> None:
+        events = [
+            TimelineEvent(date="2024-03-01", title="Sparring", type="training", details="Rounds"),
+            TimelineEvent(date="2024-03-01", title="Sparring", type="training", details="Rounds"),
+            TimelineEvent(date="2025-01-05", title="Kickoff", type="work", details="Planning"),
+        ]
+        stored = self.manager.add_events(events)
+        self.assertIs(stored[1], stored[0])
+        self.assertEqual(len(self.manager.load_year(2024)), 1)
+        self.assertEqual(len(self.manager.load_year(2025)), 1)
+        again = self.manager.add_events([TimelineEvent(date="2025-01-05", title="Kickoff", type="work", details="Planning")])
+        self.assertEqual(again[0].id, stored[2].id)
+
+    def test_appends_keep_shard_layout(self) -> None:
+        self.manager.add_event(TimelineEvent(date="2024-05-01", title="First", type="note", details="One"))
+        self.manager.add_events(
+            [
+                TimelineEvent(date="2024-05-02", title="Second", type="note", details="Two"),
+                TimelineEvent(date="2024-05-03", title="Third", type="note", details="Three"),
+            ]
+        )
+        shard = self.base_path / "anonymous" / "2024.json"
+        raw = json.loads(shard.read_text(encoding="utf-8"))
+        self.assertEqual([item["title"] for item in raw], ["First", "Second", "Third"])
+        self.assertEqual(shard.read_text(encoding="utf-8"), json.dumps(raw, indent=2, ensure_ascii=False))
+
+    def test_year_shard_cache_tracks_file_changes(self) -> None:
+        self.manager.add_event(TimelineEvent(date="2024-07-01", title="Cached", type="note", details="One"))
+        first = self.manager._load_raw_year(2024)
+        self.assertIs(self.manager._load_raw_year(2024), first)
+
+        shard = self.base_path / "anonymous" / "2024.json"
+        shard.write_text(json.dumps(first + [dict(first[0], id="external")], indent=2), encoding="utf-8")
+        self.assertEqual([item["id"] for item in self.manager._load_raw_year(2024)][-1], "external")
+
+    def test_non_finite_floats_round_trip_through_shards(self) -> None:
+        self.manager.add_event(
+            TimelineEvent(date="2024-08-01", title="Scored", type="note", details="One", metadata={"score": float("nan")})
+        )
+        self.manager.add_events(
+            [TimelineEvent(date="2024-08-02", title="Peak", type="note", details="Two", metadata={"score": float("inf")})]
+        )
+        shard = self.base_path / "anonymous" / "2024.json"
+        self.assertIn("NaN", shard.read_text(encoding="utf-8"))
+
+        self.manager._shard_cache.clear()
+        scores = [item["metadata"]["score"] for item in self.manager._load_raw_year(2024)]
+        self.assertTrue(math.isnan(scores[0]))
+        self.assertEqual(scores[1], float("inf"))
+
     def test_archive_and_correction(self) -> None:
         event = TimelineEvent(date="2025-03-01", title="Old Detail", type="note", details="Wrong info")
         stored = self.manager.add_event(event)
@@ -0,0 +1,18 @@
+import numpy as np
+
+from lorekeeper.intervention import anomaly
+
+
+def test_growing_a_cached_forest_leaves_the_published_one_untouched():
+    X = np.random.default_rng(0).random((200, 8)).astype(np.float32)
+    base = anomaly._fitted_forest(X[:100])
+    n_estimators = base.n_estimators
+    n_trees = len(base.estimators_)
+
+    grown = anomaly._fitted_forest(X)
+
+    assert grown is not base
+    assert grown.n_estimators == n_estimators + anomaly.GROWTH_ESTIMATORS
+    assert base.n_estimators == n_estimators
+    assert len(base.estimators_) == n_trees
+    assert anomaly._fitted_forest(X) is grown
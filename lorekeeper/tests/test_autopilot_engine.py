@@ -48,6 +48,13 @@ def test_cycle_detection_prefers_wednesday():
     assert cycles["cadence_strength"] > 0
 
 
+def test_analyzers_are_computed_once_per_engine():
+    engine = build_engine()
+    assert engine.analyze_cycles() is engine.analyze_cycles()
+    assert engine.analyze_goal_alignment() is engine.goal_alignment
+    assert engine.analyze_risk_patterns() is engine.risk_patterns
+
+
 def test_burnout_detection_is_high_with_many_overdue():
     engine = build_engine()
     alert = engine.detect_burnout_risk()
@@ -55,6 +62,17 @@ def test_burnout_detection_is_high_with_many_overdue():
     assert any("Overdue" in evidence for evidence in alert.evidence)
 
 
+def test_refresh_clock_drops_date_dependent_caches():
+    engine = build_engine()
+    before = engine.analyze_risk_patterns()
+
+    engine.refresh_clock()
+    after = engine.analyze_risk_patterns()
+
+    assert after is not before
+    assert after == before
+
+
 def test_focus_window_detection_uses_hours():
     engine = build_engine()
     window = engine.detect_focus_windows()
@@ -91,6 +109,24 @@ def test_renderers_return_valid_strings():
     assert "daily_plan" in js
 
 
+def test_rendered_output_is_cached_per_engine():
+    class Task:
+        def __init__(self, title, priority):
+            self.title = title
+            self.priority = priority
+            self.status = "incomplete"
+
+    low = AutopilotEngine(DummyInsight(), [], [Task("Low", 1)], {}, {})
+    high = AutopilotEngine(DummyInsight(), [], [Task("High", 9)], {}, {})
+
+    assert low.render_json() is low.render_json()
+    assert high.render_json() == high._build_json()
+
+    cached = high.render_json()
+    high.refresh_clock()
+    assert high.render_json() is not cached
+
+
 def test_evidence_is_propagated():
     engine = build_engine()
     burnout = engine.detect_burnout_risk()
@@ -0,0 +1,15 @@
+from lorekeeper.creative.block_predictor import predict_blocks
+
+
+def _events(*timestamps):
+    return [{"timestamp": timestamp} for timestamp in timestamps]
+
+
+def test_activity_clustered_early_in_the_span_is_flagged():
+    events = _events("2024-01-01", "2024-01-02", "2024-01-03", "2024-01-04", "2024-03-01T00:00:00Z")
+    assert "decreasing_activity" in predict_blocks(events, [])["risk_factors"]
+
+
+def test_steady_activity_is_not_flagged():
+    events = _events(*(f"2024-01-{day:02d}" for day in range(1, 9)))
+    assert "decreasing_activity" not in predict_blocks(events, [])["risk_factors"]
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from lorekeeper.growth.change_point import detect_change_points, handle
+
+
+def test_pelt_finds_a_clean_step():
+    points = detect_change_points([1.0] * 10 + [3.0] * 10, method="pelt")
+    assert [p["index"] for p in points] == [10]
+    assert points[0]["type"] == "breakthrough"
+    assert points[0]["from_value"] == pytest.approx(1.0)
+    assert points[0]["to_value"] == pytest.approx(3.0)
+
+
+def test_pelt_finds_a_noisy_step_that_diff_misses():
+    rng = np.random.default_rng(7)
+    values = np.concatenate([rng.normal(0.0, 0.05, 40), rng.normal(-1.0, 0.05, 40)]).tolist()
+
+    points = detect_change_points(values, threshold=0.5, method="pelt")
+
+    assert len(points) == 1
+    assert abs(points[0]["index"] - 40) <= 1
+    assert points[0]["type"] == "regression"
+    assert points[0]["magnitude"] == pytest.approx(-1.0, abs=0.1)
+
+
+def test_pelt_reports_nothing_for_a_constant_series():
+    assert detect_change_points([0.4] * 25, method="pelt") == []
+
+
+def test_pelt_handles_two_values():
+    points = detect_change_points([0.0, 1.0], method="pelt")
+    assert [(p["index"], p["magnitude"]) for p in points] == [(1, pytest.approx(1.0))]
+    assert detect_change_points([0.0, 0.1], method="pelt") == []
+
+
+def test_unknown_method_raises():
+    with pytest.raises(ValueError):
+        detect_change_points([0.0, 1.0], method="PELT")
+
+
+def test_handle_passes_penalty_through():
+    values = [1.0] * 10 + [3.0] * 10
+    assert handle(values=values, method="pelt")["total_change_points"] == 1
+    assert handle(values=values, method="pelt", penalty=1e6)["total_change_points"] == 0
@@ -21,3 +21,19 @@ def test_github_distiller_builds_summary():
     assert "demo/repo" in milestone.summary
     assert "push" in milestone.summary
     assert "github" in milestone.tags
+
+
+def test_github_distiller_streams_milestones_lazily():
+    consumed = []
+
+    def events():
+        for index in range(3):
+            consumed.append(index)
+            yield {"type": "push", "repo": "demo/repo", "title": f"Commit {index}"}
+
+    stream = GithubDistiller().iter_distill(events())
+    first = next(stream)
+
+    assert first.title == "Commit 0"
+    assert consumed == [0]
+    assert [milestone.title for milestone in stream] == ["Commit 1", "Commit 2"]
@@ -0,0 +1,115 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from lorekeeper.goals import similarity
+from lorekeeper.goals.similarity import find_similar_goals, find_similar_goals_batch
+
+WORDS = [f"w{k}" for k in range(30)]
+
+
+def _goals(n=200, seed=0):
+    rng = np.random.default_rng(seed)
+    goals = []
+    for i in range(n):
+        words = rng.choice(WORDS, size=int(rng.integers(3, 7)), replace=False).tolist()
+        goals.append({"id": i, "title": " ".join(words[:2]), "description": " ".join(words[2:])})
+    goals.append({"id": n, "title": "", "description": ""})
+    return goals
+
+
+def _per_goal(goals):
+    return {goal["id"]: find_similar_goals(goal, goals) for goal in goals}
+
+
+def _ranked_ids(results):
+    return {goal_id: [(match["goal"]["id"], match["similarity"]) for match in matches] for goal_id, matches in results.items()}
+
+
+def test_exact_batch_matches_per_goal_on_every_exact_path(monkeypatch):
+    goals = _goals()
+    expected = _ranked_ids(_per_goal(goals))
+
+    assert _ranked_ids(find_similar_goals_batch(goals)) == expected
+    monkeypatch.setattr(similarity, "MASK_MAX_VOCAB", 0)
+    assert _ranked_ids(find_similar_goals_batch(goals)) == expected
+
+
+def test_lsh_only_runs_when_approximate(monkeypatch):
+    goals = _goals()
+    monkeypatch.setattr(similarity, "LSH_MIN_SIZE", 1)
+    monkeypatch.setattr(similarity, "NUMBA_AVAILABLE", True)
+    monkeypatch.setattr(similarity, "_lsh_sweep", lambda tokenized: pytest.fail("LSH used without approximate"))
+
+    find_similar_goals_batch(goals)
+
+
+def _jaccard(goal, other):
+    words, other_words = similarity._tokenize(goal), similarity._tokenize(other)
+    return len(words & other_words) / len(words | other_words)
+
+
+def test_approximate_batch_rescores_exactly_and_keeps_most_matches(monkeypatch):
+    goals = _goals()
+    monkeypatch.setattr(similarity, "LSH_MIN_SIZE", 1)
+    monkeypatch.setattr(similarity, "NUMBA_AVAILABLE", True)
+
+    expected = _ranked_ids(_per_goal(goals))
+    approximate = find_similar_goals_batch(goals, approximate=True)
+
+    kept = 0
+    for goal_id, matches in approximate.items():
+        for match in matches:
+            assert match["similarity"] == _jaccard(goals[goal_id], match["goal"]) > 0.3
+        kept += len({other_id for other_id, _ in expected[goal_id]} & {m["goal"]["id"] for m in matches})
+    assert kept >= 0.9 * sum(len(matches) for matches in expected.values())
+
+
+def test_approximate_batch_is_stable_across_hash_seeds():
+    script = (
+        "from lorekeeper.goals import similarity\n"
+        "from lorekeeper.tests.test_goal_similarity import _goals\n"
+        "similarity.LSH_MIN_SIZE = 1\n"
+        "similarity.NUMBA_AVAILABLE = True\n"
+        "result = similarity.find_similar_goals_batch(_goals(), approximate=True)\n"
+        "print(sorted((k, [m['goal']['id'] for m in v]) for k, v in result.items()))\n"
+    )
+    root = Path(__file__).resolve().parents[2]
+    outputs = {
+        subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=root,
+            env={**os.environ, "PYTHONHASHSEED": seed},
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        for seed in ("1", "2")
+    }
+    assert len(outputs) == 1
+
+
+def test_mask_sweep_matches_frozenset_fallback_up_to_vocab_limit(monkeypatch):
+    # Pad the corpus to exactly MASK_MAX_VOCAB distinct words, the largest vocabulary the mask path
+    # takes; a smaller limit keeps the test quick while masks still span several machine words
+    monkeypatch.setattr(similarity, "MASK_MAX_VOCAB", 200)
+    goals = _goals(seed=3)
+    pad = similarity.MASK_MAX_VOCAB - len(WORDS)
+    goals += [
+        {"id": f"pad{k}", "title": f"p{2 * k} w0", "description": f"p{2 * k + 1}" if 2 * k + 1 < pad else ""}
+        for k in range((pad + 1) // 2)
+    ]
+    tokenized = [(goal, similarity._tokenize(goal)) for goal in goals]
+    calls = []
+    mask_sweep = similarity._mask_sweep
+    monkeypatch.setattr(similarity, "_mask_sweep", lambda *args: calls.append(args) or mask_sweep(*args))
+
+    masked = find_similar_goals_batch(goals)
+    fallback = {goal["id"]: similarity._rank_similar(goal, words, tokenized) for goal, words in tokenized}
+
+    assert len(calls[0][1]) == similarity.MASK_MAX_VOCAB
+    assert _ranked_ids(masked) == _ranked_ids(fallback)
@@ -0,0 +1,30 @@
+import numpy as np
+
+from lorekeeper.influence.weight_model import (
+    calculate_person_influence_score,
+    calculate_person_influence_score_batch,
+)
+
+
+def test_batch_scores_match_scalar_path_including_nan_rows():
+    nan = float("nan")
+    rows = [
+        (0.5, 0.2, 0.1, 0.4, 1.0),
+        (1.0, 1.0, 0.0, 1.0, 1.0),
+        (-1.0, -1.0, 1.0, 0.0, 1.0),
+        (0.3, -0.2, 0.0, 0.0, 0.5),
+        (nan, 0.2, 0.1, 0.4, 1.0),
+        (0.5, 0.2, 0.1, 0.4, nan),
+    ]
+    emotional, behavioral, toxicity, uplift, weight = (np.array(column) for column in zip(*rows))
+
+    batch = calculate_person_influence_score_batch(emotional, behavioral, toxicity, uplift, weight)
+    scalar = [calculate_person_influence_score(*row) for row in rows]
+
+    np.testing.assert_allclose(batch, scalar)
+    assert batch[-1] == batch[-2] == 1.0
+
+
+def test_batch_accepts_scalar_weight():
+    batch = calculate_person_influence_score_batch(np.array([2.0, -2.0]), np.zeros(2), np.zeros(2), np.zeros(2), 0.5)
+    np.testing.assert_allclose(batch, [0.4, -0.4])
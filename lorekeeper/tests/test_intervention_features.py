@@ -0,0 +1,21 @@
+import numpy as np
+
+from lorekeeper.intervention.analytics import analyze
+from lorekeeper.intervention.features import build_features
+
+
+def test_label_sentiments_are_treated_as_missing():
+    events = [
+        {"id": "e1", "content": "Good day", "sentiment": "positive"},
+        {"id": "e2", "content": "Okay day", "metadata": {"sentiment": "neutral"}},
+        {"id": "e3", "content": "Rough day", "sentiment": "negative"},
+        {"id": "e4", "content": "Calm", "sentiment": 0.2},
+        {"id": "e5", "content": "Unknown", "sentiment": None},
+    ]
+
+    features = build_features(events)
+
+    assert np.isnan(features.recent_sentiments[:3]).all()
+    assert features.recent_sentiments[3] == 0.2
+    assert np.isnan(features.recent_sentiments[4])
+    assert analyze(events) == {"interventions": []}
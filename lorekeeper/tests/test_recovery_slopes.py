@@ -0,0 +1,27 @@
+import numpy as np
+
+from lorekeeper.resilience.slope_estimator import estimate_recovery_slope, estimate_recovery_slopes
+
+
+def test_batched_slopes_match_single_series():
+    series = [
+        [("2024-01-01", 0.1), ("2024-01-03", 0.4), ("2024-01-06", 0.8)],
+        [("2024-02-01", 0.9), ("2024-02-02", 0.2)],
+        [("2024-03-01", 0.5)],
+        [("2024-04-01", 0.3), ("2024-04-01", 0.6), ("2024-04-01", 0.1)],
+    ]
+    width = max(len(points) for points in series)
+    xs = np.zeros((len(series), width))
+    ys = np.zeros((len(series), width))
+    for row, points in enumerate(series):
+        start = np.datetime64(points[0][0])
+        for col, (day, improvement) in enumerate(points):
+            xs[row, col] = (np.datetime64(day) - start).astype(int)
+            ys[row, col] = improvement
+
+    batched = estimate_recovery_slopes(xs, ys, [len(points) for points in series])
+
+    for row, points in enumerate(series):
+        single = estimate_recovery_slope([{"timestamp": day, "improvement": value} for day, value in points])
+        for key, value in single.items():
+            assert np.isclose(batched[key][row], value)
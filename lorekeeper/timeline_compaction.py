@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import json
+from dataclasses import asdict
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -15,7 +16,7 @@ def compact_year(manager: TimelineManager, year: int) -> Path:
     ordered = sorted(events, key=lambda e: (e.date, e.id))
     compact_path = manager.base_path / f"{year}.compact.json"
     compact_path.write_text(
-        json.dumps([event.__dict__ for event in ordered], indent=2, ensure_ascii=False),
+        json.dumps([asdict(event) for event in ordered], indent=2, ensure_ascii=False),
         encoding="utf-8",
     )
     return compact_path
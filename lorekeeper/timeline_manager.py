@@ -12,8 +12,8 @@ from __future__ import annotations
 
 import json
 import hashlib
+import textwrap
 from bisect import bisect_left, bisect_right
-from dataclasses import asdict
 from datetime import datetime, timedelta, date
 from functools import lru_cache
 from pathlib import Path
@@ -27,6 +27,13 @@ from .event_schema import TimelineEvent
 from .security import secure_load_json
 
 
+@lru_cache(maxsize=4096)
+def _event_year(event_date: str) -> int:
+    """Year of an ISO event date; invalid dates still raise ``ValueError`` before any write."""
+
+    return datetime.fromisoformat(event_date).year
+
+
 class TimelineManager:
     """Provides append-only, year-sharded timeline storage utilities."""
 
@@ -39,6 +46,8 @@ class TimelineManager:
         self.tag_index = TagDictionary()
         self.semantic_cache = SemanticCache(capacity=200)
         self._events_by_id: Dict[str, TimelineEvent] = {}
+        # Parsed year shards keyed by (mtime_ns, size); callers must not mutate them
+        self._shard_cache: Dict[int, tuple[tuple[int, int], List[dict]]] = {}
         self._refresh_indexes()
 
         # Primary storage and indexes
@@ -68,7 +77,12 @@ class TimelineManager:
 
     def _load_raw_year(self, year: int) -> List[dict]:
         path = self._year_file(year)
-        return secure_load_json(path, base_dir=self.base_path)
+        cached = self._shard_cache.get(year)
+        if cached is not None and path.exists() and cached[0] == self._shard_stamp(path):
+            return cached[1]
+        events = secure_load_json(path, base_dir=self.base_path)
+        self._shard_cache[year] = (self._shard_stamp(path), events)
+        return events
         """Load a specific year's shard, preferring compacted data when present."""
 
         compact_path = self._compact_file(year)
@@ -101,9 +115,44 @@ class TimelineManager:
                 event = TimelineEvent(**item)
                 self._index_event(event)
 
+    @staticmethod
+    def _shard_stamp(path: Path) -> tuple[int, int]:
+        stat = path.stat()
+        return stat.st_mtime_ns, stat.st_size
+
     def _save_year(self, year: int, events: Iterable[dict]) -> None:
         path = self._year_file(year)
-        path.write_text(json.dumps(list(events), indent=2, ensure_ascii=False), encoding="utf-8")
+        events = list(events)
+        # Stdlib writer: orjson would store NaN/Infinity as null
+        path.write_text(json.dumps(events, indent=2, ensure_ascii=False), encoding="utf-8")
+        self._shard_cache[year] = (self._shard_stamp(path), events)
+
+    def _append_year(self, year: int, items: List[dict]) -> None:
+        """Append events to a year shard without re-reading or re-serializing it.
+
+        New items are spliced in before the closing bracket, producing the same bytes
+        ``_save_year`` would write for the extended list; shards in any other layout
+        fall back to a full rewrite.
+        """
+
+        path = self._year_file(year)
+        self._shard_cache.pop(year, None)
+        body = ",\n".join(textwrap.indent(json.dumps(item, indent=2, ensure_ascii=False), "  ") for item in items)
+        if path.exists():
+            with path.open("r+b") as handle:
+                size = handle.seek(0, 2)
+                if size >= 2:
+                    handle.seek(size - 2)
+                    tail = handle.read(2)
+                    if tail == b"\n]":
+                        handle.seek(size - 2)
+                        handle.write(f",\n{body}\n]".encode("utf-8"))
+                        return
+                    if size == 2 and tail == b"[]":
+                        handle.seek(0)
+                        handle.write(f"[\n{body}\n]".encode("utf-8"))
+                        return
+        self._save_year(year, [*self._load_raw_year(year), *items])
 
     def _bootstrap_from_disk(self) -> None:
         """Load all shards and build in-memory indexes for near O(1) retrieval."""
@@ -130,7 +179,7 @@ class TimelineManager:
         self.sorted_dates.insert(position, event.date)
         self.sorted_event_ids.insert(position, event.id)
         # maintain year-specific sorted order
-        event_year = datetime.fromisoformat(event.date).year
+        event_year = _event_year(event.date)
         year_dates = self.year_dates[event_year]
         year_ids = self.year_index[event_year]
         year_pos = bisect_right(year_dates, event.date)
@@ -179,16 +228,46 @@ class TimelineManager:
         if existing_id:
             return self.events_by_id[existing_id]
 
-        event_year = datetime.fromisoformat(event.date).year
-        events = self._load_raw_year(event_year)
-        events.append(asdict(event))
-        self._save_year(event_year, events)
+        event_year = _event_year(event.date)
+        self._append_year(event_year, [event.to_dict()])
         self._index_event(event)
 
         self._index_event(event)
         self._invalidate_cache()
         return event
 
+    def add_events(self, events: Iterable[TimelineEvent]) -> List[TimelineEvent]:
+        """Append many events, writing to each touched year shard once.
+
+        Duplicates (by ingestion hash, including within the batch) resolve to the
+        already-stored event, as with ``add_event``.
+        """
+
+        stored: List[TimelineEvent] = []
+        new_by_hash: dict[str, TimelineEvent] = {}
+        new_by_year: dict[int, List[TimelineEvent]] = {}
+        for event in events:
+            ingestion_hash = self._compute_ingestion_hash(event)
+            existing_id = self.index_by_hash.get(ingestion_hash)
+            if existing_id:
+                stored.append(self.events_by_id[existing_id])
+                continue
+            if ingestion_hash in new_by_hash:
+                stored.append(new_by_hash[ingestion_hash])
+                continue
+            new_by_hash[ingestion_hash] = event
+            new_by_year.setdefault(_event_year(event.date), []).append(event)
+            stored.append(event)
+
+        for event_year, year_events in new_by_year.items():
+            self._append_year(event_year, [event.to_dict() for event in year_events])
+            for event in year_events:
+                self._index_event(event)
+
+        if new_by_year:
+            self._invalidate_cache()
+        return stored
+
     def get_events(
         self,
         year: Optional[int] = None,
@@ -199,18 +278,6 @@ class TimelineManager:
     ) -> List[TimelineEvent]:
         """Retrieve events filtered by year, date range, and tags."""
 
-        tags = tags or []
-        candidates: List[TimelineEvent]
-        if tags:
-            tag_sets = [self.tag_index.get(tag) for tag in tags]
-            if not tag_sets:
-                return []
-            matching_ids = set.intersection(*tag_sets) if len(tag_sets) > 1 else tag_sets[0]
-            candidates = [self._events_by_id[event_id] for event_id in matching_ids if event_id in self._events_by_id]
-        elif start_date or end_date:
-            candidates = self.date_index.range_query(start=start_date, end=end_date)
-        else:
-            candidates = list(self._events_by_id.values())
         tags = [tag.lower() for tag in (tags or [])]
         candidates: List[TimelineEvent] = []
 
@@ -228,16 +295,19 @@ class TimelineManager:
             allowed_ids = set.union(*tag_sets) if tag_sets else set()
         else:
             allowed_ids = None
+        # Built once per query rather than once per candidate
+        tag_filter = frozenset(tags)
+        year_prefix = str(year) if year is not None else None
 
         def in_range(event: TimelineEvent) -> bool:
             if not include_archived and event.archived:
                 return False
-            if year is not None and not str(getattr(event, "date", "")).startswith(str(year)):
-                return False
-            if tags and not set(tags).intersection(event.tags):
+            if year_prefix is not None and not str(getattr(event, "date", "")).startswith(year_prefix):
                 return False
             if allowed_ids is not None and event.id not in allowed_ids:
                 return False
+            if tag_filter and tag_filter.isdisjoint(event.tags):
+                return False
             if start_date and event.date < start_date:
                 return False
             if end_date and event.date > end_date:
@@ -316,7 +386,7 @@ class TimelineManager:
             for item in events:
                 if item["id"] == event_id:
                     if not item.get("archived", False):
-                        item["archived"] = True
+                        item = {**item, "archived": True}
                     archived_event = TimelineEvent(**item)
                 updated.append(item)
             if archived_event:
@@ -4,7 +4,7 @@ Maps belief associations and relationships
 """
 
 from typing import List, Dict, Any
-from collections import defaultdict
+from collections import Counter, defaultdict
 
 
 def build_belief_graph(beliefs: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -19,6 +19,10 @@ def build_belief_graph(beliefs: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     # Extract keywords from beliefs
     belief_keywords = defaultdict(list)
+    # Keyword pair (in first-seen order) -> number of its first keyword's belief
+    # entries that also carry the second, counted per belief instead of per pair
+    pair_shared = Counter()
+    keyword_order = {}
     
     for belief in beliefs:
         statement = belief.get('statement', '').lower()
@@ -27,26 +31,24 @@ def build_belief_graph(beliefs: List[Dict[str, Any]]) -> Dict[str, Any]:
         
         for keyword in keywords:
             belief_keywords[keyword].append(belief)
+            keyword_order.setdefault(keyword, len(keyword_order))
+        
+        counts = Counter(keywords)
+        distinct = sorted(counts, key=keyword_order.__getitem__)
+        for i, keyword1 in enumerate(distinct):
+            for keyword2 in distinct[i+1:]:
+                pair_shared[keyword1, keyword2] += counts[keyword1]
     
     # Build associations (beliefs that share keywords)
     associations = []
-    keywords_list = list(belief_keywords.keys())
-    
-    for i, keyword1 in enumerate(keywords_list):
-        for keyword2 in keywords_list[i+1:]:
-            beliefs1 = belief_keywords[keyword1]
-            beliefs2 = belief_keywords[keyword2]
-            
-            # Find shared beliefs
-            shared = [b for b in beliefs1 if b in beliefs2]
-            
-            if shared:
-                associations.append({
-                    "keyword1": keyword1,
-                    "keyword2": keyword2,
-                    "shared_beliefs": len(shared),
-                    "strength": len(shared) / max(len(beliefs1), len(beliefs2))
-                })
+    for keyword1, keyword2 in sorted(pair_shared, key=lambda pair: (keyword_order[pair[0]], keyword_order[pair[1]])):
+        shared = pair_shared[keyword1, keyword2]
+        associations.append({
+            "keyword1": keyword1,
+            "keyword2": keyword2,
+            "shared_beliefs": shared,
+            "strength": shared / max(len(belief_keywords[keyword1]), len(belief_keywords[keyword2]))
+        })
     
     return {
         "belief_keywords": dict(belief_keywords),
@@ -5,6 +5,7 @@ Groups value statements into themes using clustering
 
 from typing import List, Dict, Any
 from collections import defaultdict
+from heapq import nlargest
 
 
 def cluster_value_statements(signals: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -57,10 +58,10 @@ def detect_core_values(clusters: List[Dict[str, Any]], top_n: int = 5) -> List[s
     Returns:
         List of core value categories
     """
-    # Sort by total strength
-    sorted_clusters = sorted(clusters, key=lambda c: c.get('total_strength', 0), reverse=True)
+    # Top clusters by total strength; nlargest keeps only top_n on a heap instead of sorting all
+    top_clusters = nlargest(top_n, clusters, key=lambda c: c.get('total_strength', 0))
     
-    core_values = [c.get('category') for c in sorted_clusters[:top_n]]
+    core_values = [c.get('category') for c in top_clusters]
     
     return core_values
 
@@ -6,6 +6,18 @@ Detects shifts in beliefs and values over time
 from typing import List, Dict, Any
 from collections import defaultdict
 from datetime import datetime
+from operator import itemgetter
+
+_by_timestamp = itemgetter('timestamp')
+
+
+def _sort_by_timestamp(points: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Sort points by timestamp, treating a missing timestamp as ''"""
+    try:
+        # C-level key lookup; sorted() computes every key before ordering anything
+        return sorted(points, key=_by_timestamp)
+    except KeyError:
+        return sorted(points, key=lambda p: p.get('timestamp', ''))
 
 
 def detect_value_drift(value_timeline: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -37,15 +49,14 @@ def detect_value_drift(value_timeline: List[Dict[str, Any]]) -> Dict[str, Any]:
             continue
         
         # Sort by timestamp
-        sorted_points = sorted(points, key=lambda p: p.get('timestamp', ''))
+        sorted_points = _sort_by_timestamp(points)
         
-        # Compare first half vs second half
+        # Compare first half vs second half, reading each strength once
         midpoint = len(sorted_points) // 2
-        first_half = sorted_points[:midpoint]
-        second_half = sorted_points[midpoint:]
+        strengths = [p.get('strength', 0) for p in sorted_points]
         
-        avg_first = sum(p.get('strength', 0) for p in first_half) / len(first_half)
-        avg_second = sum(p.get('strength', 0) for p in second_half) / len(second_half)
+        avg_first = sum(strengths[:midpoint]) / midpoint
+        avg_second = sum(strengths[midpoint:]) / (len(strengths) - midpoint)
         
         diff = avg_second - avg_first
         
@@ -54,8 +65,8 @@ def detect_value_drift(value_timeline: List[Dict[str, Any]]) -> Dict[str, Any]:
                 "category": category,
                 "direction": "strengthening" if diff > 0 else "weakening",
                 "magnitude": abs(diff),
-                "period_start": first_half[0].get('timestamp'),
-                "period_end": second_half[-1].get('timestamp')
+                "period_start": sorted_points[0].get('timestamp'),
+                "period_end": sorted_points[-1].get('timestamp')
             })
     
     return {
@@ -81,18 +92,19 @@ def detect_belief_drift(belief_timeline: List[Dict[str, Any]]) -> Dict[str, Any]
         }
     
     # Sort by timestamp
-    sorted_points = sorted(belief_timeline, key=lambda p: p.get('timestamp', ''))
+    sorted_points = _sort_by_timestamp(belief_timeline)
     
-    # Compare first half vs second half
+    # Compare first half vs second half, reading each column once
     midpoint = len(sorted_points) // 2
-    first_half = sorted_points[:midpoint]
-    second_half = sorted_points[midpoint:]
+    second_len = len(sorted_points) - midpoint
+    polarities = [p.get('polarity', 0) for p in sorted_points]
+    confidences = [p.get('confidence', 0) for p in sorted_points]
     
-    avg_polarity_first = sum(p.get('polarity', 0) for p in first_half) / len(first_half)
-    avg_polarity_second = sum(p.get('polarity', 0) for p in second_half) / len(second_half)
+    avg_polarity_first = sum(polarities[:midpoint]) / midpoint
+    avg_polarity_second = sum(polarities[midpoint:]) / second_len
     
-    avg_confidence_first = sum(p.get('confidence', 0) for p in first_half) / len(first_half)
-    avg_confidence_second = sum(p.get('confidence', 0) for p in second_half) / len(second_half)
+    avg_confidence_first = sum(confidences[:midpoint]) / midpoint
+    avg_confidence_second = sum(confidences[midpoint:]) / second_len
     
     polarity_diff = avg_polarity_second - avg_polarity_first
     confidence_diff = avg_confidence_second - avg_confidence_first
@@ -104,8 +116,8 @@ def detect_belief_drift(belief_timeline: List[Dict[str, Any]]) -> Dict[str, Any]
             "type": "polarity",
             "direction": "more_positive" if polarity_diff > 0 else "more_negative",
             "magnitude": abs(polarity_diff),
-            "period_start": first_half[0].get('timestamp'),
-            "period_end": second_half[-1].get('timestamp')
+            "period_start": sorted_points[0].get('timestamp'),
+            "period_end": sorted_points[-1].get('timestamp')
         })
     
     if abs(confidence_diff) > 0.3:
@@ -113,8 +125,8 @@ def detect_belief_drift(belief_timeline: List[Dict[str, Any]]) -> Dict[str, Any]
             "type": "confidence",
             "direction": "more_confident" if confidence_diff > 0 else "less_confident",
             "magnitude": abs(confidence_diff),
-            "period_start": first_half[0].get('timestamp'),
-            "period_end": second_half[-1].get('timestamp')
+            "period_start": sorted_points[0].get('timestamp'),
+            "period_end": sorted_points[-1].get('timestamp')
         })
     
     return {